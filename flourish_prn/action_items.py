@@ -1,7 +1,7 @@
-from django.apps import apps as django_apps
-from django.core.exceptions import ObjectDoesNotExist
 from edc_action_item import Action, site_action_items, HIGH_PRIORITY
 
+from .metrics import ACTION_ITEM_PHASE, instrument
+
 CAREGIVEROFF_STUDY_ACTION = 'submit-caregiveroff-study'
 CHILDOFF_STUDY_ACTION = 'submit-childoff-study'
 CAREGIVER_DEATH_REPORT_ACTION = 'submit-caregiver-death-report'
@@ -11,9 +11,21 @@ TB_ADOL_STUDY_ACTION = 'submit-tb-adol-off-study'
 MISSED_BIRTH_VISIT_ACTION = 'submit-missed-birth-visit'
 
 
+class PrnAction(Action):
+    """ Records creating or updating the action item, including next
+        actions, as the action item phase of saving the reference model.
+
+    Next action checks are memoized per subject within the update.
+    """
+
+    def __init__(self, *args, **kwargs):
+        from .helper_classes import action_graph
+        with action_graph.scope(), instrument(
+                ACTION_ITEM_PHASE, self.reference_model):
+            super().__init__(*args, **kwargs)
 
 
-class CaregiverOffStudyAction(Action):
+class CaregiverOffStudyAction(PrnAction):
     name = CAREGIVEROFF_STUDY_ACTION
     display_name = 'Submit Caregiver Offstudy'
     reference_model = 'flourish_prn.caregiveroffstudy'
@@ -22,7 +34,7 @@ class CaregiverOffStudyAction(Action):
     priority = HIGH_PRIORITY
     singleton = True
 
-class MissedBirthVisitAction(Action):
+class MissedBirthVisitAction(PrnAction):
     name = MISSED_BIRTH_VISIT_ACTION
     display_name ='Submit Missed Birth Visit'
     reference_model ='flourish_prn.missedbirthvisit'
@@ -31,7 +43,7 @@ class MissedBirthVisitAction(Action):
     priority = HIGH_PRIORITY
     singleton = True
 
-class ChildOffStudyAction(Action):
+class ChildOffStudyAction(PrnAction):
     name = CHILDOFF_STUDY_ACTION
     display_name = 'Submit Child Offstudy'
     reference_model = 'flourish_prn.childoffstudy'
@@ -41,29 +53,17 @@ class ChildOffStudyAction(Action):
     singleton = True
 
     def get_next_actions(self):
-        actions = []
-        offstudy = None
-        child_deathreport_cls = django_apps.get_model(
-            'flourish_prn.childdeathreport')
+        from .helper_classes import action_graph
+        subject_identifier = self.reference_model_obj.subject_identifier
+        if (action_graph.has_reference(
+                'flourish_prn.childdeathreport', subject_identifier)
+                and not action_graph.has_action(
+                    subject_identifier, CHILD_DEATH_REPORT_ACTION)):
+            return [ChildOffStudyAction]
+        return []
 
-        action_item_cls = django_apps.get_model(
-            'edc_action_item.actionitem')
 
-        subject_identifier = self.reference_model_obj.subject_identifier
-        offstudy = action_item_cls.objects.filter(
-            subject_identifier=subject_identifier,
-            action_type__name=CHILD_DEATH_REPORT_ACTION)
-        try:
-            child_deathreport_cls.objects.get(
-                subject_identifier=subject_identifier)
-            if not offstudy:
-                actions = [ChildOffStudyAction]
-        except ObjectDoesNotExist:
-            pass
-        return actions
-
-
-class CaregiverDeathReportAction(Action):
+class CaregiverDeathReportAction(PrnAction):
     name = CAREGIVER_DEATH_REPORT_ACTION
     display_name = 'Submit Caregiver Death Report'
     reference_model = 'flourish_prn.caregiverdeathreport'
@@ -73,29 +73,18 @@ class CaregiverDeathReportAction(Action):
     singleton = True
 
     def get_next_actions(self):
-        actions = []
-        offstudy = None
-        caregiver_deathreport_cls = django_apps.get_model(
-            'flourish_prn.caregiverdeathreport')
+        from .helper_classes import action_graph
+        subject_identifier = self.reference_model_obj.subject_identifier
+        if (action_graph.has_reference(
+                'flourish_prn.caregiverdeathreport', subject_identifier,
+                reference_model_obj=self.reference_model_obj)
+                and not action_graph.has_action(
+                    subject_identifier, CAREGIVEROFF_STUDY_ACTION)):
+            return [CaregiverOffStudyAction]
+        return []
 
-        action_item_cls = django_apps.get_model(
-            'edc_action_item.actionitem')
 
-        subject_identifier = self.reference_model_obj.subject_identifier
-        offstudy = action_item_cls.objects.filter(
-            subject_identifier=subject_identifier,
-            action_type__name=CAREGIVEROFF_STUDY_ACTION)
-        try:
-            caregiver_deathreport_cls.objects.get(
-                subject_identifier=subject_identifier)
-            if not offstudy:
-                actions = [CaregiverOffStudyAction]
-        except ObjectDoesNotExist:
-            pass
-        return actions
-
-
-class ChildDeathReportAction(Action):
+class ChildDeathReportAction(PrnAction):
     name = CHILD_DEATH_REPORT_ACTION
     display_name = 'Submit Child Death Report'
     reference_model = 'flourish_prn.childdeathreport'
@@ -105,7 +94,7 @@ class ChildDeathReportAction(Action):
     singleton = True
 
 
-class TbAdoscentReferralAction(Action):
+class TbAdoscentReferralAction(PrnAction):
     name = ADOLESCENT_REFERRAL_ACTION
     display_name = 'Submit TB Referral'
     reference_model = 'flourish_prn.tbreferaladol'
@@ -115,7 +104,7 @@ class TbAdoscentReferralAction(Action):
     singleton = True
 
 
-class TbAdolOffStudyAction(Action):
+class TbAdolOffStudyAction(PrnAction):
     name = TB_ADOL_STUDY_ACTION
     display_name = 'Submit Tb Adol Offstudy'
     reference_model = 'flourish_prn.tbadoloffstudy'
@@ -5,3 +5,5 @@ from .child_death_report_admin import ChildDeathReportAdmin
 from .child_off_study_admin import ChildOffStudyAdmin
 from .tb_adol_off_study_admin import TBAdolOffStudyAdmin
 from .missed_birth_visit_admin import MissedBirthVisitAdmin
+from .export_job_admin import ExportJobAdmin
+from .offstudy_task_admin import OffStudyTaskAdmin
@@ -0,0 +1,58 @@
+from django.contrib import messages
+from django.shortcuts import redirect
+from django.template.response import TemplateResponse
+from django.urls import path
+
+from ..forms import BulkOffStudyForm
+from ..helper_classes import BulkOffStudy
+
+
+class BulkOffStudyAdminMixin:
+
+    """ Adds a view, linked from the changelist, that takes a list of
+        subjects off study in one transaction.
+    """
+
+    change_list_template = 'flourish_prn/admin/offstudy_change_list.html'
+
+    bulk_offstudy_template = 'flourish_prn/admin/bulk_offstudy.html'
+
+    def get_urls(self):
+        info = self.model._meta.app_label, self.model._meta.model_name
+        urls = [
+            path('bulk-offstudy/',
+                 self.admin_site.admin_view(self.bulk_offstudy_view),
+                 name='%s_%s_bulk_offstudy' % info),
+        ]
+        return urls + super().get_urls()
+
+    def bulk_offstudy_view(self, request):
+        info = self.model._meta.app_label, self.model._meta.model_name
+        changelist_url = f'{self.admin_site.name}:%s_%s_changelist' % info
+        if not self.has_add_permission(request):
+            return redirect(changelist_url)
+
+        form = BulkOffStudyForm(request.POST or None, model_cls=self.model)
+        if request.method == 'POST' and form.is_valid():
+            bulk_offstudy = BulkOffStudy(
+                self.model,
+                subject_identifiers=form.cleaned_data.get('subject_identifiers'),
+                reason=form.cleaned_data.get('reason'),
+                reason_other=form.cleaned_data.get('reason_other'),
+                offstudy_date=form.cleaned_data.get('offstudy_date'),
+                comment=form.cleaned_data.get('comment'))
+            created = bulk_offstudy.run()
+            self.message_user(
+                request, f'{len(created)} subject(s) taken off study.')
+            for subject_identifier, reason in bulk_offstudy.skipped.items():
+                self.message_user(
+                    request, f'{subject_identifier} skipped. {reason}',
+                    level=messages.WARNING)
+            return redirect(changelist_url)
+
+        context = dict(
+            self.admin_site.each_context(request),
+            opts=self.model._meta,
+            form=form,
+            title=f'Bulk {self.model._meta.verbose_name}')
+        return TemplateResponse(request, self.bulk_offstudy_template, context)
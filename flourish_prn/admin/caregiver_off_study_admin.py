@@ -14,6 +14,7 @@ from edc_subject_dashboard import ModelAdminSubjectDashboardMixin
 from ..admin_site import flourish_prn_admin
 from ..forms import CaregiverOffStudyForm
 from ..models import CaregiverOffStudy
+from .bulk_offstudy_admin_mixin import BulkOffStudyAdminMixin
 from .exportaction_mixin import ExportActionMixin
 
 
@@ -40,7 +41,7 @@ class ModelAdminMixin(ModelAdminNextUrlRedirectMixin,
 
 
 @admin.register(CaregiverOffStudy, site=flourish_prn_admin)
-class CaregiverOffStudyAdmin(ModelAdminMixin, admin.ModelAdmin):
+class CaregiverOffStudyAdmin(BulkOffStudyAdminMixin, ModelAdminMixin, admin.ModelAdmin):
 
     form = CaregiverOffStudyForm
 
@@ -14,6 +14,7 @@ from edc_subject_dashboard import ModelAdminSubjectDashboardMixin
 from ..admin_site import flourish_prn_admin
 from ..forms import ChildOffStudyForm
 from ..models import ChildOffStudy
+from .bulk_offstudy_admin_mixin import BulkOffStudyAdminMixin
 from .exportaction_mixin import ExportActionMixin
 
 
@@ -40,7 +41,7 @@ class ModelAdminMixin(ModelAdminNextUrlRedirectMixin,
 
 
 @admin.register(ChildOffStudy, site=flourish_prn_admin)
-class ChildOffStudyAdmin(ModelAdminMixin, admin.ModelAdmin):
+class ChildOffStudyAdmin(BulkOffStudyAdminMixin, ModelAdminMixin, admin.ModelAdmin):
 
     form = ChildOffStudyForm
 
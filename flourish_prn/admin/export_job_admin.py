@@ -0,0 +1,63 @@
+from django.contrib import admin
+from django.http import FileResponse, Http404
+from django.shortcuts import get_object_or_404
+from django.urls import path, reverse
+from django.utils.html import format_html
+
+from ..admin_site import flourish_prn_admin
+from ..exports import requeue_stale_export_jobs
+from ..models import ExportJob
+
+
+@admin.register(ExportJob, site=flourish_prn_admin)
+class ExportJobAdmin(admin.ModelAdmin):
+
+    list_display = ('model', 'export_format', 'status', 'rows_written',
+                    'created', 'elapsed', 'download')
+
+    list_filter = ('status', 'export_format', 'model')
+
+    readonly_fields = ('model', 'export_format', 'status', 'rows_written',
+                       'started_datetime', 'heartbeat_datetime',
+                       'completed_datetime', 'error',
+                       'user_created', 'download')
+
+    fields = readonly_fields
+
+    actions = ['requeue_stale']
+
+    def requeue_stale(self, request, queryset):
+        requeued = requeue_stale_export_jobs()
+        self.message_user(
+            request, f'{requeued} stale export job(s) queued again.')
+
+    requeue_stale.short_description = 'Queue stale running export jobs again'
+
+    def has_add_permission(self, request):
+        return False
+
+    def get_urls(self):
+        urls = [
+            path('<path:object_id>/download/',
+                 self.admin_site.admin_view(self.download_view),
+                 name='flourish_prn_exportjob_download'),
+        ]
+        return urls + super().get_urls()
+
+    def download(self, obj):
+        if obj.is_complete and obj.export_file:
+            url = reverse(f'{self.admin_site.name}:flourish_prn_exportjob_download',
+                          args=(obj.pk, ))
+            return format_html('<a href="{}">Download</a>', url)
+        return None
+
+    download.short_description = 'File'
+
+    def download_view(self, request, object_id):
+        export_job = get_object_or_404(ExportJob, pk=object_id)
+        if not (self.has_view_permission(request, export_job)
+                and export_job.is_complete and export_job.export_file):
+            raise Http404
+        return FileResponse(
+            export_job.export_file.open('rb'), as_attachment=True,
+            filename=export_job.export_file.name.split('/')[-1])
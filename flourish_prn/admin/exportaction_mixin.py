@@ -1,11 +1,14 @@
 import datetime
-import uuid
 
-from django.http import HttpResponse
-from django.utils import timezone
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
 from django.utils.translation import ugettext_lazy as _
-import xlwt
-from django.apps import apps as django_apps
+from django.contrib import messages
+
+from ..constants import CSV, XLSX
+from ..exports import (
+    CsvExportWriter, DeltaExport, DobResolver, ModelExporter,
+    ParquetExportWriter, PrnArchiveExport, XlsExportWriter, XlsxExportWriter, queue_export)
+
 
 class ExportActionMixin:
 
@@ -15,68 +18,131 @@ class ExportActionMixin:
         response['Content-Disposition'] = 'attachment; filename=%s.xls' % (
             self.get_export_filename())
 
-        wb = xlwt.Workbook(encoding='utf-8', style_compression=2)
-        ws = wb.add_sheet('%s')
-
-        row_num = 0
-
-        font_style = xlwt.XFStyle()
-        font_style.font.bold = True
-        font_style.num_format_str = 'YYYY/MM/DD h:mm:ss'
-
-        field_names = queryset[0].__dict__
-        field_names = [a for a in field_names.keys()]
-        field_names.remove('_state')
-        field_names.append('dob')
-
-
-        for col_num in range(len(field_names)):
-            ws.write(row_num, col_num, field_names[col_num], font_style)
-
-        for obj in queryset:
-            obj_data = obj.__dict__
-            
-            dob = self.dob_obj(obj_data['subject_identifier'])
-            
-            if dob:
-                obj_data['dob'] = self.dob_obj(obj_data['subject_identifier']).strftime('%Y/%m/%d')
-            else:
-                obj_data['dob'] = 'N/A'
-            
-            data = [obj_data[field] for field in field_names]
-
-            row_num += 1
-            for col_num in range(len(data)):
-                
-                if isinstance(data[col_num], uuid.UUID):
-                    ws.write(row_num, col_num, str(data[col_num]))
-                elif isinstance(data[col_num], datetime.datetime):
-                    data[col_num] = timezone.make_naive(data[col_num])
-                    ws.write(row_num, col_num, data[col_num], xlwt.easyxf(num_format_str='YYYY/MM/DD h:mm:ss'))
-                else:
-                    ws.write(row_num, col_num, data[col_num])
-        wb.save(response)
+        exporter = ModelExporter(
+            queryset, dob_getter=DobResolver(queryset).get)
+        XlsExportWriter().write(
+            exporter.field_names, exporter.rows(),
+            sheet_name=self.model._meta.verbose_name, export_file=response)
         return response
 
     export_as_csv.short_description = _(
         'Export selected %(verbose_name_plural)s')
 
-    actions = [export_as_csv]
-    
-    def dob_obj(self, subject_identifier: str):
-        consent_cls = django_apps.get_model('flourish_caregiver.subjectconsent')
-        child_consent_cls = django_apps.get_model('flourish_caregiver.caregiverchildconsent')
-         
-        try:
-            consent = consent_cls.objects.filter(
-                subject_identifier=subject_identifier).latest('consent_datetime')
-        except consent_cls.DoesNotExist:
-            consent = child_consent_cls.objects.filter(
-                subject_identifier=subject_identifier).latest('consent_datetime')
-            return consent.child_dob
-        else:
-            return consent.dob
+    def export_as_csv_stream(self, request, queryset):
+        writer = CsvExportWriter()
+        exporter = ModelExporter(
+            queryset, dob_getter=DobResolver(queryset).get)
+        response = StreamingHttpResponse(
+            writer.stream(exporter.field_names, exporter.rows()),
+            content_type=writer.content_type)
+        response['Content-Disposition'] = 'attachment; filename=%s.%s' % (
+            self.get_export_filename(), writer.extension)
+        return response
+
+    export_as_csv_stream.short_description = _(
+        'Export selected %(verbose_name_plural)s (streamed csv)')
+
+    def export_as_xlsx(self, request, queryset):
+        """ Returns the selected rows as an xlsx workbook.
+
+        The workbook is written in constant memory mode to a temporary
+        file and only sent once complete, so memory stays flat but the
+        download starts after the last row is written.
+        """
+        writer = XlsxExportWriter()
+        exporter = ModelExporter(
+            queryset, dob_getter=DobResolver(queryset).get)
+        export_file = writer.export(
+            exporter, sheet_name=self.model._meta.verbose_name)
+        return FileResponse(
+            export_file, as_attachment=True,
+            filename='%s.%s' % (self.get_export_filename(), writer.extension),
+            content_type=writer.content_type)
+
+    export_as_xlsx.short_description = _(
+        'Export selected %(verbose_name_plural)s (xlsx)')
+
+    def export_as_parquet(self, request, queryset):
+        writer = ParquetExportWriter()
+        if not writer.available():
+            self.message_user(
+                request, 'Parquet exports require pyarrow to be installed.',
+                level=messages.ERROR)
+            return None
+        exporter = ModelExporter(
+            queryset, dob_getter=DobResolver(queryset).get)
+        return FileResponse(
+            writer.export(exporter), as_attachment=True,
+            filename='%s.%s' % (self.get_export_filename(), writer.extension),
+            content_type=writer.content_type)
+
+    export_as_parquet.short_description = _(
+        'Export selected %(verbose_name_plural)s (parquet)')
+
+    def export_changes_as_csv(self, request, queryset):
+        """ Exports every row changed since this user last exported
+            changes of the model, whatever rows are selected.
 
+        The watermark is kept per model, so a partial selection would
+        move it past changed rows that were not selected.
+        """
+        writer = CsvExportWriter()
+        delta_export = DeltaExport(
+            self.model.objects.all(), consumer=request.user.username)
+        changed = delta_export.changed()
+        exporter = ModelExporter(
+            changed, dob_getter=DobResolver(changed).get)
+        export_file = writer.export(exporter)
+        delta_export.commit()
+        return FileResponse(
+            export_file, as_attachment=True,
+            filename='%s-changes.%s' % (
+                self.get_export_filename(), writer.extension),
+            content_type=writer.content_type)
+
+    export_changes_as_csv.short_description = _(
+        'Export all %(verbose_name_plural)s changed since my last export')
+
+    def export_prn_archive(self, request, queryset):
+        """ Exports every PRN model for the subjects of the selected rows
+            as a zip archive.
+        """
+        archive_file = PrnArchiveExport(
+            subject_identifiers=queryset).write()
+        date_str = datetime.datetime.now().strftime('%Y-%m-%d')
+        return FileResponse(
+            archive_file, as_attachment=True,
+            filename=f'flourish-prn-{date_str}.zip',
+            content_type='application/zip')
+
+    export_prn_archive.short_description = _(
+        'Export all PRN forms of the selected subjects')
+
+    def queue_csv_export(self, request, queryset):
+        self.queue_export(request, queryset, CSV)
+
+    queue_csv_export.short_description = _(
+        'Queue background csv export of selected %(verbose_name_plural)s')
+
+    def queue_xlsx_export(self, request, queryset):
+        self.queue_export(request, queryset, XLSX)
+
+    queue_xlsx_export.short_description = _(
+        'Queue background xlsx export of selected %(verbose_name_plural)s')
+
+    def queue_export(self, request, queryset, export_format):
+        export_job = queue_export(
+            queryset, export_format=export_format,
+            username=request.user.username)
+        self.message_user(
+            request,
+            f'Export of {queryset.model._meta.verbose_name_plural} queued. '
+            f'Download it from Export Jobs once complete ({export_job.pk}).')
+
+    actions = [export_as_csv, export_as_csv_stream, export_as_xlsx,
+               export_as_parquet, export_changes_as_csv, export_prn_archive,
+               queue_csv_export, queue_xlsx_export]
+    
     def get_export_filename(self):
         date_str = datetime.datetime.now().strftime('%Y-%m-%d')
         filename = "%s-%s" % (self.model.__name__, date_str)
@@ -0,0 +1,24 @@
+from django.contrib import admin
+
+from ..admin_site import flourish_prn_admin
+from ..models import OffStudyTask
+
+
+@admin.register(OffStudyTask, site=flourish_prn_admin)
+class OffStudyTaskAdmin(admin.ModelAdmin):
+
+    search_fields = ('subject_identifier',)
+
+    list_display = ('subject_identifier', 'model', 'task', 'status',
+                    'attempts', 'next_attempt_datetime', 'created')
+
+    list_filter = ('status', 'task', 'model')
+
+    readonly_fields = ('subject_identifier', 'model', 'task', 'status',
+                       'attempts', 'next_attempt_datetime', 'claimed_datetime',
+                       'last_error')
+
+    fields = readonly_fields
+
+    def has_add_permission(self, request):
+        return False
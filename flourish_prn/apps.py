@@ -10,6 +10,11 @@ class AppConfig(DjangoAppConfig):
     verbose_name = 'Flourish PRN'
     admin_site_name = 'flourish_prn_admin'
 
+    def ready(self):
+        from .helper_classes import holiday_calendar, schedule_index
+        schedule_index.build()
+        holiday_calendar.load()
+
 
 if settings.APP_NAME == 'flourish_prn':
     from edc_appointment.apps import AppConfig as BaseEdcAppointmentAppConfig
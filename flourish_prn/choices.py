@@ -1,4 +1,7 @@
-from edc_constants.constants import OTHER
+from edc_constants.constants import COMPLETE, OTHER
+
+from .constants import CSV, FAILED, QUEUED, RUNNING, XLSX
+from .constants import REMOVE_FU_NOTES, REMOVE_TB_SCHEDULES, TAKE_OFF_SCHEDULE
 
 CAUSE_OF_DEATH_CAT = (
     ('hiv_related', 'HIV infection or HIV related diagnosis'),
@@ -87,6 +90,11 @@ CHILD_OFF_STUDY_REASON = (
     (OTHER, ' Other'),
 )
 
+EXPORT_FORMAT = (
+    (CSV, 'CSV'),
+    (XLSX, 'Excel (xlsx)'),
+)
+
 HOSPITILIZATION_REASONS = (
     ('respiratory illness(unspecified)', 'Respiratory Illness(unspecified)'),
     ('respiratory illness, cxr confirmed',
@@ -109,6 +117,13 @@ HOSPITILIZATION_REASONS = (
     (OTHER, 'Other infection, specify'),
 )
 
+JOB_STATUS = (
+    (QUEUED, 'Queued'),
+    (RUNNING, 'Running'),
+    (COMPLETE, 'Complete'),
+    (FAILED, 'Failed'),
+)
+
 MED_RESPONSIBILITY = (
     ('doctor', 'Doctor'),
     ('nurse', 'Nurse'),
@@ -121,6 +136,12 @@ OFFSTUDY_POINT = (
     ('post_del', 'Post Delivery'),
 )
 
+OFFSTUDY_TASK = (
+    (TAKE_OFF_SCHEDULE, 'Take off schedule'),
+    (REMOVE_FU_NOTES, 'Remove follow up schedule notes'),
+    (REMOVE_TB_SCHEDULES, 'Remove TB adolescent schedules'),
+)
+
 RELATIONSHIP_CHOICES = (
     ('not_related', 'Not related'),
     ('probably_not_related', 'Probably not related'),
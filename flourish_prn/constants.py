@@ -1 +1,23 @@
 MIN_AGE_OF_CONSENT = 18
+
+CSV = 'csv'
+PARQUET = 'parquet'
+XLSX = 'xlsx'
+
+QUEUED = 'queued'
+RUNNING = 'running'
+FAILED = 'failed'
+
+PRN_MODELS = [
+    'flourish_prn.caregiveroffstudy',
+    'flourish_prn.childoffstudy',
+    'flourish_prn.tbadoloffstudy',
+    'flourish_prn.caregiverdeathreport',
+    'flourish_prn.childdeathreport',
+    'flourish_prn.missedbirthvisit',
+    'flourish_prn.tbreferaladol',
+]
+
+TAKE_OFF_SCHEDULE = 'take_off_schedule'
+REMOVE_FU_NOTES = 'remove_fu_notes'
+REMOVE_TB_SCHEDULES = 'remove_tb_schedules'
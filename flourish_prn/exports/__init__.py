@@ -0,0 +1,10 @@
+from .column_plan import ColumnPlan
+from .delta import DeltaExport
+from .dob_resolver import DobResolver
+from .exporter import ModelExporter
+from .jobs import (
+    ExportJobRunner, queue_export, requeue_stale_export_jobs, run_export_job)
+from .prn_archive import PrnArchiveExport
+from .writers import (
+    CsvExportWriter, ParquetExportWriter, XlsExportWriter, XlsxExportWriter,
+    export_value)
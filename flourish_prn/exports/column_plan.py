@@ -0,0 +1,60 @@
+from django.db import models
+from django.utils import timezone
+
+
+def naive_datetime(value):
+    if value is not None and timezone.is_aware(value):
+        return timezone.make_naive(value)
+    return value
+
+
+def to_string(value):
+    return None if value is None else str(value)
+
+
+class ColumnPlan:
+    """ The columns of a model export, worked out once from
+        `_meta.concrete_fields` together with a converter per column.
+
+    Rows are read with `values_list` so that model instances are never
+    built for an export. Decimals are kept as `Decimal`, every writer
+    handles them without losing precision.
+    """
+
+    converters = (
+        (models.UUIDField, to_string),
+        (models.DateTimeField, naive_datetime),
+    )
+
+    def __init__(self, model_cls, exclude=None):
+        exclude = exclude or []
+        self.fields = [field for field in model_cls._meta.concrete_fields
+                       if field.attname not in exclude]
+        self.columns = [field.attname for field in self.fields]
+        self.column_converters = [
+            (index, converter)
+            for index, converter in enumerate(map(
+                self.get_converter, self.fields))
+            if converter]
+
+    def get_converter(self, field):
+        for field_cls, converter in self.converters:
+            if isinstance(field, field_cls):
+                return converter
+        return None
+
+    def index(self, column):
+        try:
+            return self.columns.index(column)
+        except ValueError:
+            return None
+
+    def values(self, queryset, chunk_size):
+        return queryset.values_list(*self.columns).iterator(
+            chunk_size=chunk_size)
+
+    def convert(self, values):
+        row = list(values)
+        for index, converter in self.column_converters:
+            row[index] = converter(row[index])
+        return row
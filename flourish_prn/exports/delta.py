@@ -0,0 +1,91 @@
+import json
+
+from django.apps import apps as django_apps
+from django.db import transaction
+from django.db.models import Max, Q
+
+
+class DeltaExport:
+    """ Limits a model export to rows created or changed since the last
+        export to `consumer`, and moves the consumer's watermark forward
+        once the export has been written.
+
+    Historical models are tracked on `history_date`, every other model
+    on `modified`. The watermark keeps the pks exported at its value, so
+    a row committed later with the same value is exported next time.
+    """
+
+    watermark_model = 'flourish_prn.exportwatermark'
+
+    def __init__(self, queryset, consumer):
+        self.queryset = queryset
+        self.consumer = consumer
+        self.model = queryset.model._meta.label_lower
+        self.field = ('history_date'
+                      if hasattr(queryset.model, 'history_type') else 'modified')
+        self.high_watermark = None
+        self.high_watermark_pks = []
+
+    @classmethod
+    def history_queryset(cls, model_cls):
+        """ Returns the historical records queryset of `model_cls`, or
+            None if the model is not tracked with HistoricalRecords.
+        """
+        history = getattr(model_cls, 'history', None)
+        return history.model.objects.all() if history is not None else None
+
+    @property
+    def watermark_model_cls(self):
+        return django_apps.get_model(self.watermark_model)
+
+    @property
+    def last_exported(self):
+        """ Returns the watermark value and the pks exported at it.
+        """
+        try:
+            watermark = self.watermark_model_cls.objects.get(
+                model=self.model, consumer=self.consumer)
+        except self.watermark_model_cls.DoesNotExist:
+            return None, []
+        return (watermark.last_exported,
+                json.loads(watermark.last_exported_pks or '[]'))
+
+    def changed(self):
+        """ Returns the rows changed since the last export, bounded by the
+            latest value present now so rows saved during the export are
+            left for the next run.
+        """
+        queryset = self.queryset
+        last_exported, last_exported_pks = self.last_exported
+        if last_exported:
+            queryset = queryset.filter(
+                **{f'{self.field}__gte': last_exported}).exclude(
+                    **{self.field: last_exported,
+                       'pk__in': last_exported_pks})
+        self.high_watermark = queryset.aggregate(
+            high_watermark=Max(self.field)).get('high_watermark')
+        if self.high_watermark is None:
+            self.high_watermark_pks = []
+            return queryset.none()
+        self.high_watermark_pks = [
+            str(pk) for pk in queryset.filter(
+                **{self.field: self.high_watermark}).values_list(
+                    'pk', flat=True)]
+        return queryset.filter(
+            Q(**{f'{self.field}__lt': self.high_watermark})
+            | Q(pk__in=self.high_watermark_pks)).order_by(self.field, 'pk')
+
+    @transaction.atomic
+    def commit(self):
+        """ Records the high watermark of the last call to `changed`.
+        """
+        if self.high_watermark is None:
+            return
+        last_exported, last_exported_pks = self.last_exported
+        pks = self.high_watermark_pks
+        if last_exported == self.high_watermark:
+            pks = sorted(set(last_exported_pks) | set(pks))
+        self.watermark_model_cls.objects.update_or_create(
+            model=self.model, consumer=self.consumer,
+            defaults={'last_exported': self.high_watermark,
+                      'last_exported_pks': json.dumps(pks)})
@@ -0,0 +1,57 @@
+from django.apps import apps as django_apps
+from django.db.models import QuerySet
+
+
+class DobResolver:
+    """ Resolves the date of birth of many subjects at once.
+
+    Caregiver DOBs come from the latest `subjectconsent`, falling back to
+    the latest `caregiverchildconsent` for child subject identifiers. One
+    query is run per consent model, regardless of the number of subjects.
+    """
+
+    consent_model = 'flourish_caregiver.subjectconsent'
+    child_consent_model = 'flourish_caregiver.caregiverchildconsent'
+
+    def __init__(self, subject_identifiers=None):
+        if isinstance(subject_identifiers, QuerySet):
+            subject_identifiers = subject_identifiers.order_by().values(
+                'subject_identifier')
+        elif subject_identifiers is not None:
+            subject_identifiers = set(subject_identifiers)
+        self.subject_identifiers = subject_identifiers
+        self._dobs = None
+
+    @property
+    def consent_model_cls(self):
+        return django_apps.get_model(self.consent_model)
+
+    @property
+    def child_consent_model_cls(self):
+        return django_apps.get_model(self.child_consent_model)
+
+    @property
+    def dobs(self):
+        """ Returns a dict of subject identifier to date of birth.
+        """
+        if self._dobs is None:
+            self._dobs = self.latest_values(
+                self.child_consent_model_cls, 'child_dob')
+            self._dobs.update(
+                self.latest_values(self.consent_model_cls, 'dob'))
+        return self._dobs
+
+    def latest_values(self, model_cls, field):
+        """ Returns the `field` value of the latest consent per subject,
+            later consents in the ordering overwrite earlier ones.
+        """
+        queryset = model_cls.objects.all()
+        if self.subject_identifiers is not None:
+            queryset = queryset.filter(
+                subject_identifier__in=self.subject_identifiers)
+        values = queryset.order_by('consent_datetime').values_list(
+            'subject_identifier', field)
+        return dict(values.iterator())
+
+    def get(self, subject_identifier):
+        return self.dobs.get(subject_identifier)
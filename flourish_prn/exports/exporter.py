@@ -0,0 +1,43 @@
+from .column_plan import ColumnPlan
+
+
+class ModelExporter:
+    """ Produces the header and rows of a queryset export without
+        building model instances or holding the rows in memory.
+    """
+
+    chunk_size = 2000
+
+    column_plan_cls = ColumnPlan
+
+    def __init__(self, queryset, dob_getter=None, chunk_size=None):
+        self.queryset = queryset
+        self.dob_getter = dob_getter
+        self.chunk_size = chunk_size or self.chunk_size
+        self.column_plan = self.column_plan_cls(queryset.model)
+
+    @property
+    def field_names(self):
+        return self.column_plan.columns + ['dob']
+
+    def dob(self, subject_identifier):
+        dob = self.dob_getter(subject_identifier) if self.dob_getter else None
+        return dob.strftime('%Y/%m/%d') if dob else 'N/A'
+
+    def rows(self, typed=False):
+        """ Yields the export rows. With `typed`, values are kept as read
+            from the database and the date of birth as a date, for
+            writers that keep column types.
+        """
+        subject_index = self.column_plan.index('subject_identifier')
+        for values in self.column_plan.values(self.queryset, self.chunk_size):
+            subject_identifier = (
+                None if subject_index is None else values[subject_index])
+            if typed:
+                row = list(values)
+                row.append(self.dob_getter(subject_identifier)
+                           if self.dob_getter else None)
+            else:
+                row = self.column_plan.convert(values)
+                row.append(self.dob(subject_identifier))
+            yield row
@@ -0,0 +1,179 @@
+import json
+import logging
+from datetime import timedelta
+
+from django.apps import apps as django_apps
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.db.models import Q
+from edc_base.utils import get_utcnow
+from edc_constants.constants import COMPLETE
+
+from ..constants import CSV, FAILED, QUEUED, RUNNING, XLSX
+from .dob_resolver import DobResolver
+from .exporter import ModelExporter
+from .writers import CsvExportWriter, XlsxExportWriter
+
+logger = logging.getLogger(__name__)
+
+export_job_model = 'flourish_prn.exportjob'
+
+
+def queue_export(queryset, export_format=CSV, username=None):
+    """ Queues an export of `queryset` on the django_q cluster and
+        returns the export job.
+
+    The job stores the model label and the selected pks, or no pks for
+    an unfiltered queryset, which exports every row.
+    """
+    export_job_cls = django_apps.get_model(export_job_model)
+    pks = None
+    if queryset.query.has_filters() or not queryset.query.can_filter():
+        pks = json.dumps([str(pk) for pk in queryset.values_list(
+            'pk', flat=True)])
+    export_job = export_job_cls.objects.create(
+        model=queryset.model._meta.label_lower,
+        pks=pks,
+        export_format=export_format,
+        user_created=username or '')
+    transaction.on_commit(lambda: enqueue_export_job(export_job.pk))
+    return export_job
+
+
+def enqueue_export_job(export_job_pk):
+    from django_q.tasks import async_task
+    async_task('flourish_prn.exports.jobs.run_export_job', str(export_job_pk),
+               task_name=f'export-{export_job_pk}')
+
+
+def run_export_job(export_job_pk):
+    """ django_q task running the export job `export_job_pk`.
+    """
+    export_job_cls = django_apps.get_model(export_job_model)
+    try:
+        export_job = export_job_cls.objects.get(pk=export_job_pk)
+    except export_job_cls.DoesNotExist:
+        return False
+    return ExportJobRunner(export_job).run()
+
+
+def lease_timeout():
+    """ Returns the time after its last heartbeat that a running job is
+        considered abandoned by a crashed worker.
+    """
+    return timedelta(seconds=getattr(
+        settings, 'FLOURISH_PRN_EXPORT_LEASE_SECONDS', 600))
+
+
+def requeue_stale_export_jobs():
+    """ Queues again the running jobs whose lease has expired, returns
+        the number of jobs queued.
+    """
+    export_job_cls = django_apps.get_model(export_job_model)
+    stale = export_job_cls.objects.filter(
+        status=RUNNING,
+        heartbeat_datetime__lt=get_utcnow() - lease_timeout())
+    pks = list(stale.values_list('pk', flat=True))
+    for pk in pks:
+        enqueue_export_job(pk)
+    return len(pks)
+
+
+class ExportJobRunner:
+    """ Runs a queued export job, recording its progress on the job.
+    """
+
+    progress_interval = 1000
+
+    writers = {CSV: CsvExportWriter, XLSX: XlsxExportWriter}
+
+    def __init__(self, export_job):
+        self.export_job = export_job
+
+    @property
+    def export_job_cls(self):
+        return django_apps.get_model(export_job_model)
+
+    @property
+    def queryset(self):
+        model_cls = django_apps.get_model(self.export_job.model)
+        queryset = model_cls.objects.all()
+        if self.export_job.pks is not None:
+            queryset = queryset.filter(pk__in=json.loads(self.export_job.pks))
+        return queryset
+
+    @property
+    def filename(self):
+        date_str = get_utcnow().strftime('%Y-%m-%d')
+        model_name = self.queryset.model.__name__
+        return f'{model_name}-{date_str}.{self.export_job.export_format}'
+
+    def claim(self):
+        """ Marks the job as running, returns False if another worker
+            has claimed it and still holds its lease.
+
+        A running job whose heartbeat is older than the lease timeout was
+        left by a crashed worker and is claimed again.
+        """
+        started_datetime = get_utcnow()
+        claimed = self.export_job_cls.objects.filter(
+            Q(status=QUEUED) | Q(
+                status=RUNNING,
+                heartbeat_datetime__lt=started_datetime - lease_timeout()),
+            pk=self.export_job.pk).update(
+                status=RUNNING, started_datetime=started_datetime,
+                heartbeat_datetime=started_datetime, rows_written=0)
+        if claimed:
+            self.export_job.status = RUNNING
+            self.export_job.started_datetime = started_datetime
+            self.export_job.heartbeat_datetime = started_datetime
+        return bool(claimed)
+
+    def run(self):
+        if not self.claim():
+            return False
+        try:
+            export_file = self.write()
+        except Exception as e:
+            logger.exception(f'Export job {self.export_job.pk} failed.')
+            self.export_job.status = FAILED
+            self.export_job.error = str(e)
+        else:
+            self.export_job.export_file.save(
+                self.filename, File(export_file), save=False)
+            export_file.close()
+            self.export_job.status = COMPLETE
+        self.export_job.completed_datetime = get_utcnow()
+        self.export_job.save()
+        return True
+
+    def write(self):
+        queryset = self.queryset
+        writer = self.writers[self.export_job.export_format]()
+        exporter = ModelExporter(
+            queryset, dob_getter=DobResolver(queryset).get)
+        return writer.write(
+            exporter.field_names, self.counted(exporter.rows()),
+            sheet_name=queryset.model._meta.verbose_name)
+
+    def counted(self, rows):
+        """ Yields rows, saving the running row count on the job every
+            `progress_interval` rows.
+        """
+        rows_written = 0
+        for row in rows:
+            yield row
+            rows_written += 1
+            if rows_written % self.progress_interval == 0:
+                self.update_progress(rows_written)
+        self.update_progress(rows_written)
+
+    def update_progress(self, rows_written):
+        """ Saves the row count and renews the lease on the job.
+        """
+        heartbeat_datetime = get_utcnow()
+        self.export_job.rows_written = rows_written
+        self.export_job.heartbeat_datetime = heartbeat_datetime
+        self.export_job_cls.objects.filter(pk=self.export_job.pk).update(
+            rows_written=rows_written, heartbeat_datetime=heartbeat_datetime)
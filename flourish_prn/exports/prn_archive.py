@@ -0,0 +1,68 @@
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from django.apps import apps as django_apps
+from django.db import connections
+
+from ..constants import CSV, PARQUET, PRN_MODELS, XLSX
+from .dob_resolver import DobResolver
+from .exporter import ModelExporter
+from .writers import CsvExportWriter, ParquetExportWriter, XlsxExportWriter
+
+
+class PrnArchiveExport:
+    """ Exports every PRN model into a single zip archive, one file per
+        model, extracting the models concurrently on a thread pool.
+
+    Pass `subject_identifiers`, a queryset or iterable, to limit the
+    export to those subjects. A single DobResolver is shared by all
+    models.
+    """
+
+    writers = {CSV: CsvExportWriter, PARQUET: ParquetExportWriter,
+               XLSX: XlsxExportWriter}
+
+    def __init__(self, models=None, export_format=CSV, max_workers=4,
+                 subject_identifiers=None):
+        self.models = models or PRN_MODELS
+        self.writer = self.writers[export_format]()
+        self.max_workers = max_workers
+        self.subject_identifiers = subject_identifiers
+        self.dob_resolver = DobResolver(subject_identifiers)
+
+    def queryset(self, model):
+        queryset = django_apps.get_model(model).objects.all()
+        if self.subject_identifiers is not None:
+            queryset = queryset.filter(
+                subject_identifier__in=self.dob_resolver.subject_identifiers)
+        return queryset
+
+    def extract(self, model):
+        """ Writes one model to a temporary file, run on a worker thread
+            with its own database connection.
+        """
+        try:
+            queryset = self.queryset(model)
+            exporter = ModelExporter(queryset, dob_getter=self.dob_resolver.get)
+            export_file = self.writer.export(
+                exporter, sheet_name=queryset.model._meta.verbose_name)
+            return f'{queryset.model.__name__}.{self.writer.extension}', export_file
+        finally:
+            connections.close_all()
+
+    def write(self):
+        """ Returns an open temporary file holding the zip archive.
+        """
+        # Resolve the DOBs here so the worker threads only read the dict.
+        self.dob_resolver.dobs
+        archive_file = tempfile.TemporaryFile()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor, \
+                zipfile.ZipFile(archive_file, 'w', zipfile.ZIP_DEFLATED) as archive:
+            for filename, export_file in executor.map(self.extract, self.models):
+                with archive.open(filename, 'w') as archive_member:
+                    for chunk in iter(lambda: export_file.read(1024 * 64), b''):
+                        archive_member.write(chunk)
+                export_file.close()
+        archive_file.seek(0)
+        return archive_file
@@ -0,0 +1,251 @@
+import csv
+import datetime
+import tempfile
+import uuid
+
+import xlsxwriter
+import xlwt
+from django.db import models
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+DATETIME_FORMAT = 'YYYY/MM/DD h:mm:ss'
+
+
+def import_pyarrow():
+    """ Returns pyarrow with its parquet module, or None if it is not
+        installed. Imported on first use only, it is slow to import.
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def export_value(value):
+    """ Returns a value in a form every export writer can handle.
+    """
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    elif isinstance(value, datetime.datetime) and timezone.is_aware(value):
+        return timezone.make_naive(value)
+    return value
+
+
+class Echo:
+    """ File-like object that hands back what is written to it, so
+        that csv.writer output can be yielded to a streaming response.
+    """
+
+    def write(self, value):
+        return value
+
+
+class ExportWriter:
+
+    def export(self, exporter, sheet_name=None):
+        """ Writes the rows of a ModelExporter, returns an open temporary
+            file positioned at the start of the export.
+        """
+        return self.write(
+            exporter.field_names, exporter.rows(), sheet_name=sheet_name)
+
+
+class CsvExportWriter(ExportWriter):
+    """ Writes export rows as CSV, one line at a time.
+    """
+
+    content_type = 'text/csv'
+    extension = 'csv'
+
+    def stream(self, header, rows):
+        writer = csv.writer(Echo())
+        yield writer.writerow(header)
+        for row in rows:
+            yield writer.writerow([export_value(value) for value in row])
+
+    def write(self, header, rows, sheet_name=None):
+        """ Returns an open temporary file positioned at the start of
+            the csv.
+        """
+        export_file = tempfile.TemporaryFile()
+        for line in self.stream(header, rows):
+            export_file.write(line.encode('utf-8'))
+        export_file.seek(0)
+        return export_file
+
+
+class XlsxExportWriter(ExportWriter):
+    """ Writes export rows to an xlsx file using xlsxwriter's constant
+        memory mode, each row is flushed to disk once it is written.
+    """
+
+    content_type = (
+        'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+    extension = 'xlsx'
+
+    def write(self, header, rows, sheet_name=None):
+        """ Returns an open temporary file positioned at the start of
+            the workbook.
+        """
+        export_file = tempfile.TemporaryFile()
+        workbook = xlsxwriter.Workbook(
+            export_file, {'constant_memory': True, 'in_memory': False})
+        worksheet = workbook.add_worksheet(
+            str(sheet_name)[:31] if sheet_name else None)
+        header_style = workbook.add_format({'bold': True})
+        datetime_style = workbook.add_format({'num_format': DATETIME_FORMAT})
+
+        worksheet.write_row(0, 0, header, header_style)
+        for row_num, row in enumerate(rows, start=1):
+            for col_num, value in enumerate(row):
+                value = export_value(value)
+                if isinstance(value, datetime.datetime):
+                    worksheet.write_datetime(
+                        row_num, col_num, value, datetime_style)
+                else:
+                    worksheet.write(row_num, col_num, value)
+        workbook.close()
+        export_file.seek(0)
+        return export_file
+
+
+class XlsExportWriter(ExportWriter):
+    """ Writes export rows to an xls workbook, starting a new sheet with
+        the header repeated whenever a sheet reaches the xls row limit.
+    """
+
+    content_type = 'application/ms-excel'
+    extension = 'xls'
+
+    max_rows = 65536
+
+    def sheet_names(self, sheet_name):
+        sheet_name = str(sheet_name or 'Sheet')[:31]
+        yield sheet_name
+        sheet_num = 2
+        while True:
+            suffix = f' ({sheet_num})'
+            yield sheet_name[:31 - len(suffix)] + suffix
+            sheet_num += 1
+
+    def write(self, header, rows, sheet_name=None, export_file=None):
+        """ Saves the workbook to `export_file`, or to a temporary file
+            that is returned positioned at the start of the workbook.
+        """
+        workbook = xlwt.Workbook(encoding='utf-8', style_compression=2)
+        header_style = xlwt.XFStyle()
+        header_style.font.bold = True
+        header_style.num_format_str = DATETIME_FORMAT
+        datetime_style = xlwt.easyxf(num_format_str=DATETIME_FORMAT)
+        sheet_names = self.sheet_names(sheet_name)
+
+        worksheet = None
+        row_num = self.max_rows
+        for row in rows:
+            if row_num == self.max_rows:
+                worksheet = self.add_sheet(
+                    workbook, next(sheet_names), header, header_style)
+                row_num = 1
+            for col_num, value in enumerate(row):
+                value = export_value(value)
+                if isinstance(value, datetime.datetime):
+                    worksheet.write(row_num, col_num, value, datetime_style)
+                else:
+                    worksheet.write(row_num, col_num, value)
+            row_num += 1
+            if row_num % 1000 == 0:
+                worksheet.flush_row_data()
+        if not worksheet:
+            self.add_sheet(workbook, next(sheet_names), header, header_style)
+
+        if export_file is not None:
+            workbook.save(export_file)
+            return export_file
+        export_file = tempfile.TemporaryFile()
+        workbook.save(export_file)
+        export_file.seek(0)
+        return export_file
+
+    def add_sheet(self, workbook, sheet_name, header, header_style):
+        worksheet = workbook.add_sheet(sheet_name)
+        for col_num, field_name in enumerate(header):
+            worksheet.write(0, col_num, field_name, header_style)
+        return worksheet
+
+
+class ParquetExportWriter(ExportWriter):
+    """ Writes a model export to a Parquet file in row groups, keeping
+        the column types of the model fields. Requires pyarrow, installed
+        with the `parquet` extra.
+    """
+
+    content_type = 'application/vnd.apache.parquet'
+    extension = 'parquet'
+
+    row_group_size = 10000
+
+    @classmethod
+    def available(cls):
+        return import_pyarrow() is not None
+
+    @cached_property
+    def pyarrow(self):
+        return import_pyarrow()
+
+    def arrow_type(self, field):
+        if field.is_relation:
+            return self.arrow_type(field.target_field)
+        elif isinstance(field, models.DateTimeField):
+            return self.pyarrow.timestamp('us', tz='UTC')
+        elif isinstance(field, models.DateField):
+            return self.pyarrow.date32()
+        elif isinstance(field, models.DecimalField):
+            return self.pyarrow.decimal128(
+                field.max_digits, field.decimal_places)
+        elif isinstance(field, models.BooleanField):
+            return self.pyarrow.bool_()
+        elif isinstance(field, (models.IntegerField, models.AutoField)):
+            return self.pyarrow.int64()
+        elif isinstance(field, models.FloatField):
+            return self.pyarrow.float64()
+        return self.pyarrow.string()
+
+    def schema(self, exporter):
+        fields = [self.pyarrow.field(field.attname, self.arrow_type(field))
+                  for field in exporter.column_plan.fields]
+        fields.append(self.pyarrow.field('dob', self.pyarrow.date32()))
+        return self.pyarrow.schema(fields)
+
+    def export(self, exporter, sheet_name=None):
+        schema = self.schema(exporter)
+        string_columns = [
+            index for index, field in enumerate(schema)
+            if field.type == self.pyarrow.string()]
+        # pyarrow closes file objects it is given, so write by path.
+        export_file = tempfile.NamedTemporaryFile()
+        with self.pyarrow.parquet.ParquetWriter(
+                export_file.name, schema) as writer:
+            columns = [[] for _ in schema]
+            for row in exporter.rows(typed=True):
+                for index in string_columns:
+                    if row[index] is not None:
+                        row[index] = str(row[index])
+                for column, value in zip(columns, row):
+                    column.append(value)
+                if len(columns[0]) == self.row_group_size:
+                    self.write_row_group(writer, schema, columns)
+                    columns = [[] for _ in schema]
+            if columns[0]:
+                self.write_row_group(writer, schema, columns)
+        export_file.seek(0)
+        return export_file
+
+    def write_row_group(self, writer, schema, columns):
+        writer.write_table(
+            self.pyarrow.Table.from_arrays(
+                [self.pyarrow.array(column, type=field.type)
+                 for column, field in zip(columns, schema)],
+                schema=schema))
@@ -3,11 +3,18 @@ from django.apps import apps as django_apps
 from edc_form_validators import FormValidator
 from django.core.exceptions import ObjectDoesNotExist
 
+from ..helper_classes import latest_visit_index
+
 
 class OffstudyFormValidator(FormValidator):
 
     antenantal_enrollment_model = 'flourish_caregiver.antenatalenrollment'
 
+    # Set by BulkOffStudy to validate many subjects without a query each,
+    # latest visit report datetimes and antenatal enrollment identifiers.
+    prefetched_latest_visits = None
+    prefetched_antenatal_enrollments = None
+
     @property
     def antenantal_enrollment_model_cls(self):
         return django_apps.get_model(self.antenantal_enrollment_model)
@@ -25,6 +32,13 @@ class OffstudyFormValidator(FormValidator):
     def validate_preg_subcohotA(self):
         subject_identifier = self.cleaned_data.get('subject_identifier')
         offstudy_point = self.cleaned_data.get('offstudy_point')
+        if self.prefetched_antenatal_enrollments is not None:
+            if (subject_identifier in self.prefetched_antenatal_enrollments
+                    and offstudy_point == None):
+                raise forms.ValidationError({
+                    'offstudy_point': 'Question 6 required for pregnant women'
+                })
+            return
         try:
             antenantal_enrollment = self.antenantal_enrollment_model_cls.objects.get(subject_identifier=subject_identifier)
         except ObjectDoesNotExist:
@@ -35,28 +49,34 @@ class OffstudyFormValidator(FormValidator):
                         'offstudy_point': 'Question 6 required for pregnant women'
                     })
 
-    def validate_against_latest_visit(self):
-        self.visit_cls = django_apps.get_model(self.visit_model)
+    def latest_visit_datetime(self, subject_identifier):
+        if self.prefetched_latest_visits is not None:
+            return self.prefetched_latest_visits.get(subject_identifier)
+        latest_visit_datetime = latest_visit_index.latest_report_datetime(
+            self.visit_model, subject_identifier)
+        if not latest_visit_datetime:
+            latest_visit_datetime = \
+                latest_visit_index.query_latest_report_datetime(
+                    self.visit_model, subject_identifier)
+        return latest_visit_datetime
 
-        subject_identifier = self.cleaned_data.get('subject_identifier')
-        latest_visit = self.visit_cls.objects.filter(
-            appointment__subject_identifier=subject_identifier).order_by(
-            '-report_datetime').first()
+    def validate_against_latest_visit(self):
+        latest_visit_datetime = self.latest_visit_datetime(
+            self.cleaned_data.get('subject_identifier'))
 
         report_datetime = self.cleaned_data.get('report_datetime')
         offstudy_date = self.cleaned_data.get('offstudy_date')
 
-        if latest_visit:
-            latest_visit_datetime = latest_visit.report_datetime
+        if latest_visit_datetime:
 
-            if report_datetime < latest_visit.report_datetime:
+            if report_datetime < latest_visit_datetime:
                 raise forms.ValidationError({
                     'report_datetime': 'Report datetime cannot be '
                     f'before previous visit Got {report_datetime} '
                     f'but previous visit is {latest_visit_datetime}'
                 })
             if offstudy_date and \
-                    offstudy_date < latest_visit.report_datetime.date():
+                    offstudy_date < latest_visit_datetime.date():
                 raise forms.ValidationError({
                     'offstudy_date': 'Offstudy date cannot be '
                     f'before previous visit Got {offstudy_date} '
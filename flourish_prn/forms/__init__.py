@@ -5,3 +5,4 @@ from .child_death_report_form import ChildDeathReportForm
 from .child_off_study_form import ChildOffStudyForm
 from .tb_adol_off_study_form import TBAdolOffStudyForm
 from .missed_birth_visit_form import MissedBirthVisitForm
+from .bulk_offstudy_form import BulkOffStudyForm
@@ -0,0 +1,38 @@
+from django import forms
+from edc_base.utils import get_utcnow
+
+
+class BulkOffStudyForm(forms.Form):
+
+    subject_identifiers = forms.CharField(
+        label='Subject Identifiers',
+        widget=forms.Textarea(attrs={'rows': 10}),
+        help_text='One subject identifier per line.')
+
+    reason = forms.ChoiceField(
+        label='Reason')
+
+    reason_other = forms.CharField(
+        label='If Other, specify ...',
+        max_length=35,
+        required=False)
+
+    offstudy_date = forms.DateField(
+        label='Off-study Date',
+        initial=get_utcnow().date)
+
+    comment = forms.CharField(
+        label='Comment',
+        max_length=250,
+        widget=forms.Textarea(attrs={'rows': 3}),
+        required=False)
+
+    def __init__(self, *args, model_cls=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields['reason'].choices = model_cls._meta.get_field(
+            'reason').choices
+
+    def clean_subject_identifiers(self):
+        return [subject_identifier.strip() for subject_identifier
+                in self.cleaned_data.get('subject_identifiers').splitlines()
+                if subject_identifier.strip()]
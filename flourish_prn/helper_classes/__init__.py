@@ -0,0 +1,14 @@
+from .consent_version_resolver import (
+    ConsentVersionResolver, consent_version_resolver, resolve_consent_versions)
+from .bulk_offstudy import BulkOffStudy
+from .offschedule import remove_followup_schedule_notes
+from .offschedule import remove_stale_followup_notes, stale_followup_notes
+from .offschedule import take_off_tb_adol_schedules
+from .offstudy_task_queue import (
+    OffStudyTaskQueue, defer_offschedule, offstudy_task_queue)
+from .schedule_index import ScheduleIndex, schedule_index
+from .prn_status import PrnStatusUpdater, prn_status_updater
+from .latest_visit import LatestVisitIndex, latest_visit_index
+from .action_graph import ActionGraph, action_graph
+from .action_item_reconciler import ActionItemReconciler, action_item_reconciler
+from .holiday_calendar import HolidayCalendar, holiday_calendar
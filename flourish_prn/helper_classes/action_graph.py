@@ -0,0 +1,87 @@
+import threading
+from contextlib import contextmanager
+
+from django.apps import apps as django_apps
+
+
+class ActionGraph:
+    """ Evaluates the conditions of PRN `get_next_actions` with `exists()`
+        checks, memoized per subject while a `scope()` is active.
+
+    PrnAction opens a scope around each action item update, and bulk
+    paths open one around all their saves. The memo of a subject is
+    dropped when its action items or death reports change.
+    """
+
+    action_item_model = 'edc_action_item.actionitem'
+
+    def __init__(self):
+        self._local = threading.local()
+
+    @property
+    def memo(self):
+        """ Returns the active memo, or None outside a scope.
+        """
+        return getattr(self._local, 'memo', None)
+
+    @contextmanager
+    def scope(self):
+        """ Memoizes checks within the block, a nested scope shares the
+            memo of the outermost one.
+        """
+        if self.memo is not None:
+            yield self
+            return
+        self._local.memo = {}
+        try:
+            yield self
+        finally:
+            self._local.memo = None
+
+    def clear(self, subject_identifier):
+        if self.memo is not None:
+            self.memo.pop(subject_identifier, None)
+
+    def memoized(self, subject_identifier, key, func):
+        if self.memo is None:
+            return func()
+        subject_memo = self.memo.setdefault(subject_identifier, {})
+        if key not in subject_memo:
+            subject_memo[key] = func()
+        return subject_memo[key]
+
+    def action_names(self, subject_identifier):
+        """ Returns the action type names of the subject's action items,
+            one query shared by every action check for the subject.
+        """
+        action_item_cls = django_apps.get_model(self.action_item_model)
+        return self.memoized(
+            subject_identifier, 'action_names',
+            lambda: set(action_item_cls.objects.filter(
+                subject_identifier=subject_identifier).values_list(
+                    'action_type__name', flat=True).order_by().distinct()))
+
+    def has_action(self, subject_identifier, action_name):
+        if self.memo is None:
+            action_item_cls = django_apps.get_model(self.action_item_model)
+            return action_item_cls.objects.filter(
+                subject_identifier=subject_identifier,
+                action_type__name=action_name).exists()
+        return action_name in self.action_names(subject_identifier)
+
+    def has_reference(self, model, subject_identifier,
+                      reference_model_obj=None):
+        """ Returns True if the subject has a `model` instance, without a
+            query if `reference_model_obj` is that instance.
+        """
+        if (reference_model_obj is not None
+                and reference_model_obj._meta.label_lower == model):
+            return True
+        model_cls = django_apps.get_model(model)
+        return self.memoized(
+            subject_identifier, model,
+            lambda: model_cls.objects.filter(
+                subject_identifier=subject_identifier).exists())
+
+
+action_graph = ActionGraph()
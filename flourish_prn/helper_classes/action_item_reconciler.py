@@ -0,0 +1,139 @@
+from django.apps import apps as django_apps
+from django.db import transaction
+from django.db.models import Count, Min
+from edc_action_item import site_action_items
+from edc_base.utils import get_utcnow
+from edc_constants.constants import CLOSED, NEW
+
+from ..constants import PRN_MODELS
+
+
+class ActionItemReconciler:
+    """ Reconciles PRN action items in bulk.
+
+    `rules` maps a PRN model to the PRN model whose action item its
+    action's `get_next_actions` opens. Subjects with the source but neither the target model nor
+    its action item are missing one. Subjects with more than one action
+    item of a singleton PRN action have duplicates.
+    """
+
+    action_item_model = 'edc_action_item.actionitem'
+    action_type_model = 'edc_action_item.actiontype'
+    registered_subject_model = 'edc_registration.registeredsubject'
+
+    rules = {
+        'flourish_prn.caregiverdeathreport': 'flourish_prn.caregiveroffstudy',
+    }
+
+    @property
+    def action_item_model_cls(self):
+        return django_apps.get_model(self.action_item_model)
+
+    def subject_identifiers(self, model, **filters):
+        model_cls = django_apps.get_model(model)
+        return set(model_cls.objects.filter(**filters).values_list(
+            'subject_identifier', flat=True).order_by().distinct())
+
+    def action_subject_identifiers(self, action_name):
+        return self.subject_identifiers(
+            self.action_item_model, action_type__name=action_name)
+
+    def missing(self):
+        """ Returns a dict of (source model, target model) to the subject
+            identifiers missing the target's action item.
+        """
+        registered = self.subject_identifiers(self.registered_subject_model)
+        missing = {}
+        for source, target in self.rules.items():
+            target_cls = django_apps.get_model(target)
+            subject_identifiers = (
+                (self.subject_identifiers(source) & registered)
+                - self.subject_identifiers(target)
+                - self.action_subject_identifiers(target_cls.action_name))
+            if subject_identifiers:
+                missing[(source, target)] = subject_identifiers
+        return missing
+
+    def parent_action_items(self, source, subject_identifiers):
+        """ Returns a dict of subject identifier to the pk of the source
+            model's action item.
+        """
+        source_cls = django_apps.get_model(source)
+        action_identifiers = source_cls.objects.filter(
+            subject_identifier__in=subject_identifiers).values(
+                'action_identifier')
+        return dict(self.action_item_model_cls.objects.filter(
+            action_identifier__in=action_identifiers).values_list(
+                'subject_identifier', 'pk'))
+
+    @transaction.atomic
+    def create_missing(self, missing=None):
+        """ Creates the missing action items, returns the number created.
+
+        Items are saved one at a time so `ActionItem.save` sets the action
+        identifier, priority and site, and the post_save receivers run.
+        """
+        missing = self.missing() if missing is None else missing
+        action_type_cls = django_apps.get_model(self.action_type_model)
+        created = 0
+        for (source, target), subject_identifiers in missing.items():
+            action_name = django_apps.get_model(target).action_name
+            action_type = action_type_cls.objects.get(name=action_name)
+            parents = self.parent_action_items(source, subject_identifiers)
+            report_datetime = get_utcnow()
+            for subject_identifier in sorted(subject_identifiers):
+                self.action_item_model_cls.objects.create(
+                    subject_identifier=subject_identifier,
+                    action_type=action_type,
+                    parent_action_item_id=parents.get(subject_identifier),
+                    report_datetime=report_datetime,
+                    status=NEW)
+                created += 1
+        return created
+
+    def duplicates(self):
+        """ Returns a dict of action name to the subject identifiers with
+            more than one action item of that singleton PRN action.
+        """
+        action_names = []
+        for model in PRN_MODELS:
+            action_name = django_apps.get_model(model).action_name
+            action_cls = site_action_items.get(action_name)
+            if action_cls.singleton:
+                action_names.append(action_name)
+        duplicates = {}
+        rows = self.action_item_model_cls.objects.filter(
+            action_type__name__in=action_names).values(
+                'action_type__name', 'subject_identifier').annotate(
+                    items=Count('pk')).filter(items__gt=1).values_list(
+                        'action_type__name', 'subject_identifier').order_by()
+        for action_name, subject_identifier in rows:
+            duplicates.setdefault(action_name, set()).add(subject_identifier)
+        return duplicates
+
+    @transaction.atomic
+    def close_duplicates(self, duplicates=None):
+        """ Closes the NEW duplicates of each subject, keeping the earliest
+            action item. Returns the number closed.
+        """
+        duplicates = self.duplicates() if duplicates is None else duplicates
+        closed = 0
+        for action_name, subject_identifiers in duplicates.items():
+            items = self.action_item_model_cls.objects.filter(
+                action_type__name=action_name,
+                subject_identifier__in=subject_identifiers)
+            keep = items.values('subject_identifier').annotate(
+                first=Min('created')).values_list(
+                    'subject_identifier', 'first').order_by()
+            keep = dict(keep)
+            close_pks = [
+                pk for pk, subject_identifier, created in items.filter(
+                    status=NEW).values_list(
+                        'pk', 'subject_identifier', 'created')
+                if created != keep[subject_identifier]]
+            closed += self.action_item_model_cls.objects.filter(
+                pk__in=close_pks).update(status=CLOSED)
+        return closed
+
+
+action_item_reconciler = ActionItemReconciler()
@@ -0,0 +1,183 @@
+from collections import defaultdict
+
+from django.apps import apps as django_apps
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from edc_base.utils import get_utcnow
+from edc_constants.constants import NEW
+from edc_visit_schedule.constants import ON_SCHEDULE
+
+from .action_graph import action_graph
+from .consent_version_resolver import resolve_consent_versions
+from .latest_visit import latest_visit_index
+from .offstudy_task_queue import defer_offschedule
+from .schedule_index import schedule_index
+
+
+class BulkOffStudy:
+    """ Takes many subjects off study in a single transaction.
+
+    Consent versions, current schedules, open action items, latest
+    visits and antenatal enrollments of all subjects are read up front
+    with a fixed number of queries. Each subject is checked with the
+    off-study form validator before it is saved, and taken off its
+    schedules after all subjects are saved, one schedule at a time.
+    Subjects already off study, without a consent version or failing
+    validation are skipped and reported in `skipped`.
+    """
+
+    history_model = 'edc_visit_schedule.subjectschedulehistory'
+    action_item_model = 'edc_action_item.actionitem'
+    antenatal_enrollment_model = 'flourish_caregiver.antenatalenrollment'
+
+    visit_models = {
+        'flourish_prn.caregiveroffstudy': 'flourish_caregiver.maternalvisit',
+        'flourish_prn.childoffstudy': 'flourish_child.childvisit',
+        'flourish_prn.tbadoloffstudy': 'flourish_child.childvisit',
+    }
+
+    def __init__(self, model_cls, subject_identifiers, reason,
+                 offstudy_date=None, report_datetime=None, reason_other=None,
+                 comment=None):
+        self.model_cls = model_cls
+        self.subject_identifiers = sorted(set(subject_identifiers))
+        self.reason = reason
+        self.reason_other = reason_other
+        self.comment = comment
+        self.report_datetime = report_datetime or get_utcnow()
+        self.offstudy_date = offstudy_date or self.report_datetime.date()
+        self.created = []
+        self.skipped = {}
+
+    @property
+    def history_model_cls(self):
+        return django_apps.get_model(self.history_model)
+
+    @property
+    def action_item_model_cls(self):
+        return django_apps.get_model(self.action_item_model)
+
+    def existing_offstudies(self):
+        return set(self.model_cls.objects.filter(
+            subject_identifier__in=self.subject_identifiers).values_list(
+                'subject_identifier', flat=True))
+
+    def onschedules(self):
+        onschedules = defaultdict(list)
+        histories = self.history_model_cls.objects.filter(
+            subject_identifier__in=self.subject_identifiers,
+            schedule_status=ON_SCHEDULE,
+            onschedule_datetime__lte=self.report_datetime).values_list(
+                'subject_identifier', 'onschedule_model', 'schedule_name')
+        for subject_identifier, onschedule_model, schedule_name in histories:
+            onschedules[subject_identifier].append(
+                (onschedule_model, schedule_name))
+        return onschedules
+
+    def action_identifiers(self):
+        return dict(self.action_item_model_cls.objects.filter(
+            subject_identifier__in=self.subject_identifiers,
+            action_type__name=self.model_cls.action_name,
+            status=NEW).values_list('subject_identifier', 'action_identifier'))
+
+    def antenatal_enrollments(self):
+        antenatal_enrollment_cls = django_apps.get_model(
+            self.antenatal_enrollment_model)
+        return set(antenatal_enrollment_cls.objects.filter(
+            subject_identifier__in=self.subject_identifiers).values_list(
+                'subject_identifier', flat=True))
+
+    def form_validator(self):
+        """ Returns the off-study form validator with the latest visits
+            and antenatal enrollments of all subjects prefetched.
+        """
+        from ..form_validations import OffstudyFormValidator
+
+        visit_model = self.visit_models[self.model_cls._meta.label_lower]
+        form_validator = OffstudyFormValidator(cleaned_data={})
+        form_validator.visit_model = visit_model
+        form_validator.prefetched_latest_visits = \
+            latest_visit_index.latest_report_datetimes(
+                visit_model, self.subject_identifiers)
+        form_validator.prefetched_antenatal_enrollments = \
+            self.antenatal_enrollments()
+        return form_validator
+
+    def validate(self, form_validator, subject_identifier):
+        """ Returns the validation errors of the off-study form for the
+            subject, or None.
+        """
+        form_validator.cleaned_data = {
+            'subject_identifier': subject_identifier,
+            'report_datetime': self.report_datetime,
+            'offstudy_date': self.offstudy_date,
+            'reason': self.reason,
+            'reason_other': self.reason_other,
+            'comment': self.comment}
+        try:
+            form_validator.validate_other_specify(
+                field='reason', other_specify_field='reason_other')
+            form_validator.validate_against_latest_visit()
+            form_validator.validate_preg_subcohotA()
+        except ValidationError as e:
+            return ' '.join(e.messages)
+        return None
+
+    def take_off_schedules(self, onschedules):
+        """ Takes the subjects off their schedules, looking each schedule
+            up once for all subjects on it.
+        """
+        subjects_by_schedule = defaultdict(list)
+        for offstudy in self.created:
+            for onschedule in onschedules.get(offstudy.subject_identifier, []):
+                subjects_by_schedule[onschedule].append(offstudy)
+        for (onschedule_model, schedule_name), offstudies in sorted(
+                subjects_by_schedule.items()):
+            _, schedule = schedule_index.get_by_onschedule_model_schedule_name(
+                onschedule_model=onschedule_model, name=schedule_name)
+            for offstudy in offstudies:
+                schedule.take_off_schedule(
+                    subject_identifier=offstudy.subject_identifier,
+                    offschedule_datetime=offstudy.report_datetime,
+                    schedule_name=schedule_name)
+
+    def run(self):
+        existing = self.existing_offstudies()
+        consent_versions = resolve_consent_versions(self.subject_identifiers)
+        onschedules = self.onschedules()
+        action_identifiers = self.action_identifiers()
+        form_validator = self.form_validator()
+        deferred = defer_offschedule()
+
+        with transaction.atomic(), action_graph.scope():
+            for subject_identifier in self.subject_identifiers:
+                if subject_identifier in existing:
+                    self.skipped[subject_identifier] = 'Already off study.'
+                    continue
+                consent_version = consent_versions.get(subject_identifier)
+                if not consent_version:
+                    self.skipped[subject_identifier] = (
+                        'Missing subject screening or consent version.')
+                    continue
+                error = self.validate(form_validator, subject_identifier)
+                if error:
+                    self.skipped[subject_identifier] = error
+                    continue
+                offstudy = self.model_cls(
+                    subject_identifier=subject_identifier,
+                    report_datetime=self.report_datetime,
+                    offstudy_date=self.offstudy_date,
+                    reason=self.reason,
+                    reason_other=self.reason_other,
+                    comment=self.comment,
+                    action_identifier=action_identifiers.get(
+                        subject_identifier))
+                # Schedules are taken off below, grouped by schedule.
+                offstudy.prefetched_onschedules = (
+                    onschedules.get(subject_identifier, [])
+                    if deferred else [])
+                offstudy.save(consent_version=consent_version)
+                self.created.append(offstudy)
+            if not deferred:
+                self.take_off_schedules(onschedules)
+        return self.created
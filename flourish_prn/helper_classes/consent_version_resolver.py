@@ -0,0 +1,199 @@
+from django.apps import apps as django_apps
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.db.models import Exists, OuterRef, Q
+from flourish_child.helper_classes.utils import child_utils
+
+
+class ConsentVersionResolver:
+    """ Resolves the consent version of a caregiver, or of a child
+        through its caregiver, from the caregiver's screening.
+
+    Versions are cached per caregiver and the cache entry is dropped by
+    the post_save/post_delete receivers in `models.signals` whenever a
+    screening or consent version row changes. A cache miss costs a
+    single query.
+
+    Only a shared cache, e.g. redis or memcached, sees the invalidation
+    from other workers. The cache alias is set with
+    `settings.FLOURISH_PRN_CONSENT_VERSION_CACHE`, and entries expire
+    after a few minutes so a per-process cache is stale for no longer.
+    """
+
+    cache_prefix = 'flourish_prn.consent_version'
+    default_cache_timeout = 60 * 5
+
+    preg_screening_model = 'flourish_caregiver.screeningpregwomen'
+    prior_screening_model = 'flourish_caregiver.screeningpriorbhpparticipants'
+    consent_version_model = 'flourish_caregiver.flourishconsentversion'
+    child_consent_model = 'flourish_caregiver.caregiverchildconsent'
+
+    @property
+    def cache(self):
+        return caches[getattr(
+            settings, 'FLOURISH_PRN_CONSENT_VERSION_CACHE', 'default')]
+
+    @property
+    def cache_timeout(self):
+        return getattr(settings, 'FLOURISH_PRN_CONSENT_VERSION_CACHE_TIMEOUT',
+                       self.default_cache_timeout)
+
+    @property
+    def preg_screening_model_cls(self):
+        return django_apps.get_model(self.preg_screening_model)
+
+    @property
+    def prior_screening_model_cls(self):
+        return django_apps.get_model(self.prior_screening_model)
+
+    @property
+    def consent_version_model_cls(self):
+        return django_apps.get_model(self.consent_version_model)
+
+    @property
+    def child_consent_model_cls(self):
+        return django_apps.get_model(self.child_consent_model)
+
+    def caregiver_subject_identifier(self, subject_identifier):
+        if len(subject_identifier.split('-')) == 4:
+            return child_utils.caregiver_subject_identifier(subject_identifier)
+        return subject_identifier
+
+    def cache_key(self, subject_identifier):
+        return f'{self.cache_prefix}.{subject_identifier}'
+
+    def get_consent_version(self, subject_identifier):
+        subject_identifier = self.caregiver_subject_identifier(
+            subject_identifier)
+        cache_key = self.cache_key(subject_identifier)
+        version = self.cache.get(cache_key)
+        if version is None:
+            version = self.query_consent_version(subject_identifier)
+            self.cache.set(cache_key, version, self.cache_timeout)
+        return version
+
+    def query_consent_version(self, subject_identifier):
+        """ Returns the consent version linked to the pregnant women
+            screening, or else the prior participants screening, of a
+            caregiver.
+        """
+        preg_screenings = self.preg_screening_model_cls.objects.filter(
+            subject_identifier=subject_identifier)
+        prior_screenings = self.prior_screening_model_cls.objects.filter(
+            subject_identifier=subject_identifier)
+
+        consent_versions = self.consent_version_model_cls.objects.filter(
+            Q(screening_identifier__in=preg_screenings.values(
+                'screening_identifier'))
+            | Q(screening_identifier__in=prior_screenings.values(
+                'screening_identifier'))).annotate(
+                    preg_screening=Exists(preg_screenings.filter(
+                        screening_identifier=OuterRef('screening_identifier'))),
+                    has_preg_screening=Exists(preg_screenings)).values_list(
+                        'version', 'preg_screening', 'has_preg_screening')
+
+        prior_version = None
+        for version, preg_screening, has_preg_screening in consent_versions:
+            if preg_screening:
+                return version
+            elif not has_preg_screening:
+                prior_version = version
+        if prior_version is None:
+            self.raise_missing(preg_screenings, prior_screenings)
+        return prior_version
+
+    def raise_missing(self, preg_screenings, prior_screenings):
+        if not (preg_screenings.exists() or prior_screenings.exists()):
+            raise ValidationError(
+                'Missing Subject Screening form. Please complete '
+                'it before proceeding.')
+        raise ValidationError(
+            'Missing Consent Version form. Please complete '
+            'it before proceeding.')
+
+    def caregiver_subject_identifiers(self, subject_identifiers):
+        """ Returns a dict of subject identifier to caregiver subject
+            identifier, mapping all child identifiers in one query.
+        """
+        caregivers = {}
+        children = set()
+        for subject_identifier in subject_identifiers:
+            if len(subject_identifier.split('-')) == 4:
+                children.add(subject_identifier)
+            else:
+                caregivers[subject_identifier] = subject_identifier
+        if children:
+            caregivers.update(
+                self.child_consent_model_cls.objects.filter(
+                    subject_identifier__in=children).values_list(
+                        'subject_identifier',
+                        'subject_consent__subject_identifier'))
+        return caregivers
+
+    def resolve_consent_versions(self, subject_identifiers):
+        """ Returns a dict of subject identifier to consent version for
+            many subjects, using the cache first and a constant number
+            of queries for the rest. Subjects whose screening or consent
+            version is missing map to None.
+        """
+        subject_identifiers = set(subject_identifiers)
+        caregivers = self.caregiver_subject_identifiers(subject_identifiers)
+        cached = self.cache.get_many(
+            [self.cache_key(caregiver) for caregiver in set(caregivers.values())])
+        versions = {
+            caregiver: cached.get(self.cache_key(caregiver))
+            for caregiver in set(caregivers.values())}
+
+        missing = [caregiver for caregiver, version in versions.items()
+                   if version is None]
+        if missing:
+            screenings = dict(
+                self.prior_screening_model_cls.objects.filter(
+                    subject_identifier__in=missing).values_list(
+                        'subject_identifier', 'screening_identifier'))
+            screenings.update(
+                self.preg_screening_model_cls.objects.filter(
+                    subject_identifier__in=missing).values_list(
+                        'subject_identifier', 'screening_identifier'))
+            consent_versions = dict(
+                self.consent_version_model_cls.objects.filter(
+                    screening_identifier__in=set(screenings.values())).values_list(
+                        'screening_identifier', 'version'))
+            resolved = {
+                caregiver: consent_versions.get(screenings.get(caregiver))
+                for caregiver in missing}
+            versions.update(resolved)
+            self.cache.set_many(
+                {self.cache_key(caregiver): version
+                 for caregiver, version in resolved.items()
+                 if version is not None},
+                self.cache_timeout)
+        return {subject_identifier: versions.get(
+                    caregivers.get(subject_identifier))
+                for subject_identifier in subject_identifiers}
+
+    def invalidate(self, subject_identifiers):
+        self.cache.delete_many([self.cache_key(subject_identifier)
+                           for subject_identifier in subject_identifiers
+                           if subject_identifier])
+
+    def invalidate_screening(self, screening_identifier):
+        """ Drops the cached versions of the caregivers screened under
+            `screening_identifier`.
+        """
+        subject_identifiers = set()
+        for model_cls in [self.preg_screening_model_cls,
+                          self.prior_screening_model_cls]:
+            subject_identifiers.update(model_cls.objects.filter(
+                screening_identifier=screening_identifier).values_list(
+                    'subject_identifier', flat=True))
+        self.invalidate(subject_identifiers)
+
+
+consent_version_resolver = ConsentVersionResolver()
+
+
+def resolve_consent_versions(subject_identifiers):
+    return consent_version_resolver.resolve_consent_versions(
+        subject_identifiers)
@@ -0,0 +1,106 @@
+import csv
+import os
+from bisect import bisect_left
+from datetime import date, datetime, timedelta
+
+from django.apps import apps as django_apps
+from django.conf import settings
+
+
+class HolidayCalendar:
+    """ Holidays of the facility country as a sorted array of date
+        ordinals, with clinic weekdays per facility definition.
+
+    Loaded once from `settings.HOLIDAY_FILE` when the app is ready, so
+    date checks bisect the array instead of querying the Holiday model.
+    Slot availability is not considered.
+    """
+
+    default_facility_name = '5-day clinic'
+
+    def __init__(self, holidays=None, definitions=None):
+        self.ordinals = sorted({holiday.toordinal()
+                                for holiday in holidays or []})
+        self.clinic_weekdays = self.get_clinic_weekdays(definitions or {})
+
+    @staticmethod
+    def get_clinic_weekdays(definitions):
+        return {name: frozenset(day.weekday for day in definition['days'])
+                for name, definition in definitions.items()}
+
+    def load(self, path=None, country=None):
+        app_config = django_apps.get_app_config('edc_facility')
+        country = country or app_config.country
+        path = path or getattr(settings, 'HOLIDAY_FILE', None)
+        holidays = set()
+        if path and os.path.exists(path):
+            with open(path, newline='') as f:
+                for row in csv.DictReader(f):
+                    if row['country'] == country:
+                        holidays.add(
+                            date.fromisoformat(row['local_date']).toordinal())
+        self.ordinals = sorted(holidays)
+        self.clinic_weekdays = self.get_clinic_weekdays(
+            app_config.definitions)
+
+    def weekdays(self, facility_name=None):
+        return self.clinic_weekdays[
+            facility_name or self.default_facility_name]
+
+    def is_holiday(self, day):
+        ordinal = to_date(day).toordinal()
+        index = bisect_left(self.ordinals, ordinal)
+        return index < len(self.ordinals) and self.ordinals[index] == ordinal
+
+    def is_clinic_day(self, day, facility_name=None):
+        day = to_date(day)
+        return (day.weekday() in self.weekdays(facility_name)
+                and not self.is_holiday(day))
+
+    def holidays_between(self, start, end):
+        """ Returns the holidays from `start` up to, not including, `end`.
+        """
+        return [date.fromordinal(ordinal) for ordinal in self.ordinals[
+            bisect_left(self.ordinals, to_date(start).toordinal()):
+            bisect_left(self.ordinals, to_date(end).toordinal())]]
+
+    def next_clinic_day(self, day, facility_name=None, forward=True):
+        """ Returns `day` if it is a clinic day, otherwise the nearest
+            clinic day after it, or before it if not `forward`. A datetime
+            keeps its time.
+        """
+        weekdays = self.weekdays(facility_name)
+        if not weekdays:
+            raise ValueError(
+                f'Facility {facility_name} has no clinic days.')
+        step = timedelta(days=1 if forward else -1)
+        candidate = to_date(day)
+        while not self.is_clinic_day(candidate, facility_name):
+            candidate += step
+        if isinstance(day, datetime):
+            return day + timedelta(days=(candidate - day.date()).days)
+        return candidate
+
+    def business_days_between(self, start, end, facility_name=None):
+        """ Returns the number of clinic days from `start` up to, not
+            including, `end`.
+        """
+        start, end = to_date(start), to_date(end)
+        days = (end - start).days
+        if days <= 0:
+            return 0
+        weekdays = self.weekdays(facility_name)
+        weeks, remainder = divmod(days, 7)
+        count = weeks * len(weekdays) + sum(
+            1 for offset in range(remainder)
+            if (start.weekday() + offset) % 7 in weekdays)
+        return count - sum(
+            1 for holiday in self.holidays_between(start, end)
+            if holiday.weekday() in weekdays)
+
+
+def to_date(day):
+    return day.date() if isinstance(day, datetime) else day
+
+
+holiday_calendar = HolidayCalendar()
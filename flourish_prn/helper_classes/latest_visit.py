@@ -0,0 +1,130 @@
+from django.apps import apps as django_apps
+from django.db import transaction
+from django.db.models import Max
+
+
+class LatestVisitIndex:
+    """ Maintains and reads `SubjectLatestVisit`, the latest visit
+        report datetime per subject for each visit model.
+    """
+
+    latest_visit_model = 'flourish_prn.subjectlatestvisit'
+
+    visit_models = ['flourish_caregiver.maternalvisit',
+                    'flourish_child.childvisit']
+
+    @property
+    def latest_visit_model_cls(self):
+        return django_apps.get_model(self.latest_visit_model)
+
+    def query_latest_report_datetime(self, visit_model, subject_identifier):
+        visit_cls = django_apps.get_model(visit_model)
+        return visit_cls.objects.filter(
+            appointment__subject_identifier=subject_identifier).aggregate(
+                latest=Max('report_datetime')).get('latest')
+
+    def latest_report_datetime(self, visit_model, subject_identifier):
+        """ Returns the report datetime of the subject's latest visit, or
+            None if the subject has no visits.
+        """
+        try:
+            return self.latest_visit_model_cls.objects.values_list(
+                'report_datetime', flat=True).get(
+                    visit_model=visit_model,
+                    subject_identifier=subject_identifier)
+        except self.latest_visit_model_cls.DoesNotExist:
+            return None
+
+    def latest_report_datetimes(self, visit_model, subject_identifiers):
+        """ Returns a dict of subject identifier to the report datetime of
+            the subject's latest visit for many subjects, reading the
+            visit model once for subjects missing from the index.
+        """
+        subject_identifiers = set(subject_identifiers)
+        latest = dict(self.latest_visit_model_cls.objects.filter(
+            visit_model=visit_model,
+            subject_identifier__in=subject_identifiers).values_list(
+                'subject_identifier', 'report_datetime'))
+        missing = subject_identifiers - set(latest)
+        if missing:
+            visit_cls = django_apps.get_model(visit_model)
+            latest.update(visit_cls.objects.filter(
+                appointment__subject_identifier__in=missing).values(
+                    'appointment__subject_identifier').annotate(
+                        latest=Max('report_datetime')).values_list(
+                            'appointment__subject_identifier',
+                            'latest').order_by())
+        return latest
+
+    def set(self, visit_model, subject_identifier, report_datetime):
+        if report_datetime is None:
+            self.latest_visit_model_cls.objects.filter(
+                visit_model=visit_model,
+                subject_identifier=subject_identifier).delete()
+        else:
+            self.latest_visit_model_cls.objects.update_or_create(
+                visit_model=visit_model,
+                subject_identifier=subject_identifier,
+                defaults={'report_datetime': report_datetime})
+
+    def refresh(self, visit_model, subject_identifier):
+        self.set(visit_model, subject_identifier,
+                 self.query_latest_report_datetime(
+                     visit_model, subject_identifier))
+
+    def update(self, visit, deleted=False):
+        """ Updates the index for a saved or deleted visit, only querying
+            the visit model when the latest visit moved back or was
+            deleted.
+        """
+        visit_model = visit._meta.label_lower
+        subject_identifier = visit.appointment.subject_identifier
+        current = self.latest_report_datetime(visit_model, subject_identifier)
+        if deleted:
+            if current and visit.report_datetime >= current:
+                self.refresh(visit_model, subject_identifier)
+        elif not current or visit.report_datetime >= current:
+            self.set(visit_model, subject_identifier, visit.report_datetime)
+        else:
+            # An earlier visit may have been the latest before this edit.
+            self.refresh(visit_model, subject_identifier)
+
+    def latest_by_subject(self, visit_model):
+        visit_cls = django_apps.get_model(visit_model)
+        return dict(visit_cls.objects.values(
+            'appointment__subject_identifier').annotate(
+                latest=Max('report_datetime')).values_list(
+                    'appointment__subject_identifier', 'latest').order_by())
+
+    def check(self, visit_model):
+        """ Returns the subjects whose indexed latest visit differs from
+            the visit model.
+        """
+        expected = self.latest_by_subject(visit_model)
+        indexed = dict(self.latest_visit_model_cls.objects.filter(
+            visit_model=visit_model).values_list(
+                'subject_identifier', 'report_datetime'))
+        return {subject_identifier
+                for subject_identifier in set(expected) | set(indexed)
+                if expected.get(subject_identifier) != indexed.get(
+                    subject_identifier)}
+
+    @transaction.atomic
+    def rebuild(self, visit_model):
+        """ Rebuilds the index of a visit model with one grouped query,
+            returns the number of subjects indexed.
+        """
+        latest = self.latest_by_subject(visit_model)
+        self.latest_visit_model_cls.objects.filter(
+            visit_model=visit_model).delete()
+        self.latest_visit_model_cls.objects.bulk_create(
+            [self.latest_visit_model_cls(
+                visit_model=visit_model,
+                subject_identifier=subject_identifier,
+                report_datetime=report_datetime)
+             for subject_identifier, report_datetime in latest.items()],
+            batch_size=1000)
+        return len(latest)
+
+
+latest_visit_index = LatestVisitIndex()
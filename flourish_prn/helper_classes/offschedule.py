@@ -0,0 +1,59 @@
+from django.apps import apps as django_apps
+
+from .schedule_index import schedule_index
+
+TB_ADOL_SCHEDULES = {
+    'tb_adol_schedule': 'flourish_child.onschedulechildtbadolschedule',
+    'tb_adol_followup_schedule': 'flourish_child.onscheduletbadolfollowupschedule'
+}
+
+
+def stale_followup_notes(subject_identifiers=None):
+    """ Returns the follow up schedule notes of subjects that are not
+        enrolled on a follow up schedule, optionally limited to
+        `subject_identifiers`.
+    """
+    schedule_history_cls = django_apps.get_model(
+        'edc_visit_schedule.subjectschedulehistory')
+    participant_note_cls = django_apps.get_model(
+        'flourish_calendar.participantnote')
+
+    fu_schedules = schedule_history_cls.objects.filter(
+        schedule_name__contains='_fu')
+    fu_notes = participant_note_cls.objects.filter(title='Follow Up Schedule')
+    if subject_identifiers is not None:
+        subject_identifiers = list(subject_identifiers)
+        fu_schedules = fu_schedules.filter(
+            subject_identifier__in=subject_identifiers)
+        fu_notes = fu_notes.filter(subject_identifier__in=subject_identifiers)
+    return fu_notes.exclude(
+        subject_identifier__in=fu_schedules.values(
+            'subject_identifier').distinct())
+
+
+def remove_stale_followup_notes(subject_identifiers=None):
+    """ Deletes, in one statement, the follow up schedule notes of
+        subjects not enrolled on a follow up schedule. Returns the number
+        of notes deleted.
+    """
+    deleted, _ = stale_followup_notes(subject_identifiers).delete()
+    return deleted
+
+
+def remove_followup_schedule_notes(subject_identifier):
+    """ Remove the follow up schedule notes of a subject not already
+        enrolled on a follow up schedule.
+    """
+    return remove_stale_followup_notes([subject_identifier])
+
+
+def take_off_tb_adol_schedules(subject_identifier, report_datetime):
+    for schedule_name, onschedule_model in TB_ADOL_SCHEDULES.items():
+        _, schedule = schedule_index.get_by_onschedule_model_schedule_name(
+            onschedule_model=onschedule_model,
+            name=schedule_name)
+        if schedule.is_onschedule(subject_identifier=subject_identifier,
+                                  report_datetime=report_datetime):
+            schedule.take_off_schedule(
+                subject_identifier=subject_identifier,
+                schedule_name=schedule_name)
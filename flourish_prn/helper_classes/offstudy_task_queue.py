@@ -0,0 +1,151 @@
+import datetime
+import logging
+
+from django.apps import apps as django_apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from edc_base.utils import get_utcnow
+from edc_constants.constants import COMPLETE
+
+from ..constants import FAILED, QUEUED, RUNNING
+from ..constants import REMOVE_FU_NOTES, REMOVE_TB_SCHEDULES, TAKE_OFF_SCHEDULE
+from .offschedule import remove_followup_schedule_notes
+from .offschedule import take_off_tb_adol_schedules
+
+logger = logging.getLogger(__name__)
+
+
+def defer_offschedule():
+    return getattr(settings, 'FLOURISH_PRN_DEFER_OFFSCHEDULE', False)
+
+
+class OffStudyTaskQueue:
+    """ A database backed queue for the off-schedule work that follows
+        an off-study save.
+
+    Tasks are written in the caller's transaction, so they are only
+    queued if the off-study row is saved, and are sent to the django_q
+    cluster once that transaction commits. Failed tasks are retried
+    with a growing delay, up to `max_attempts`, by the next
+    `process_offstudy_tasks` run. A task left running longer than
+    `lease_timeout`, e.g. by a crashed worker, is claimed again.
+    """
+
+    task_model = 'flourish_prn.offstudytask'
+
+    max_attempts = 5
+
+    retry_delay = datetime.timedelta(minutes=5)
+
+    lease_timeout = datetime.timedelta(minutes=15)
+
+    @property
+    def task_model_cls(self):
+        return django_apps.get_model(self.task_model)
+
+    @property
+    def handlers(self):
+        return {
+            TAKE_OFF_SCHEDULE: self.take_off_schedule,
+            REMOVE_FU_NOTES: self.remove_fu_notes,
+            REMOVE_TB_SCHEDULES: self.remove_tb_schedules}
+
+    def enqueue(self, instance, task):
+        offstudy_task = self.task_model_cls.objects.create(
+            model=instance._meta.label_lower,
+            subject_identifier=instance.subject_identifier,
+            task=task)
+        transaction.on_commit(lambda: self.send(offstudy_task.pk))
+        return offstudy_task
+
+    def send(self, pk):
+        from django_q.tasks import async_task
+        async_task('flourish_prn.helper_classes.offstudy_task_queue.'
+                   'process_offstudy_task', str(pk))
+
+    def claimable(self):
+        """ Returns the queued tasks that are due and the running tasks
+            whose lease has expired.
+        """
+        now = get_utcnow()
+        return self.task_model_cls.objects.filter(
+            Q(status=QUEUED, next_attempt_datetime__lte=now)
+            | Q(status=RUNNING, claimed_datetime__lt=now - self.lease_timeout))
+
+    def process_due(self):
+        """ Processes every task that is due, including stale running
+            tasks, returns the number of tasks processed.
+        """
+        processed = 0
+        for offstudy_task in self.claimable():
+            processed += self.process(offstudy_task)
+        return processed
+
+    def claim(self, offstudy_task):
+        claimed_datetime = get_utcnow()
+        claimed = self.claimable().filter(pk=offstudy_task.pk).update(
+            status=RUNNING, claimed_datetime=claimed_datetime)
+        if claimed:
+            offstudy_task.status = RUNNING
+            offstudy_task.claimed_datetime = claimed_datetime
+        return bool(claimed)
+
+    def process(self, offstudy_task):
+        if not self.claim(offstudy_task):
+            return False
+        offstudy_task.attempts += 1
+        try:
+            with transaction.atomic():
+                self.handlers[offstudy_task.task](offstudy_task)
+        except Exception as e:
+            logger.exception(f'Off study task {offstudy_task} failed.')
+            offstudy_task.last_error = str(e)
+            if offstudy_task.attempts >= self.max_attempts:
+                offstudy_task.status = FAILED
+            else:
+                offstudy_task.status = QUEUED
+                offstudy_task.next_attempt_datetime = (
+                    get_utcnow() + self.retry_delay * offstudy_task.attempts)
+        else:
+            offstudy_task.status = COMPLETE
+            offstudy_task.last_error = None
+        offstudy_task.save()
+        return True
+
+    def offstudy(self, offstudy_task):
+        model_cls = django_apps.get_model(offstudy_task.model)
+        return model_cls.objects.get(
+            subject_identifier=offstudy_task.subject_identifier)
+
+    def take_off_schedule(self, offstudy_task):
+        self.offstudy(offstudy_task).take_off_onschedules()
+
+    def remove_fu_notes(self, offstudy_task):
+        remove_followup_schedule_notes(offstudy_task.subject_identifier)
+
+    def remove_tb_schedules(self, offstudy_task):
+        offstudy = self.offstudy(offstudy_task)
+        take_off_tb_adol_schedules(
+            offstudy.subject_identifier, offstudy.report_datetime)
+
+    def status(self, subject_identifier):
+        """ Returns a dict of task to status for a subject, for display
+            on the dashboard.
+        """
+        return dict(self.task_model_cls.objects.filter(
+            subject_identifier=subject_identifier).order_by(
+                'created').values_list('task', 'status'))
+
+
+offstudy_task_queue = OffStudyTaskQueue()
+
+
+def process_offstudy_task(pk):
+    """ django_q task processing the off-study task `pk`.
+    """
+    offstudy_task = offstudy_task_queue.task_model_cls.objects.filter(
+        pk=pk).first()
+    if offstudy_task is None:
+        return False
+    return offstudy_task_queue.process(offstudy_task)
@@ -0,0 +1,71 @@
+from django.apps import apps as django_apps
+from django.db import transaction
+
+
+class PrnStatusUpdater:
+    """ Maintains `SubjectPrnStatus` from the PRN models.
+
+    `sources` maps each PRN model to the status field it sets and the
+    model field holding the value, None for flags.
+    """
+
+    status_model = 'flourish_prn.subjectprnstatus'
+
+    sources = {
+        'flourish_prn.caregiveroffstudy': ('offstudy_date', 'offstudy_date'),
+        'flourish_prn.childoffstudy': ('offstudy_date', 'offstudy_date'),
+        'flourish_prn.caregiverdeathreport': ('death_date', 'death_date'),
+        'flourish_prn.childdeathreport': ('death_date', 'death_date'),
+        'flourish_prn.tbadoloffstudy': ('tb_offstudy_date', 'offstudy_date'),
+        'flourish_prn.tbreferaladol': ('tb_referral_date', 'referral_date'),
+        'flourish_prn.missedbirthvisit': ('missed_birth_visit', None),
+    }
+
+    @property
+    def status_model_cls(self):
+        return django_apps.get_model(self.status_model)
+
+    def update(self, instance, deleted=False):
+        """ Sets, or clears if `deleted`, the status field that
+            `instance` is the source of.
+        """
+        status_field, source_field = self.sources[instance._meta.label_lower]
+        if source_field:
+            value = None if deleted else getattr(instance, source_field)
+        else:
+            value = not deleted
+        self.status_model_cls.objects.update_or_create(
+            subject_identifier=instance.subject_identifier,
+            defaults={status_field: value})
+
+    @transaction.atomic
+    def rebuild(self):
+        """ Rebuilds the status table from the PRN models, with one query
+            per PRN model. Returns the number of statuses created.
+        """
+        statuses = {}
+        for model, (status_field, source_field) in self.sources.items():
+            model_cls = django_apps.get_model(model)
+            values = model_cls.objects.values_list(
+                'subject_identifier', source_field or 'subject_identifier')
+            for subject_identifier, value in values.iterator():
+                statuses.setdefault(subject_identifier, {})[status_field] = (
+                    value if source_field else True)
+
+        self.status_model_cls.objects.all().delete()
+        self.status_model_cls.objects.bulk_create(
+            [self.status_model_cls(subject_identifier=subject_identifier,
+                                   **fields)
+             for subject_identifier, fields in statuses.items()],
+            batch_size=1000)
+        return len(statuses)
+
+    def statuses(self, subject_identifiers):
+        """ Returns a dict of subject identifier to SubjectPrnStatus in
+            one query. Subjects without PRN forms are left out.
+        """
+        return self.status_model_cls.objects.in_bulk(
+            list(subject_identifiers), field_name='subject_identifier')
+
+
+prn_status_updater = PrnStatusUpdater()
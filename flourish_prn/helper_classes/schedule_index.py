@@ -0,0 +1,39 @@
+from edc_visit_schedule.site_visit_schedules import site_visit_schedules
+
+
+class ScheduleIndex:
+    """ Maps (onschedule model, schedule name) to (visit schedule,
+        schedule) so off-study paths do not scan the registry of
+        site_visit_schedules on every save.
+
+    The index is built once when the app is ready. Code that registers
+    or replaces visit schedules after that, such as tests, must call
+    `invalidate` so the index is built again on the next lookup.
+    """
+
+    def __init__(self, site_visit_schedules=site_visit_schedules):
+        self.site_visit_schedules = site_visit_schedules
+        self.index = None
+
+    def build(self):
+        index = {}
+        for visit_schedule in self.site_visit_schedules.registry.values():
+            for schedule in visit_schedule.schedules.values():
+                index[(schedule.onschedule_model, schedule.name)] = (
+                    visit_schedule, schedule)
+        self.index = index
+
+    def invalidate(self):
+        self.index = None
+
+    def get_by_onschedule_model_schedule_name(self, onschedule_model, name):
+        if self.index is None:
+            self.build()
+        try:
+            return self.index[(onschedule_model, name)]
+        except KeyError:
+            return self.site_visit_schedules.get_by_onschedule_model_schedule_name(
+                onschedule_model=onschedule_model, name=name)
+
+
+schedule_index = ScheduleIndex()
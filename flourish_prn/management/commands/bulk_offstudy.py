@@ -0,0 +1,66 @@
+import datetime
+
+from django.apps import apps as django_apps
+from django.core.management.base import BaseCommand, CommandError
+
+from ...helper_classes import BulkOffStudy
+
+
+class Command(BaseCommand):
+
+    help = 'Takes a list of subjects off study in a single transaction.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'subject_identifiers',
+            nargs='*',
+            help='Subject identifiers to take off study.')
+        parser.add_argument(
+            '--model',
+            default='flourish_prn.caregiveroffstudy',
+            help='Off-study model, e.g. flourish_prn.childoffstudy.')
+        parser.add_argument(
+            '--file',
+            help='File with one subject identifier per line.')
+        parser.add_argument(
+            '--reason',
+            required=True)
+        parser.add_argument(
+            '--reason-other')
+        parser.add_argument(
+            '--offstudy-date',
+            type=datetime.date.fromisoformat,
+            help='Off-study date as YYYY-MM-DD, defaults to today.')
+        parser.add_argument(
+            '--comment')
+
+    def handle(self, *args, **options):
+        model_cls = django_apps.get_model(options.get('model'))
+        subject_identifiers = list(options.get('subject_identifiers'))
+        if options.get('file'):
+            with open(options.get('file')) as f:
+                subject_identifiers.extend(
+                    line.strip() for line in f if line.strip())
+        if not subject_identifiers:
+            raise CommandError('No subject identifiers given.')
+
+        reasons = [choice for choice, _ in
+                   model_cls._meta.get_field('reason').choices]
+        if options.get('reason') not in reasons:
+            raise CommandError(
+                f'Invalid reason. Expected one of {", ".join(reasons)}.')
+
+        bulk_offstudy = BulkOffStudy(
+            model_cls,
+            subject_identifiers=subject_identifiers,
+            reason=options.get('reason'),
+            reason_other=options.get('reason_other'),
+            offstudy_date=options.get('offstudy_date'),
+            comment=options.get('comment'))
+        created = bulk_offstudy.run()
+
+        for subject_identifier, reason in bulk_offstudy.skipped.items():
+            self.stdout.write(
+                self.style.WARNING(f'{subject_identifier} skipped. {reason}'))
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(created)} subject(s) taken off study.'))
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from ...helper_classes import remove_stale_followup_notes, stale_followup_notes
+
+
+class Command(BaseCommand):
+
+    help = ('Deletes "Follow Up Schedule" participant notes of subjects '
+            'that are not enrolled on a follow up schedule.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'subject_identifiers',
+            nargs='*',
+            help='Limit the cleanup to these subjects, defaults to all.')
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report the number of stale notes without deleting them.')
+
+    def handle(self, *args, **options):
+        subject_identifiers = options.get('subject_identifiers') or None
+        if options.get('dry_run'):
+            count = stale_followup_notes(subject_identifiers).count()
+            self.stdout.write(f'{count} stale follow up schedule note(s).')
+        else:
+            deleted = remove_stale_followup_notes(subject_identifiers)
+            self.stdout.write(self.style.SUCCESS(
+                f'Deleted {deleted} stale follow up schedule note(s).'))
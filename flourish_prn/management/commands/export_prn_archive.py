@@ -0,0 +1,49 @@
+import shutil
+
+from django.core.management.base import BaseCommand, CommandError
+from edc_base.utils import get_utcnow
+
+from ...constants import CSV, PARQUET, PRN_MODELS, XLSX
+from ...exports import ParquetExportWriter, PrnArchiveExport
+
+
+class Command(BaseCommand):
+
+    help = 'Exports all PRN models into a single zip archive.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'models',
+            nargs='*',
+            default=PRN_MODELS,
+            help='Models to export as app_label.model_name, defaults to '
+                 'all PRN models.')
+        parser.add_argument(
+            '--output',
+            default=None,
+            help='Path of the zip archive, defaults to '
+                 'flourish-prn-<date>.zip in the current directory.')
+        parser.add_argument(
+            '--format',
+            default=CSV,
+            choices=[CSV, PARQUET, XLSX])
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='Number of models extracted concurrently.')
+
+    def handle(self, *args, **options):
+        if (options.get('format') == PARQUET
+                and not ParquetExportWriter.available()):
+            raise CommandError('Parquet exports require pyarrow.')
+        date_str = get_utcnow().strftime('%Y-%m-%d')
+        output = options.get('output') or f'flourish-prn-{date_str}.zip'
+        archive_file = PrnArchiveExport(
+            models=options.get('models'),
+            export_format=options.get('format'),
+            max_workers=options.get('workers')).write()
+        with open(output, 'wb') as f:
+            shutil.copyfileobj(archive_file, f)
+        archive_file.close()
+        self.stdout.write(self.style.SUCCESS(f'PRN archive written to {output}'))
@@ -0,0 +1,79 @@
+import os
+import shutil
+
+from django.apps import apps as django_apps
+from django.core.management.base import BaseCommand
+from edc_base.utils import get_utcnow
+
+from ...constants import CSV, PRN_MODELS, XLSX
+from ...exports import (
+    CsvExportWriter, DeltaExport, DobResolver, ModelExporter, XlsxExportWriter)
+
+
+class Command(BaseCommand):
+
+    help = ('Exports PRN rows created or changed since the last export '
+            'to a consumer.')
+
+    writers = {CSV: CsvExportWriter, XLSX: XlsxExportWriter}
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'models',
+            nargs='*',
+            default=PRN_MODELS,
+            help='Models to export as app_label.model_name, defaults to '
+                 'all PRN models.')
+        parser.add_argument(
+            '--consumer',
+            required=True,
+            help='Name of the consumer the watermarks are kept for.')
+        parser.add_argument(
+            '--output-dir',
+            default='.',
+            help='Directory the export files are written to.')
+        parser.add_argument(
+            '--format',
+            default=CSV,
+            choices=list(self.writers))
+        parser.add_argument(
+            '--include-history',
+            action='store_true',
+            help='Also export changed historical records.')
+
+    def handle(self, *args, **options):
+        consumer = options.get('consumer')
+        for model in options.get('models'):
+            model_cls = django_apps.get_model(model)
+            querysets = [model_cls.objects.all()]
+            if options.get('include_history'):
+                history_queryset = DeltaExport.history_queryset(model_cls)
+                if history_queryset is not None:
+                    querysets.append(history_queryset)
+            for queryset in querysets:
+                self.export(DeltaExport(queryset, consumer), **options)
+
+    def export(self, delta_export, **options):
+        changed = delta_export.changed()
+        model_cls = changed.model
+        if delta_export.high_watermark is None:
+            self.stdout.write(f'{model_cls.__name__}: no changes.')
+            return
+        writer = self.writers[options.get('format')]()
+        exporter = ModelExporter(
+            changed, dob_getter=DobResolver(changed).get)
+        export_file = writer.export(
+            exporter, sheet_name=model_cls._meta.verbose_name)
+
+        date_str = get_utcnow().strftime('%Y-%m-%d-%H%M%S')
+        filename = (f'{model_cls.__name__}-{delta_export.consumer}-'
+                    f'{date_str}.{writer.extension}')
+        path = os.path.join(options.get('output_dir'), filename)
+        with open(path, 'wb') as f:
+            shutil.copyfileobj(export_file, f)
+        export_file.close()
+
+        delta_export.commit()
+        self.stdout.write(self.style.SUCCESS(
+            f'{model_cls.__name__}: changes up to '
+            f'{delta_export.high_watermark} written to {path}'))
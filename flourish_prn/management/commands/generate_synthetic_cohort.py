@@ -0,0 +1,260 @@
+import random
+from datetime import timedelta
+
+from dateutil.relativedelta import relativedelta
+from django.apps import apps as django_apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from edc_base.utils import get_utcnow
+from edc_constants.constants import NOT_APPLICABLE, YES
+from edc_visit_schedule.constants import OFF_SCHEDULE, ON_SCHEDULE
+
+from ...helper_classes import prn_status_updater, schedule_index
+
+
+class SyntheticCohort:
+    """ Generates caregivers with a child each, their datasets, screening,
+        consent version, consents, registration, cohort B schedule and a
+        share of PRN records, for load testing only.
+
+    Instances are prepared with the mommy recipes, so required fields are
+    filled the same way the tests fill them, and written per batch with
+    `bulk_create`. No model save or signal runs; the PRN status table is
+    rebuilt at the end instead. Never run this against a live database.
+
+    model_mommy is a test dependency, installed with the `synthetic`
+    extra, and is imported only when a cohort is generated.
+    """
+
+    registered_subject_model = 'edc_registration.registeredsubject'
+    consent_version_model = 'flourish_caregiver.flourishconsentversion'
+    history_model = 'edc_visit_schedule.subjectschedulehistory'
+    onschedule_model = 'flourish_caregiver.onschedulecohortbenrollment'
+    schedule_name = 'b_enrol1_schedule1'
+
+    def __init__(self, subjects, batch_size=1000, prefix='B999',
+                 offstudy_ratio=0.1, death_ratio=0.01, seed=None):
+        self.subjects = subjects
+        self.batch_size = batch_size
+        self.prefix = prefix
+        self.offstudy_ratio = offstudy_ratio
+        self.death_ratio = death_ratio
+        self.random = random.Random(seed)
+        self.report_datetime = get_utcnow() - timedelta(days=1)
+        self.counts = {}
+
+    def bulk_create(self, model, objs):
+        model_cls = django_apps.get_model(model)
+        model_cls.objects.bulk_create(objs, batch_size=self.batch_size)
+        self.counts[model] = self.counts.get(model, 0) + len(objs)
+
+    def identifiers(self, index):
+        """ Returns the caregiver subject, child subject, screening and
+            study maternal identifiers of subject `index`.
+
+        Subject identifiers are shaped like the production ones, three
+        parts for a caregiver, e.g. B999-000000001-1, and four for their
+        child, e.g. B999-000000001-1-10, as the consent version lookup
+        tells a child from a caregiver by the number of parts.
+        """
+        caregiver = f'{self.prefix}-{index:09d}-{index % 10}'
+        return (caregiver, f'{caregiver}-10', f'S{self.prefix}{index:09d}',
+                f'{self.prefix}{index:09d}')
+
+    def schedule_objs(self, subject_identifier, offstudy):
+        from model_mommy import mommy
+
+        visit_schedule, schedule = \
+            schedule_index.get_by_onschedule_model_schedule_name(
+                onschedule_model=self.onschedule_model,
+                name=self.schedule_name)
+        onschedule = mommy.prepare(
+            self.onschedule_model,
+            subject_identifier=subject_identifier,
+            schedule_name=self.schedule_name,
+            onschedule_datetime=self.report_datetime)
+        history = mommy.prepare(
+            self.history_model,
+            subject_identifier=subject_identifier,
+            visit_schedule_name=visit_schedule.name,
+            schedule_name=schedule.name,
+            onschedule_model=schedule.onschedule_model,
+            offschedule_model=schedule.offschedule_model,
+            onschedule_datetime=self.report_datetime,
+            offschedule_datetime=self.report_datetime if offstudy else None,
+            schedule_status=OFF_SCHEDULE if offstudy else ON_SCHEDULE)
+        return onschedule, history
+
+    @transaction.atomic
+    def create_batch(self, start, stop):
+        from model_mommy import mommy
+
+        objs = {}
+
+        def add(model, obj):
+            objs.setdefault(model, []).append(obj)
+
+        delivdt = self.report_datetime - relativedelta(years=5, months=2)
+        for index in range(start, stop):
+            caregiver, child, screening_identifier, study_maternal_identifier = \
+                self.identifiers(index)
+            died = self.random.random() < self.death_ratio
+            offstudy = died or self.random.random() < self.offstudy_ratio
+
+            add('flourish_caregiver.maternaldataset', mommy.prepare_recipe(
+                'flourish_caregiver.maternaldataset',
+                subject_identifier=caregiver,
+                screening_identifier=screening_identifier,
+                study_maternal_identifier=study_maternal_identifier,
+                delivdt=delivdt,
+                mom_enrolldate=self.report_datetime,
+                mom_hivstatus='HIV-infected',
+                protocol='Mpepu',
+                preg_efv=1))
+            add('flourish_child.childdataset', mommy.prepare_recipe(
+                'flourish_child.childdataset',
+                study_maternal_identifier=study_maternal_identifier,
+                study_child_identifier=f'{study_maternal_identifier}-10',
+                dob=delivdt.date(),
+                infant_hiv_exposed='Exposed',
+                infant_enrolldate=self.report_datetime))
+            add('flourish_caregiver.screeningpriorbhpparticipants',
+                mommy.prepare_recipe(
+                    'flourish_caregiver.screeningpriorbhpparticipants',
+                    subject_identifier=caregiver,
+                    screening_identifier=screening_identifier,
+                    study_maternal_identifier=study_maternal_identifier))
+            add(self.consent_version_model, mommy.prepare(
+                self.consent_version_model,
+                screening_identifier=screening_identifier,
+                version='1'))
+
+            subject_consent = mommy.prepare_recipe(
+                'flourish_caregiver.subjectconsent',
+                subject_identifier=caregiver,
+                screening_identifier=screening_identifier,
+                consent_datetime=self.report_datetime,
+                breastfeed_intent=NOT_APPLICABLE,
+                biological_caregiver=YES,
+                version='1')
+            add('flourish_caregiver.subjectconsent', subject_consent)
+            add('flourish_caregiver.caregiverchildconsent',
+                mommy.prepare_recipe(
+                    'flourish_caregiver.caregiverchildconsent',
+                    subject_consent=subject_consent,
+                    subject_identifier=child,
+                    study_child_identifier=f'{study_maternal_identifier}-10',
+                    child_dob=delivdt.date(),
+                    consent_datetime=self.report_datetime))
+
+            for subject_identifier in [caregiver, child]:
+                add(self.registered_subject_model, mommy.prepare(
+                    self.registered_subject_model,
+                    subject_identifier=subject_identifier))
+
+            onschedule, history = self.schedule_objs(caregiver, offstudy)
+            add(self.onschedule_model, onschedule)
+            add(self.history_model, history)
+
+            if died:
+                add('flourish_prn.caregiverdeathreport', mommy.prepare_recipe(
+                    'flourish_prn.caregiverdeathreport',
+                    subject_identifier=caregiver,
+                    report_datetime=self.report_datetime))
+            if offstudy:
+                add('flourish_prn.caregiveroffstudy', mommy.prepare_recipe(
+                    'flourish_prn.caregiveroffstudy',
+                    subject_identifier=caregiver,
+                    report_datetime=self.report_datetime,
+                    offstudy_date=self.report_datetime.date()))
+                add('flourish_prn.childoffstudy', mommy.prepare_recipe(
+                    'flourish_prn.childoffstudy',
+                    subject_identifier=child,
+                    report_datetime=self.report_datetime,
+                    offstudy_date=self.report_datetime.date()))
+
+        # dict keeps insertion order, so consents are written before the
+        # child consents that reference them.
+        for model, model_objs in objs.items():
+            self.bulk_create(model, model_objs)
+
+    def create(self, start=0, progress=None):
+        """ Creates `subjects` caregivers numbered from `start`, calling
+            `progress(created)` after each batch.
+        """
+        stop = start + self.subjects
+        for batch_start in range(start, stop, self.batch_size):
+            self.create_batch(
+                batch_start, min(batch_start + self.batch_size, stop))
+            if progress:
+                progress(min(batch_start + self.batch_size, stop) - start)
+        prn_status_updater.rebuild()
+        return self.counts
+
+
+class Command(BaseCommand):
+
+    help = ('Generates a synthetic cohort of caregivers and children with '
+            'consents, schedules and PRN records for load testing. '
+            'Never run against a live database.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'subjects',
+            type=int,
+            help='Number of caregivers to create, each with one child.')
+        parser.add_argument(
+            '--start',
+            type=int,
+            default=0,
+            help='First subject number, to add to an existing cohort.')
+        parser.add_argument(
+            '--prefix',
+            default='B999',
+            help='Subject identifier prefix, the first of its parts.')
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000)
+        parser.add_argument(
+            '--offstudy-ratio',
+            type=float,
+            default=0.1,
+            help='Share of subjects taken off study.')
+        parser.add_argument(
+            '--death-ratio',
+            type=float,
+            default=0.01,
+            help='Share of caregivers with a death report.')
+        parser.add_argument(
+            '--seed',
+            type=int,
+            help='Random seed, for a reproducible cohort.')
+
+    def handle(self, *args, **options):
+        if options.get('subjects') < 1:
+            raise CommandError('Expected at least one subject.')
+        if '-' in options.get('prefix'):
+            raise CommandError('The prefix must not contain a hyphen.')
+        try:
+            import model_mommy  # noqa
+        except ImportError:
+            raise CommandError(
+                'Generating a synthetic cohort requires model_mommy, '
+                'install flourish-prn[synthetic].')
+
+        cohort = SyntheticCohort(
+            options.get('subjects'),
+            batch_size=options.get('batch_size'),
+            prefix=options.get('prefix'),
+            offstudy_ratio=options.get('offstudy_ratio'),
+            death_ratio=options.get('death_ratio'),
+            seed=options.get('seed'))
+        counts = cohort.create(
+            start=options.get('start'),
+            progress=lambda created: self.stdout.write(
+                f'{created} subject(s) created.'))
+
+        for model, count in counts.items():
+            self.stdout.write(f'{model}: {count}')
+        self.stdout.write(self.style.SUCCESS('Synthetic cohort created.'))
@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from ...helper_classes import offstudy_task_queue
+
+
+class Command(BaseCommand):
+
+    help = ('Processes due off-study tasks, including retries and tasks '
+            'left running past their lease.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--poll',
+            action='store_true',
+            help='Keep polling for due tasks instead of exiting.')
+        parser.add_argument(
+            '--sleep',
+            type=int,
+            default=30,
+            help='Seconds to wait between polls.')
+
+    def handle(self, *args, **options):
+        while True:
+            processed = offstudy_task_queue.process_due()
+            if processed:
+                self.stdout.write(f'Processed {processed} off study task(s).')
+            if not options.get('poll'):
+                break
+            time.sleep(options.get('sleep'))
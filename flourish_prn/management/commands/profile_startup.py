@@ -0,0 +1,134 @@
+import json
+import os
+import re
+import subprocess
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+IMPORTTIME_LINE = re.compile(
+    r'^import time:\s+(?P<self>\d+)\s+\|\s+(?P<cumulative>\d+)\s+\|'
+    r'(?P<indent>\s+)(?P<module>\S+)\s*$')
+
+
+def parse_importtime(output):
+    """ Returns a dict of module to (self, cumulative) import time in
+        microseconds from the stderr of `python -X importtime`.
+    """
+    modules = {}
+    for line in output.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            modules[match.group('module')] = (
+                int(match.group('self')), int(match.group('cumulative')))
+    return modules
+
+
+def profile_startup(settings_module, python=sys.executable):
+    """ Returns the import times of a fresh interpreter running
+        `django.setup()` with `settings_module`.
+    """
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings_module)
+    completed = subprocess.run(
+        [python, '-X', 'importtime', '-c', 'import django; django.setup()'],
+        env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True)
+    if completed.returncode:
+        raise CommandError(
+            f'django.setup() failed.\n{completed.stderr[-2000:]}')
+    return parse_importtime(completed.stderr)
+
+
+class Command(BaseCommand):
+
+    help = ('Reports import time per module of django.setup() in the '
+            'style of `python -X importtime`, optionally checking for '
+            'regressions against a stored baseline.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--settings-module',
+            default=os.environ.get('DJANGO_SETTINGS_MODULE'),
+            help='Settings to profile, defaults to DJANGO_SETTINGS_MODULE.')
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=30,
+            help='Number of slowest modules to report.')
+        parser.add_argument(
+            '--baseline',
+            help='Baseline JSON file to check against.')
+        parser.add_argument(
+            '--save-baseline',
+            action='store_true',
+            help='Write this run to --baseline instead of checking it.')
+        parser.add_argument(
+            '--tolerance',
+            type=float,
+            default=0.2,
+            help='Allowed slowdown over the baseline, 0.2 is 20%%.')
+        parser.add_argument(
+            '--min-delta-ms',
+            type=float,
+            default=10.0,
+            help='Ignore slowdowns smaller than this many milliseconds.')
+
+    def handle(self, *args, **options):
+        if not options.get('settings_module'):
+            raise CommandError('No settings module given.')
+        modules = profile_startup(options.get('settings_module'))
+        total = sum(self_us for self_us, _ in modules.values())
+
+        self.stdout.write(f'{"self [ms]":>10} {"cumulative [ms]":>16}  module')
+        slowest = sorted(modules.items(), key=lambda item: -item[1][1])
+        for module, (self_us, cumulative_us) in slowest[:options.get('top')]:
+            self.stdout.write(
+                f'{self_us / 1000:>10.1f} {cumulative_us / 1000:>16.1f}  '
+                f'{module}')
+        self.stdout.write(
+            f'{len(modules)} modules imported in {total / 1000:.1f} ms.')
+
+        baseline_path = options.get('baseline')
+        if not baseline_path:
+            return
+        if options.get('save_baseline'):
+            with open(baseline_path, 'w') as f:
+                json.dump({'total': total,
+                           'modules': {module: cumulative_us for module, (
+                               _, cumulative_us) in modules.items()}},
+                          f, indent=2, sort_keys=True)
+            self.stdout.write(self.style.SUCCESS(
+                f'Baseline written to {baseline_path}.'))
+            return
+
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+        regressions = self.regressions(
+            total, modules, baseline, options.get('tolerance'),
+            options.get('min_delta_ms') * 1000)
+        for name, before, after in regressions:
+            self.stdout.write(self.style.ERROR(
+                f'{name}: {before / 1000:.1f} ms -> {after / 1000:.1f} ms'))
+        if regressions:
+            raise CommandError(
+                f'{len(regressions)} startup import regression(s) against '
+                f'{baseline_path}.')
+        self.stdout.write(self.style.SUCCESS(
+            'No startup import regressions.'))
+
+    def regressions(self, total, modules, baseline, tolerance, min_delta):
+        """ Returns (name, baseline us, current us) for the total and each
+            module, including new modules, slower than the baseline.
+        """
+        current = {module: cumulative_us
+                   for module, (_, cumulative_us) in modules.items()}
+        current['<total>'] = total
+        before = dict(baseline.get('modules', {}),
+                      **{'<total>': baseline.get('total', 0)})
+        regressions = []
+        for name, after in sorted(current.items()):
+            previous = before.get(name, 0)
+            if (after - previous > min_delta
+                    and after > previous * (1 + tolerance)):
+                regressions.append((name, previous, after))
+        return regressions
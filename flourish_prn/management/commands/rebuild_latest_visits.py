@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from ...helper_classes import latest_visit_index
+
+
+class Command(BaseCommand):
+
+    help = ('Checks the latest visit per subject index against the visit '
+            'models and rebuilds it.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only report subjects whose indexed latest visit is stale.')
+
+    def handle(self, *args, **options):
+        for visit_model in latest_visit_index.visit_models:
+            if options.get('check'):
+                stale = latest_visit_index.check(visit_model)
+                style = self.style.WARNING if stale else self.style.SUCCESS
+                self.stdout.write(style(
+                    f'{visit_model}: {len(stale)} stale subject(s).'))
+                for subject_identifier in sorted(stale):
+                    self.stdout.write(f'  {subject_identifier}')
+            else:
+                indexed = latest_visit_index.rebuild(visit_model)
+                self.stdout.write(self.style.SUCCESS(
+                    f'{visit_model}: indexed {indexed} subject(s).'))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from ...helper_classes import prn_status_updater
+
+
+class Command(BaseCommand):
+
+    help = 'Rebuilds the subject PRN status table from the PRN models.'
+
+    def handle(self, *args, **options):
+        created = prn_status_updater.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt PRN status for {created} subject(s).'))
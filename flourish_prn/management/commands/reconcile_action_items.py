@@ -0,0 +1,60 @@
+from django.core.management.base import BaseCommand
+
+from ...helper_classes import action_item_reconciler
+
+
+class Command(BaseCommand):
+
+    help = ('Reports off-study action items missing after a caregiver '
+            'death report and duplicate singleton PRN action items, '
+            'optionally fixing them.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--create-missing',
+            action='store_true',
+            help='Create the missing action items.')
+
+        parser.add_argument(
+            '--close-duplicates',
+            action='store_true',
+            help='Close NEW duplicates, keeping the earliest action item.')
+
+        parser.add_argument(
+            '--verbose-subjects',
+            action='store_true',
+            help='List the subject identifiers affected.')
+
+    def handle(self, *args, **options):
+        missing = action_item_reconciler.missing()
+        for (source, target), subject_identifiers in missing.items():
+            self.stdout.write(self.style.WARNING(
+                f'{len(subject_identifiers)} subject(s) with {source} '
+                f'missing a {target} action item.'))
+            self.write_subjects(subject_identifiers, options)
+
+        duplicates = action_item_reconciler.duplicates()
+        for action_name, subject_identifiers in duplicates.items():
+            self.stdout.write(self.style.WARNING(
+                f'{len(subject_identifiers)} subject(s) with duplicate '
+                f'{action_name} action items.'))
+            self.write_subjects(subject_identifiers, options)
+
+        if not missing and not duplicates:
+            self.stdout.write(self.style.SUCCESS(
+                'PRN action items are reconciled.'))
+
+        if missing and options.get('create_missing'):
+            created = action_item_reconciler.create_missing(missing)
+            self.stdout.write(self.style.SUCCESS(
+                f'Created {created} action item(s).'))
+
+        if duplicates and options.get('close_duplicates'):
+            closed = action_item_reconciler.close_duplicates(duplicates)
+            self.stdout.write(self.style.SUCCESS(
+                f'Closed {closed} duplicate action item(s).'))
+
+    def write_subjects(self, subject_identifiers, options):
+        if options.get('verbose_subjects'):
+            for subject_identifier in sorted(subject_identifiers):
+                self.stdout.write(f'  {subject_identifier}')
@@ -0,0 +1,149 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import connection
+from django.dispatch import receiver
+
+logger = logging.getLogger(__name__)
+
+CONSENT_VERSION_PHASE = 'consent_version'
+ACTION_ITEM_PHASE = 'action_item'
+TAKE_OFF_SCHEDULE_PHASE = 'take_off_schedule'
+SIGNALS_PHASE = 'signals'
+HISTORY_PHASE = 'history'
+SAVE_PHASE = 'save'
+
+# Seconds a phase may take before it is logged, override per phase with
+# settings.FLOURISH_PRN_SAVE_PHASE_THRESHOLDS.
+DEFAULT_THRESHOLDS = {
+    CONSENT_VERSION_PHASE: 0.2,
+    ACTION_ITEM_PHASE: 0.5,
+    TAKE_OFF_SCHEDULE_PHASE: 1.0,
+    SIGNALS_PHASE: 0.5,
+    HISTORY_PHASE: 0.2,
+    SAVE_PHASE: 2.0,
+}
+
+
+class MetricsRegistry:
+    """ In-process totals of the duration and query count of each PRN
+        save phase, per model.
+
+    Phases nest: `save` covers the whole model save, including the
+    action item, signal and history phases run within it.
+
+    Totals are kept per process. Under a multi-process server each worker
+    has its own registry, and a scrape of `/metrics/` returns the totals of
+    whichever worker answered it, so sum them per instance in Prometheus
+    or scrape each worker.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.metrics = {}
+
+    def record(self, phase, model, seconds, queries):
+        with self.lock:
+            calls, total, max_seconds, total_queries = self.metrics.get(
+                (phase, model), (0, 0.0, 0.0, 0))
+            self.metrics[(phase, model)] = (
+                calls + 1, total + seconds, max(max_seconds, seconds),
+                total_queries + queries)
+
+    def reset(self):
+        with self.lock:
+            self.metrics = {}
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.metrics)
+
+    def render_prometheus(self):
+        """ Returns the metrics in the Prometheus text exposition format.
+        """
+        metrics = sorted(self.snapshot().items())
+        lines = []
+        for name, metric_type, help_text, index in [
+                ('calls_total', 'counter', 'Number of times a phase ran.', 0),
+                ('seconds_total', 'counter', 'Total seconds spent.', 1),
+                ('seconds_max', 'gauge', 'Slowest run in seconds.', 2),
+                ('queries_total', 'counter', 'Total queries run.', 3)]:
+            metric = f'flourish_prn_save_phase_{name}'
+            lines.append(f'# HELP {metric} {help_text}')
+            lines.append(f'# TYPE {metric} {metric_type}')
+            for (phase, model), values in metrics:
+                lines.append(
+                    f'{metric}{{model="{model}",phase="{phase}"}} '
+                    f'{values[index]}')
+        return '\n'.join(lines) + '\n'
+
+
+save_metrics = MetricsRegistry()
+
+
+def metrics_enabled():
+    return getattr(settings, 'FLOURISH_PRN_SAVE_METRICS', True)
+
+
+@lru_cache(maxsize=None)
+def thresholds():
+    return dict(
+        DEFAULT_THRESHOLDS,
+        **getattr(settings, 'FLOURISH_PRN_SAVE_PHASE_THRESHOLDS', {}))
+
+
+@receiver(setting_changed)
+def clear_thresholds(setting=None, **kwargs):
+    if setting == 'FLOURISH_PRN_SAVE_PHASE_THRESHOLDS':
+        thresholds.cache_clear()
+
+
+def threshold(phase):
+    return thresholds().get(phase)
+
+
+@contextmanager
+def instrument(phase, model):
+    """ Records the duration and query count of the enclosed block as
+        `phase` of saving `model`, logging it if over the threshold.
+    """
+    if not metrics_enabled():
+        yield
+        return
+
+    queries = [0]
+
+    def count_queries(execute, sql, params, many, context):
+        queries[0] += 1
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    try:
+        with connection.execute_wrapper(count_queries):
+            yield
+    finally:
+        seconds = time.perf_counter() - started
+        save_metrics.record(phase, model, seconds, queries[0])
+        limit = threshold(phase)
+        if limit is not None and seconds > limit:
+            logger.warning(
+                f'Slow {phase} saving {model}: {seconds:.3f}s, '
+                f'{queries[0]} queries, threshold {limit}s.')
+
+
+def instrumented(phase):
+    """ Decorates a signal receiver to record it as `phase` of saving
+        the sender's model.
+    """
+    def decorator(receiver):
+        @wraps(receiver)
+        def wrapper(sender, *args, **kwargs):
+            with instrument(phase, sender._meta.label_lower):
+                return receiver(sender, *args, **kwargs)
+        return wrapper
+    return decorator
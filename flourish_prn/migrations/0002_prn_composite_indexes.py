@@ -0,0 +1,175 @@
+# Composite indexes for the PRN subject lookups.
+#
+# The death report, TB referral and missed birth visit models predate
+# this migration history and are missing from its state. They are added
+# to the state here, their tables are only created where missing, and
+# the indexes declared in their Meta are then added with AddIndex.
+
+import _socket
+from django.db import migrations, models
+import django.core.validators
+import django.db.models.deletion
+import django_revision.revision_field
+import edc_base.model_fields.custom_fields
+import edc_base.model_fields.hostname_modification_field
+import edc_base.model_fields.userfield
+import edc_base.model_fields.uuid_auto_field
+import edc_base.model_validators.date
+import edc_base.utils
+import edc_constants.choices
+import edc_protocol.validators
+
+import flourish_prn.choices
+
+STATE_MODELS = ['caregiverdeathreport', 'childdeathreport', 'tbreferaladol',
+                'missedbirthvisit']
+
+
+def base_fields():
+    return [
+        ('created', models.DateTimeField(blank=True, default=edc_base.utils.get_utcnow)),
+        ('modified', models.DateTimeField(blank=True, default=edc_base.utils.get_utcnow)),
+        ('user_created', edc_base.model_fields.userfield.UserField(blank=True, help_text='Updated by admin.save_model', max_length=50, verbose_name='user created')),
+        ('user_modified', edc_base.model_fields.userfield.UserField(blank=True, help_text='Updated by admin.save_model', max_length=50, verbose_name='user modified')),
+        ('hostname_created', models.CharField(blank=True, default=_socket.gethostname, help_text='System field. (modified on create only)', max_length=60)),
+        ('hostname_modified', edc_base.model_fields.hostname_modification_field.HostnameModificationField(blank=True, help_text='System field. (modified on every save)', max_length=50)),
+        ('revision', django_revision.revision_field.RevisionField(blank=True, editable=False, help_text='System field. Git repository tag:branch:commit.', max_length=75, null=True, verbose_name='Revision')),
+        ('device_created', models.CharField(blank=True, max_length=10)),
+        ('device_modified', models.CharField(blank=True, max_length=10)),
+        ('id', edc_base.model_fields.uuid_auto_field.UUIDAutoField(blank=True, editable=False, help_text='System auto field. UUID primary key.', primary_key=True, serialize=False)),
+        ('action_identifier', models.CharField(max_length=25, null=True)),
+        ('subject_identifier', models.CharField(max_length=50)),
+        ('tracking_identifier', models.CharField(max_length=30, null=True)),
+        ('related_tracking_identifier', models.CharField(max_length=30, null=True)),
+        ('parent_tracking_identifier', models.CharField(max_length=30, null=True)),
+    ]
+
+
+def report_datetime_field():
+    return ('report_datetime', models.DateTimeField(default=edc_base.utils.get_utcnow, help_text="If reporting today, use today's date/time, otherwise use the date/time this information was reported.", validators=[edc_protocol.validators.datetime_not_before_study_start, edc_base.model_validators.date.datetime_not_future], verbose_name='Report Date'))
+
+
+def death_report_fields():
+    return base_fields() + [
+        ('slug', models.CharField(db_index=True, default='', editable=False, help_text='a field used for quick search', max_length=250, null=True)),
+        ('site', models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, to='sites.site')),
+        report_datetime_field(),
+        ('death_date', models.DateField(validators=[edc_base.model_validators.date.date_not_future], verbose_name='Date of Death:')),
+        ('cause', models.CharField(choices=flourish_prn.choices.SOURCE_OF_DEATH_INFO, max_length=100, verbose_name='what is the primary source of  cause of death information? (if multiple source of information, list one with the smallest number closest to the top of the list)')),
+        ('cause_other', edc_base.model_fields.custom_fields.OtherCharField(blank=True, max_length=100, null=True, verbose_name='If Other, specify ...')),
+        ('perform_autopsy', models.CharField(choices=edc_constants.choices.YES_NO, max_length=3, verbose_name='Will an autopsy be performed later')),
+        ('death_cause', models.TextField(blank=True, help_text='Note: Cardiac and pulmonary arrest are not major reasons and should not be used to describe major cause', null=True, verbose_name='Describe the major cause of death (including pertinent autopsy information if available), starting with the first noticeable illness thought to be  related to death, continuing to time of death.')),
+        ('cause_category', models.CharField(choices=flourish_prn.choices.CAUSE_OF_DEATH_CAT, max_length=50, verbose_name='based on the description above, what category best defines the major cause of death?')),
+        ('cause_category_other', edc_base.model_fields.custom_fields.OtherCharField(blank=True, max_length=35, null=True, verbose_name='If Other, specify ...')),
+        ('illness_duration', models.IntegerField(help_text='in days (If unknown enter -1)', verbose_name='Duration of acute illness directly causing death')),
+        ('medical_responsibility', models.CharField(choices=flourish_prn.choices.MED_RESPONSIBILITY, max_length=50, verbose_name='Who was responsible for primary medical care of the participant during the month prior to death?')),
+        ('participant_hospitalized', models.CharField(choices=edc_constants.choices.YES_NO, max_length=3, verbose_name='Was the participant hospitalised before death?')),
+        ('reason_hospitalized', models.CharField(blank=True, choices=flourish_prn.choices.HOSPITILIZATION_REASONS, max_length=70, null=True, verbose_name='if yes, hospitalized, what was the primary reason for hospitalisation? ')),
+        ('reason_hospitalized_other', models.TextField(blank=True, max_length=250, null=True, verbose_name='if other illness or pathogen specify or non infectious reason, please specify below:')),
+        ('days_hospitalized', models.IntegerField(default=0, help_text='in days', verbose_name='For how many days was the participant hospitalised during the illness immediately before death? ')),
+        ('comment', models.TextField(blank=True, max_length=500, null=True, verbose_name='Comments')),
+    ]
+
+
+def create_missing_tables(apps, schema_editor):
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        tables = connection.introspection.table_names(cursor)
+    for model_name in STATE_MODELS:
+        model_cls = apps.get_model('flourish_prn', model_name)
+        if model_cls._meta.db_table not in tables:
+            schema_editor.create_model(model_cls)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0002_alter_domain_unique'),
+        ('flourish_prn', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='CaregiverDeathReport',
+                    fields=death_report_fields(),
+                    options={
+                        'verbose_name': 'Death Report',
+                    },
+                ),
+                migrations.CreateModel(
+                    name='ChildDeathReport',
+                    fields=death_report_fields() + [
+                        ('haart_relationship', models.CharField(choices=flourish_prn.choices.RELATIONSHIP_CHOICES, max_length=20, verbose_name="Relationship between the infant's death and HAART ")),
+                        ('trad_med_relationship', models.CharField(choices=flourish_prn.choices.RELATIONSHIP_CHOICES, max_length=20, verbose_name="Relationship between the infant's death and traditional medicine use ")),
+                    ],
+                    options={
+                        'verbose_name': 'Child Death Report',
+                    },
+                ),
+                migrations.CreateModel(
+                    name='TbReferalAdol',
+                    fields=base_fields() + [
+                        ('report_datetime', models.DateTimeField(default=edc_base.utils.get_utcnow, null=True, verbose_name='Report datetime')),
+                        ('referral_date', models.DateField(verbose_name='Date of referral')),
+                        ('location', models.CharField(choices=flourish_prn.choices.LOCATION_REFERRAL, max_length=15, verbose_name='Location of referral')),
+                        ('location_other', edc_base.model_fields.custom_fields.OtherCharField(blank=True, max_length=35, null=True, verbose_name='If Other, specify ...')),
+                    ],
+                    options={
+                        'verbose_name': 'TB Adol Referral',
+                        'verbose_name_plural': 'TB Adol Referral',
+                    },
+                ),
+                migrations.CreateModel(
+                    name='MissedBirthVisit',
+                    fields=base_fields() + [
+                        report_datetime_field(),
+                        ('infant_dob', models.DateField(blank=True, null=True, validators=[edc_base.model_validators.date.date_not_future], verbose_name='Date of birth')),
+                        ('weight_avail', models.CharField(choices=edc_constants.choices.YES_NO, default='Yes', help_text="If 'No' go to question 4. Otherwise continue", max_length=3, verbose_name="Is the infant's birth weight available?")),
+                        ('weight_kg', models.DecimalField(blank=True, decimal_places=2, help_text='Measured in Kilograms (kg)', max_digits=3, null=True, validators=[django.core.validators.MinValueValidator(0.5), django.core.validators.MaxValueValidator(5.0)], verbose_name="What was the infant's birth weight? ")),
+                        ('length_avail', models.CharField(choices=edc_constants.choices.YES_NO, default='Yes', help_text="If 'No' go to question 6. Otherwise continue", max_length=3, verbose_name="Is the infant's length at birth available?")),
+                        ('infant_length', models.DecimalField(blank=True, decimal_places=2, help_text='Measured in centimeters, (cm)', max_digits=4, null=True, validators=[django.core.validators.MinValueValidator(20), django.core.validators.MaxValueValidator(70)], verbose_name="What was the infant's length at birth? ")),
+                        ('head_circ_avail', models.CharField(choices=edc_constants.choices.YES_NO, default='Yes', help_text="If 'No' go to question 8. Otherwise continue", max_length=3, verbose_name="Is the infant's head circumference at birth available?")),
+                        ('head_circumference', models.DecimalField(blank=True, decimal_places=2, help_text='Measured in centimeters, (cm)', max_digits=4, null=True, validators=[django.core.validators.MinValueValidator(11), django.core.validators.MaxValueValidator(54)], verbose_name='What was the head circumference in centimeters? ')),
+                        ('gestational_age', models.DecimalField(decimal_places=2, max_digits=8, null=True, verbose_name="What is the infant's determined gestational age: ")),
+                        ('apgar_score', models.CharField(choices=edc_constants.choices.YES_NO, help_text="If 'No' go to question 13. Otherwise continue", max_length=3, verbose_name='Was Apgar Score performed? ')),
+                        ('apgar_score_min_1', models.IntegerField(blank=True, null=True, validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(10)], verbose_name='At 1 minute: ')),
+                        ('apgar_score_min_5', models.IntegerField(blank=True, null=True, validators=[django.core.validators.MaxValueValidator(10), django.core.validators.MinValueValidator(0)], verbose_name='At 5 minutes: ')),
+                        ('apgar_score_min_10', models.IntegerField(blank=True, null=True, validators=[django.core.validators.MaxValueValidator(10), django.core.validators.MinValueValidator(0)], verbose_name='At 10 minutes: ')),
+                        ('congenital_anomalities', models.CharField(choices=edc_constants.choices.YES_NO, help_text="If 'Yes' please complete the Congenital Anomalies below", max_length=3, verbose_name='Were any congenital anomalies identified? ')),
+                        ('congenital_anomalities_info', models.TextField(blank=True, max_length=255, null=True, verbose_name='Please add congenital anomalies')),
+                    ],
+                    options={
+                        'verbose_name': 'Missed Birth Visit Form',
+                        'verbose_name_plural': 'Missed Birth Visit Form',
+                    },
+                ),
+            ],
+        ),
+        migrations.RunPython(create_missing_tables, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='caregiverdeathreport',
+            index=models.Index(fields=['subject_identifier', 'report_datetime'], name='prn_cgdeath_subj_rdt_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='childdeathreport',
+            index=models.Index(fields=['subject_identifier', 'report_datetime'], name='prn_chdeath_subj_rdt_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tbreferaladol',
+            index=models.Index(fields=['subject_identifier', 'report_datetime'], name='prn_tbref_subj_rdt_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='missedbirthvisit',
+            index=models.Index(fields=['subject_identifier', 'report_datetime'], name='prn_missedbv_subj_rdt_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicalcaregiveroffstudy',
+            index=models.Index(fields=['subject_identifier', 'report_datetime'], name='prn_h_cgoff_subj_rdt_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicalchildoffstudy',
+            index=models.Index(fields=['subject_identifier', 'report_datetime'], name='prn_h_choff_subj_rdt_idx'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+import _socket
+from django.db import migrations, models
+import django_revision.revision_field
+import edc_base.model_fields.hostname_modification_field
+import edc_base.model_fields.userfield
+import edc_base.model_fields.uuid_auto_field
+import edc_base.utils
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('flourish_prn', '0004_exportwatermark'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OffStudyTask',
+            fields=[
+                ('created', models.DateTimeField(blank=True, default=edc_base.utils.get_utcnow)),
+                ('modified', models.DateTimeField(blank=True, default=edc_base.utils.get_utcnow)),
+                ('user_created', edc_base.model_fields.userfield.UserField(blank=True, help_text='Updated by admin.save_model', max_length=50, verbose_name='user created')),
+                ('user_modified', edc_base.model_fields.userfield.UserField(blank=True, help_text='Updated by admin.save_model', max_length=50, verbose_name='user modified')),
+                ('hostname_created', models.CharField(blank=True, default=_socket.gethostname, help_text='System field. (modified on create only)', max_length=60)),
+                ('hostname_modified', edc_base.model_fields.hostname_modification_field.HostnameModificationField(blank=True, help_text='System field. (modified on every save)', max_length=50)),
+                ('revision', django_revision.revision_field.RevisionField(blank=True, editable=False, help_text='System field. Git repository tag:branch:commit.', max_length=75, null=True, verbose_name='Revision')),
+                ('device_created', models.CharField(blank=True, max_length=10)),
+                ('device_modified', models.CharField(blank=True, max_length=10)),
+                ('id', edc_base.model_fields.uuid_auto_field.UUIDAutoField(blank=True, editable=False, help_text='System auto field. UUID primary key.', primary_key=True, serialize=False)),
+                ('model', models.CharField(max_length=100, verbose_name='Off-study model')),
+                ('subject_identifier', models.CharField(db_index=True, max_length=50, verbose_name='Subject Identifier')),
+                ('task', models.CharField(choices=[('take_off_schedule', 'Take off schedule'), ('remove_fu_notes', 'Remove follow up schedule notes'), ('remove_tb_schedules', 'Remove TB adolescent schedules')], max_length=25, verbose_name='Task')),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('complete', 'Complete'), ('failed', 'Failed')], default='queued', max_length=15, verbose_name='Status')),
+                ('attempts', models.IntegerField(default=0, verbose_name='Attempts')),
+                ('next_attempt_datetime', models.DateTimeField(default=edc_base.utils.get_utcnow, verbose_name='Next attempt')),
+                ('claimed_datetime', models.DateTimeField(blank=True, null=True, verbose_name='Claimed')),
+                ('last_error', models.TextField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Off Study Task',
+                'verbose_name_plural': 'Off Study Tasks',
+                'ordering': ('created',),
+            },
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('flourish_prn', '0007_subjectlatestvisit'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='subjectprnstatus',
+            name='tb_referral_date',
+            field=models.DateField(blank=True, null=True, verbose_name='TB adol referral date'),
+        ),
+    ]
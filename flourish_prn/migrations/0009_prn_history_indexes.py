@@ -0,0 +1,196 @@
+# Composite (subject_identifier, report_datetime) indexes for the TB adol
+# off-study form and the death report and TB adol off-study history.
+#
+# Like the models added in 0002, these predate this migration history.
+# They are added to the state here, their tables are only created where
+# missing, and the indexes declared for them are then added with
+# AddIndex.
+
+import _socket
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.db.models.manager
+import django_revision.revision_field
+import edc_base.model_fields.custom_fields
+import edc_base.model_fields.hostname_modification_field
+import edc_base.model_fields.userfield
+import edc_base.model_fields.uuid_auto_field
+import edc_base.model_validators.date
+import edc_base.sites.managers
+import edc_base.utils
+import edc_constants.choices
+import edc_protocol.validators
+import simple_history.models
+
+import flourish_prn.choices
+
+STATE_MODELS = ['tbadoloffstudy', 'historicalcaregiverdeathreport',
+                'historicalchilddeathreport', 'historicaltbadoloffstudy']
+
+
+def base_fields():
+    return [
+        ('created', models.DateTimeField(blank=True, default=edc_base.utils.get_utcnow)),
+        ('modified', models.DateTimeField(blank=True, default=edc_base.utils.get_utcnow)),
+        ('user_created', edc_base.model_fields.userfield.UserField(blank=True, help_text='Updated by admin.save_model', max_length=50, verbose_name='user created')),
+        ('user_modified', edc_base.model_fields.userfield.UserField(blank=True, help_text='Updated by admin.save_model', max_length=50, verbose_name='user modified')),
+        ('hostname_created', models.CharField(blank=True, default=_socket.gethostname, help_text='System field. (modified on create only)', max_length=60)),
+        ('hostname_modified', edc_base.model_fields.hostname_modification_field.HostnameModificationField(blank=True, help_text='System field. (modified on every save)', max_length=50)),
+        ('revision', django_revision.revision_field.RevisionField(blank=True, editable=False, help_text='System field. Git repository tag:branch:commit.', max_length=75, null=True, verbose_name='Revision')),
+        ('device_created', models.CharField(blank=True, max_length=10)),
+        ('device_modified', models.CharField(blank=True, max_length=10)),
+        ('id', edc_base.model_fields.uuid_auto_field.UUIDAutoField(blank=True, editable=False, help_text='System auto field. UUID primary key.', primary_key=True, serialize=False)),
+        ('action_identifier', models.CharField(max_length=25, null=True)),
+        ('subject_identifier', models.CharField(max_length=50)),
+        ('tracking_identifier', models.CharField(max_length=30, null=True)),
+        ('related_tracking_identifier', models.CharField(max_length=30, null=True)),
+        ('parent_tracking_identifier', models.CharField(max_length=30, null=True)),
+    ]
+
+
+def report_datetime_field():
+    return ('report_datetime', models.DateTimeField(default=edc_base.utils.get_utcnow, help_text="If reporting today, use today's date/time, otherwise use the date/time this information was reported.", validators=[edc_protocol.validators.datetime_not_before_study_start, edc_base.model_validators.date.datetime_not_future], verbose_name='Report Date'))
+
+
+def death_report_fields():
+    return base_fields() + [
+        ('slug', models.CharField(db_index=True, default='', editable=False, help_text='a field used for quick search', max_length=250, null=True)),
+        ('site', models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, to='sites.site')),
+        report_datetime_field(),
+        ('death_date', models.DateField(validators=[edc_base.model_validators.date.date_not_future], verbose_name='Date of Death:')),
+        ('cause', models.CharField(choices=flourish_prn.choices.SOURCE_OF_DEATH_INFO, max_length=100, verbose_name='what is the primary source of  cause of death information? (if multiple source of information, list one with the smallest number closest to the top of the list)')),
+        ('cause_other', edc_base.model_fields.custom_fields.OtherCharField(blank=True, max_length=100, null=True, verbose_name='If Other, specify ...')),
+        ('perform_autopsy', models.CharField(choices=edc_constants.choices.YES_NO, max_length=3, verbose_name='Will an autopsy be performed later')),
+        ('death_cause', models.TextField(blank=True, help_text='Note: Cardiac and pulmonary arrest are not major reasons and should not be used to describe major cause', null=True, verbose_name='Describe the major cause of death (including pertinent autopsy information if available), starting with the first noticeable illness thought to be  related to death, continuing to time of death.')),
+        ('cause_category', models.CharField(choices=flourish_prn.choices.CAUSE_OF_DEATH_CAT, max_length=50, verbose_name='based on the description above, what category best defines the major cause of death?')),
+        ('cause_category_other', edc_base.model_fields.custom_fields.OtherCharField(blank=True, max_length=35, null=True, verbose_name='If Other, specify ...')),
+        ('illness_duration', models.IntegerField(help_text='in days (If unknown enter -1)', verbose_name='Duration of acute illness directly causing death')),
+        ('medical_responsibility', models.CharField(choices=flourish_prn.choices.MED_RESPONSIBILITY, max_length=50, verbose_name='Who was responsible for primary medical care of the participant during the month prior to death?')),
+        ('participant_hospitalized', models.CharField(choices=edc_constants.choices.YES_NO, max_length=3, verbose_name='Was the participant hospitalised before death?')),
+        ('reason_hospitalized', models.CharField(blank=True, choices=flourish_prn.choices.HOSPITILIZATION_REASONS, max_length=70, null=True, verbose_name='if yes, hospitalized, what was the primary reason for hospitalisation? ')),
+        ('reason_hospitalized_other', models.TextField(blank=True, max_length=250, null=True, verbose_name='if other illness or pathogen specify or non infectious reason, please specify below:')),
+        ('days_hospitalized', models.IntegerField(default=0, help_text='in days', verbose_name='For how many days was the participant hospitalised during the illness immediately before death? ')),
+        ('comment', models.TextField(blank=True, max_length=500, null=True, verbose_name='Comments')),
+    ]
+
+
+def tb_adol_offstudy_fields():
+    subject_identifier = models.CharField(max_length=50, unique=True, verbose_name='Subject Identifier')
+    fields = [(name, subject_identifier if name == 'subject_identifier' else field)
+              for name, field in base_fields()]
+    return fields + [
+        ('offschedule_datetime', models.DateTimeField(default=edc_base.utils.get_utcnow, validators=[edc_protocol.validators.datetime_not_before_study_start, edc_base.model_validators.date.datetime_not_future], verbose_name='Date and time subject taken off schedule')),
+        ('offstudy_date', models.DateField(validators=[edc_protocol.validators.date_not_before_study_start, edc_base.model_validators.date.date_not_future], verbose_name='Off-study Date')),
+        ('reason_other', edc_base.model_fields.custom_fields.OtherCharField(blank=True, max_length=35, null=True, verbose_name='If Other, specify ...')),
+        ('comment', models.TextField(blank=True, max_length=250, null=True, verbose_name='Comment')),
+        report_datetime_field(),
+        ('reason', models.CharField(choices=flourish_prn.choices.CHILD_OFF_STUDY_REASON, max_length=115, verbose_name='Please code the primary reason the participant is being taken off the study')),
+        ('site', models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, to='sites.site')),
+    ]
+
+
+def historical_fields(fields):
+    """ Returns `fields` as simple_history copies them to the historical
+        model, followed by the history fields.
+    """
+    historical = []
+    for name, field in fields:
+        if name == 'id':
+            field = edc_base.model_fields.uuid_auto_field.UUIDAutoField(blank=True, db_index=True, editable=False, help_text='System auto field. UUID primary key.')
+        elif name == 'site':
+            field = models.ForeignKey(blank=True, db_constraint=False, editable=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='sites.site')
+        elif name == 'subject_identifier' and field.unique:
+            field = models.CharField(db_index=True, max_length=50, verbose_name='Subject Identifier')
+        historical.append((name, field))
+    return historical + [
+        ('history_date', models.DateTimeField()),
+        ('history_change_reason', models.CharField(max_length=100, null=True)),
+        ('history_type', models.CharField(choices=[('+', 'Created'), ('~', 'Changed'), ('-', 'Deleted')], max_length=1)),
+        ('history_id', edc_base.model_fields.uuid_auto_field.UUIDAutoField(primary_key=True, serialize=False)),
+        ('history_user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+    ]
+
+
+def historical_options(verbose_name):
+    return {
+        'verbose_name': f'historical {verbose_name}',
+        'ordering': ('-history_date', '-history_id'),
+        'get_latest_by': 'history_date',
+    }
+
+
+def create_missing_tables(apps, schema_editor):
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        tables = connection.introspection.table_names(cursor)
+    for model_name in STATE_MODELS:
+        model_cls = apps.get_model('flourish_prn', model_name)
+        if model_cls._meta.db_table not in tables:
+            schema_editor.create_model(model_cls)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0002_alter_domain_unique'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('flourish_prn', '0008_subjectprnstatus_tb_referral_date'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='TBAdolOffStudy',
+                    fields=tb_adol_offstudy_fields(),
+                    options={
+                        'verbose_name': 'TB Adol Off-Study',
+                        'verbose_name_plural': 'TB Adol Off-Study',
+                    },
+                    managers=[
+                        ('objects', django.db.models.manager.Manager()),
+                        ('on_site', edc_base.sites.managers.CurrentSiteManager()),
+                    ],
+                ),
+                migrations.CreateModel(
+                    name='HistoricalCaregiverDeathReport',
+                    fields=historical_fields(death_report_fields()),
+                    options=historical_options('Death Report'),
+                    bases=(simple_history.models.HistoricalChanges, models.Model),
+                ),
+                migrations.CreateModel(
+                    name='HistoricalChildDeathReport',
+                    fields=historical_fields(death_report_fields() + [
+                        ('haart_relationship', models.CharField(choices=flourish_prn.choices.RELATIONSHIP_CHOICES, max_length=20, verbose_name="Relationship between the infant's death and HAART ")),
+                        ('trad_med_relationship', models.CharField(choices=flourish_prn.choices.RELATIONSHIP_CHOICES, max_length=20, verbose_name="Relationship between the infant's death and traditional medicine use ")),
+                    ]),
+                    options=historical_options('Child Death Report'),
+                    bases=(simple_history.models.HistoricalChanges, models.Model),
+                ),
+                migrations.CreateModel(
+                    name='HistoricalTBAdolOffStudy',
+                    fields=historical_fields(tb_adol_offstudy_fields()),
+                    options=historical_options('TB Adol Off-Study'),
+                    bases=(simple_history.models.HistoricalChanges, models.Model),
+                ),
+            ],
+        ),
+        migrations.RunPython(create_missing_tables, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='tbadoloffstudy',
+            index=models.Index(fields=['subject_identifier', 'report_datetime'], name='prn_tboff_subj_rdt_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicalcaregiverdeathreport',
+            index=models.Index(fields=['subject_identifier', 'report_datetime'], name='prn_h_cgdeath_subj_rdt_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicalchilddeathreport',
+            index=models.Index(fields=['subject_identifier', 'report_datetime'], name='prn_h_chdeath_subj_rdt_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicaltbadoloffstudy',
+            index=models.Index(fields=['subject_identifier', 'report_datetime'], name='prn_h_tboff_subj_rdt_idx'),
+        ),
+    ]
@@ -4,6 +4,12 @@ from .caregiver_off_study import CaregiverOffStudy
 from .child_death_report import ChildDeathReport
 from .child_off_study import ChildOffStudy
 from .death_report_mixin import DeathReportModelMixin
+from .export_job import ExportJob
+from .export_watermark import ExportWatermark
+from .offstudy_task import OffStudyTask
+from .subject_latest_visit import SubjectLatestVisit
+from .subject_prn_status import SubjectPrnStatus
 from .tb_adol_off_study import TBAdolOffStudy
 from .missed_birth_visit import MissedBirthVisit
 from .signals import tb_adol_offstudy_post_save, child_offstudy_on_post_save
+from .signals import screening_consent_version_on_change, consent_version_on_change
@@ -33,3 +33,6 @@ class TbReferalAdol(BaseUuidModel, ActionModelMixin):
         app_label = 'flourish_prn'
         verbose_name = 'TB Adol Referral'
         verbose_name_plural = 'TB Adol Referral'
+        indexes = [
+            models.Index(fields=['subject_identifier', 'report_datetime'],
+                         name='prn_tbref_subj_rdt_idx')]
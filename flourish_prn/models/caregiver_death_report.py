@@ -1,5 +1,5 @@
+from django.db import models
 from edc_action_item.model_mixins.action_model_mixin import ActionModelMixin
-from edc_base.model_managers import HistoricalRecords
 from edc_base.model_mixins import BaseUuidModel
 from edc_base.sites import SiteModelMixin
 from edc_identifier.managers import SubjectIdentifierManager
@@ -7,6 +7,7 @@ from edc_search.model_mixins import SearchSlugModelMixin
 
 from ..action_items import CAREGIVER_DEATH_REPORT_ACTION
 from .death_report_mixin import DeathReportModelMixin
+from .instrumented_history import InstrumentedHistoricalRecords
 
 
 class CaregiverDeathReport(DeathReportModelMixin,
@@ -21,7 +22,9 @@ class CaregiverDeathReport(DeathReportModelMixin,
 
     objects = SubjectIdentifierManager()
 
-    history = HistoricalRecords()
+    history = InstrumentedHistoricalRecords(indexes=[
+        models.Index(fields=['subject_identifier', 'report_datetime'],
+                     name='prn_h_cgdeath_subj_rdt_idx')])
 
     def natural_key(self):
         return (self.subject_identifier,)
@@ -31,3 +34,6 @@ class CaregiverDeathReport(DeathReportModelMixin,
     class Meta:
         app_label = 'flourish_prn'
         verbose_name = 'Death Report'
+        indexes = [
+            models.Index(fields=['subject_identifier', 'report_datetime'],
+                         name='prn_cgdeath_subj_rdt_idx')]
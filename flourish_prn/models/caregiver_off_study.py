@@ -1,6 +1,4 @@
-from django.apps import apps as django_apps
 from django.db import models
-from edc_base.model_managers import HistoricalRecords
 from edc_base.model_mixins import BaseUuidModel
 from edc_base.model_validators.date import datetime_not_future
 from edc_base.utils import get_utcnow
@@ -9,11 +7,12 @@ from edc_protocol.validators import datetime_not_before_study_start
 
 from edc_action_item.model_mixins import ActionModelMixin
 from edc_visit_schedule.model_mixins import OffScheduleModelMixin
-from edc_visit_schedule.site_visit_schedules import site_visit_schedules
 
 from ..action_items import CAREGIVEROFF_STUDY_ACTION
 from ..choices import CAREGIVER_OFF_STUDY_REASON, OFFSTUDY_POINT
+from ..helper_classes import schedule_index
 from .offstudy_model_mixin import OffStudyModelMixin
+from .instrumented_history import InstrumentedHistoricalRecords
 
 
 class CaregiverOffStudy(OffStudyModelMixin, OffScheduleModelMixin,
@@ -47,26 +46,22 @@ class CaregiverOffStudy(OffStudyModelMixin, OffScheduleModelMixin,
 
     objects = SubjectIdentifierManager()
 
-    history = HistoricalRecords()
+    history = InstrumentedHistoricalRecords(indexes=[
+        models.Index(fields=['subject_identifier', 'report_datetime'],
+                     name='prn_h_cgoff_subj_rdt_idx')])
 
-    def take_off_schedule(self):
-        history_model = 'edc_visit_schedule.subjectschedulehistory'
-        history_cls = django_apps.get_model(history_model)
-        onschedules = history_cls.objects.onschedules(
-            subject_identifier=self.subject_identifier,
+    def take_off_onschedules(self):
+        onschedules = self.get_onschedules(
             report_datetime=self.report_datetime)
 
-        if onschedules:
-            for onschedule in onschedules:
-                _, schedule = \
-                    site_visit_schedules.get_by_onschedule_model_schedule_name(
-                        onschedule_model=onschedule._meta.label_lower,
-                        name=onschedule.schedule_name)
+        for onschedule_model, schedule_name in onschedules:
+            _, schedule = schedule_index.get_by_onschedule_model_schedule_name(
+                onschedule_model=onschedule_model, name=schedule_name)
 
-                schedule.take_off_schedule(
-                    subject_identifier=self.subject_identifier,
-                    offschedule_datetime=self.report_datetime,
-                    schedule_name=onschedule.schedule_name)
+            schedule.take_off_schedule(
+                subject_identifier=self.subject_identifier,
+                offschedule_datetime=self.report_datetime,
+                schedule_name=schedule_name)
 
     class Meta:
         app_label = 'flourish_prn'
@@ -1,6 +1,5 @@
 from django.db import models
 from edc_action_item.model_mixins.action_model_mixin import ActionModelMixin
-from edc_base.model_managers import HistoricalRecords
 from edc_base.model_mixins import BaseUuidModel
 from edc_base.sites import SiteModelMixin
 from edc_search.model_mixins import SearchSlugModelMixin
@@ -8,6 +7,7 @@ from edc_search.model_mixins import SearchSlugModelMixin
 from ..action_items import CHILD_DEATH_REPORT_ACTION
 from ..choices import RELATIONSHIP_CHOICES
 from .death_report_mixin import DeathReportModelMixin
+from .instrumented_history import InstrumentedHistoricalRecords
 
 
 class ChildDeathReport(DeathReportModelMixin, ActionModelMixin,
@@ -31,8 +31,13 @@ class ChildDeathReport(DeathReportModelMixin, ActionModelMixin,
         max_length=20,
         choices=RELATIONSHIP_CHOICES)
 
-    history = HistoricalRecords()
+    history = InstrumentedHistoricalRecords(indexes=[
+        models.Index(fields=['subject_identifier', 'report_datetime'],
+                     name='prn_h_chdeath_subj_rdt_idx')])
 
     class Meta:
         app_label = 'flourish_prn'
         verbose_name = 'Child Death Report'
+        indexes = [
+            models.Index(fields=['subject_identifier', 'report_datetime'],
+                         name='prn_chdeath_subj_rdt_idx')]
@@ -1,6 +1,4 @@
-from django.apps import apps as django_apps
 from django.conf import settings
-from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils import timezone
 from edc_base import convert_php_dateformat
@@ -10,10 +8,11 @@ from edc_base.model_validators import datetime_not_future
 from edc_base.utils import get_utcnow
 from edc_constants.choices import YES_NO
 from edc_protocol.validators import datetime_not_before_study_start
-from flourish_child.helper_classes.utils import child_utils
 
 from ..choices import MED_RESPONSIBILITY, HOSPITILIZATION_REASONS
 from ..choices import SOURCE_OF_DEATH_INFO, CAUSE_OF_DEATH_CAT
+from ..helper_classes import consent_version_resolver
+from ..metrics import CONSENT_VERSION_PHASE, SAVE_PHASE, instrument
 
 
 class DeathReportModelMixin(models.Model):
@@ -116,46 +115,21 @@ class DeathReportModelMixin(models.Model):
         return f'{self.subject_identifier} {formatted_date}'
 
     def get_consent_version(self):
-        preg_subject_screening_cls = django_apps.get_model(
-            'flourish_caregiver.screeningpregwomen')
-        prior_subject_screening_cls = django_apps.get_model(
-            'flourish_caregiver.screeningpriorbhpparticipants')
-
-        consent_version_cls = django_apps.get_model(
-            'flourish_caregiver.flourishconsentversion')
-
-        subject_screening_obj = None
-        subject_identifier = self.subject_identifier
-        if len(self.subject_identifier.split('-')) == 4:
-            subject_identifier = child_utils.caregiver_subject_identifier(
-                self.subject_identifier)
-
-        try:
-            subject_screening_obj = preg_subject_screening_cls.objects.get(
-                subject_identifier=subject_identifier)
-        except preg_subject_screening_cls.DoesNotExist:
-
-            try:
-                subject_screening_obj = prior_subject_screening_cls.objects.get(
-                    subject_identifier=subject_identifier)
-            except prior_subject_screening_cls.DoesNotExist:
-                raise ValidationError(
-                    'Missing Subject Screening form. Please complete '
-                    'it before proceeding.')
-
-        if subject_screening_obj:
-            try:
-                consent_version_obj = consent_version_cls.objects.get(
-                    screening_identifier=subject_screening_obj.screening_identifier)
-            except consent_version_cls.DoesNotExist:
-                raise ValidationError(
-                    'Missing Consent Version form. Please complete '
-                    'it before proceeding.')
-            return consent_version_obj.version
+        return consent_version_resolver.get_consent_version(
+            self.subject_identifier)
 
     def save(self, *args, **kwargs):
-        self.consent_version = self.get_consent_version()
-        super().save(*args, **kwargs)
+        """ Pass `consent_version`, e.g. from `resolve_consent_versions`,
+            to skip resolving it for this instance.
+        """
+        model = self._meta.label_lower
+        with instrument(SAVE_PHASE, model):
+            consent_version = kwargs.pop('consent_version', None)
+            if not consent_version:
+                with instrument(CONSENT_VERSION_PHASE, model):
+                    consent_version = self.get_consent_version()
+            self.consent_version = consent_version
+            super().save(*args, **kwargs)
 
     class Meta:
         abstract = True
@@ -0,0 +1,81 @@
+from django.db import models
+from edc_base.model_mixins import BaseUuidModel
+from edc_constants.constants import COMPLETE
+
+from ..choices import EXPORT_FORMAT, JOB_STATUS
+from ..constants import CSV, QUEUED
+
+
+class ExportJob(BaseUuidModel):
+
+    """ A queued export of a PRN queryset, run outside of the admin
+        request as a django_q task.
+    """
+
+    model = models.CharField(
+        verbose_name='Model',
+        max_length=100)
+
+    pks = models.TextField(
+        null=True,
+        blank=True,
+        help_text='JSON list of the selected pks, empty to export all rows.')
+
+    export_format = models.CharField(
+        verbose_name='Format',
+        max_length=10,
+        choices=EXPORT_FORMAT,
+        default=CSV)
+
+    status = models.CharField(
+        verbose_name='Status',
+        max_length=15,
+        choices=JOB_STATUS,
+        default=QUEUED)
+
+    rows_written = models.IntegerField(
+        verbose_name='Rows written',
+        default=0)
+
+    started_datetime = models.DateTimeField(
+        verbose_name='Started',
+        null=True,
+        blank=True)
+
+    heartbeat_datetime = models.DateTimeField(
+        verbose_name='Last heartbeat',
+        null=True,
+        blank=True)
+
+    completed_datetime = models.DateTimeField(
+        verbose_name='Completed',
+        null=True,
+        blank=True)
+
+    export_file = models.FileField(
+        upload_to='flourish_prn/exports/',
+        null=True,
+        blank=True)
+
+    error = models.TextField(
+        null=True,
+        blank=True)
+
+    def __str__(self):
+        return f'{self.model} {self.export_format} ({self.status})'
+
+    @property
+    def elapsed(self):
+        if self.started_datetime and self.completed_datetime:
+            return self.completed_datetime - self.started_datetime
+        return None
+
+    @property
+    def is_complete(self):
+        return self.status == COMPLETE
+
+    class Meta:
+        app_label = 'flourish_prn'
+        verbose_name = 'Export Job'
+        verbose_name_plural = 'Export Jobs'
+        ordering = ('-created', )
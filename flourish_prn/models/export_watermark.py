@@ -0,0 +1,34 @@
+from django.db import models
+from edc_base.model_mixins import BaseUuidModel
+
+
+class ExportWatermark(BaseUuidModel):
+
+    """ The latest `modified` (or `history_date`) value exported for a
+        model to a consumer, with the pks exported at that value, used
+        for incremental exports.
+    """
+
+    model = models.CharField(
+        verbose_name='Model',
+        max_length=100)
+
+    consumer = models.CharField(
+        verbose_name='Consumer',
+        max_length=50)
+
+    last_exported = models.DateTimeField(
+        verbose_name='Last exported value')
+
+    last_exported_pks = models.TextField(
+        null=True,
+        blank=True,
+        help_text='JSON list of the pks exported at the last exported value.')
+
+    def __str__(self):
+        return f'{self.model} {self.consumer} {self.last_exported}'
+
+    class Meta:
+        app_label = 'flourish_prn'
+        verbose_name = 'Export Watermark'
+        unique_together = ('model', 'consumer')
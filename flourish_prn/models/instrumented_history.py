@@ -0,0 +1,25 @@
+from edc_base.model_managers import HistoricalRecords
+
+from ..metrics import HISTORY_PHASE, instrument
+
+
+class InstrumentedHistoricalRecords(HistoricalRecords):
+    """ HistoricalRecords that records the historical record write as the
+        history phase of saving the model.
+
+    `indexes` are added to the Meta of the historical model.
+    """
+
+    def __init__(self, *args, indexes=None, **kwargs):
+        self.indexes = indexes or []
+        super().__init__(*args, **kwargs)
+
+    def get_meta_options(self, model):
+        meta_fields = super().get_meta_options(model)
+        if self.indexes:
+            meta_fields['indexes'] = self.indexes
+        return meta_fields
+
+    def post_save(self, instance, created, *args, **kwargs):
+        with instrument(HISTORY_PHASE, instance._meta.label_lower):
+            super().post_save(instance, created, *args, **kwargs)
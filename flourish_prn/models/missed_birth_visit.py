@@ -127,4 +127,7 @@ class MissedBirthVisit(BaseUuidModel,ActionModelMixin):
     class Meta:
         app_label = 'flourish_prn'
         verbose_name = 'Missed Birth Visit Form'
-        verbose_name_plural = 'Missed Birth Visit Form'
\ No newline at end of file
+        verbose_name_plural = 'Missed Birth Visit Form'
+        indexes = [
+            models.Index(fields=['subject_identifier', 'report_datetime'],
+                         name='prn_missedbv_subj_rdt_idx')]
@@ -1,10 +1,14 @@
-from django import forms
 from django.apps import apps as django_apps
 from django.db import models
 from edc_base.model_fields.custom_fields import OtherCharField
 from edc_base.model_validators import date_not_future
 from edc_protocol.validators import date_not_before_study_start
-from flourish_child.helper_classes.utils import child_utils
+
+from ..constants import TAKE_OFF_SCHEDULE
+from ..helper_classes import consent_version_resolver
+from ..helper_classes import defer_offschedule, offstudy_task_queue
+from ..metrics import CONSENT_VERSION_PHASE, SAVE_PHASE
+from ..metrics import TAKE_OFF_SCHEDULE_PHASE, instrument
 
 
 class OffStudyModelMixin(models.Model):
@@ -23,46 +27,53 @@ class OffStudyModelMixin(models.Model):
         blank=True,
         null=True)
 
-    def get_consent_version(self):
-        preg_subject_screening_cls = django_apps.get_model(
-            'flourish_caregiver.screeningpregwomen')
-        prior_subject_screening_cls = django_apps.get_model(
-            'flourish_caregiver.screeningpriorbhpparticipants')
+    # (onschedule model, schedule name) pairs set by BulkOffStudy so that
+    # take_off_schedule does not query the schedule history per subject.
+    prefetched_onschedules = None
 
-        consent_version_cls = django_apps.get_model(
-            'flourish_caregiver.flourishconsentversion')
+    def get_onschedules(self, **kwargs):
+        """ Returns (onschedule model, schedule name) pairs for the
+            schedules the subject is currently on.
+        """
+        if self.prefetched_onschedules is not None:
+            return self.prefetched_onschedules
+        history_cls = django_apps.get_model(
+            'edc_visit_schedule.subjectschedulehistory')
+        onschedules = history_cls.objects.onschedules(
+            subject_identifier=self.subject_identifier, **kwargs)
+        return [(onschedule._meta.label_lower, onschedule.schedule_name)
+                for onschedule in onschedules or []]
 
-        subject_screening_obj = None
-        subject_identifier = self.subject_identifier
-        if len(self.subject_identifier.split('-')) == 4:
-            subject_identifier = child_utils.caregiver_subject_identifier(
-                self.subject_identifier)
+    def take_off_schedule(self):
+        """ Takes the subject off the schedules returned by
+            `get_onschedules`, or queues that work to run after commit
+            if off-schedule processing is deferred.
+        """
+        with instrument(TAKE_OFF_SCHEDULE_PHASE, self._meta.label_lower):
+            if defer_offschedule():
+                offstudy_task_queue.enqueue(self, TAKE_OFF_SCHEDULE)
+            else:
+                self.take_off_onschedules()
 
-        try:
-            subject_screening_obj = preg_subject_screening_cls.objects.get(
-                subject_identifier=subject_identifier)
-        except preg_subject_screening_cls.DoesNotExist:
-            try:
-                subject_screening_obj = prior_subject_screening_cls.objects.get(
-                    subject_identifier=subject_identifier)
-            except prior_subject_screening_cls.DoesNotExist:
-                raise forms.ValidationError(
-                    'Missing Subject Screening form. Please complete '
-                    'it before proceeding.')
+    def take_off_onschedules(self):
+        pass
 
-        if subject_screening_obj:
-            try:
-                consent_version_obj = consent_version_cls.objects.get(
-                    screening_identifier=subject_screening_obj.screening_identifier)
-            except consent_version_cls.DoesNotExist:
-                raise forms.ValidationError(
-                    'Missing Consent Version form. Please complete '
-                    'it before proceeding.')
-            return consent_version_obj.version
+    def get_consent_version(self):
+        return consent_version_resolver.get_consent_version(
+            self.subject_identifier)
 
     def save(self, *args, **kwargs):
-        self.consent_version = self.get_consent_version()
-        super().save(*args, **kwargs)
+        """ Pass `consent_version`, e.g. from `resolve_consent_versions`,
+            to skip resolving it for this instance.
+        """
+        model = self._meta.label_lower
+        with instrument(SAVE_PHASE, model):
+            consent_version = kwargs.pop('consent_version', None)
+            if not consent_version:
+                with instrument(CONSENT_VERSION_PHASE, model):
+                    consent_version = self.get_consent_version()
+            self.consent_version = consent_version
+            super().save(*args, **kwargs)
 
     class Meta:
         abstract = True
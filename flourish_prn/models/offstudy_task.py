@@ -0,0 +1,59 @@
+from django.db import models
+from edc_base.model_mixins import BaseUuidModel
+from edc_base.utils import get_utcnow
+
+from ..choices import JOB_STATUS, OFFSTUDY_TASK
+from ..constants import QUEUED
+
+
+class OffStudyTask(BaseUuidModel):
+
+    """ Off-schedule work queued by an off-study save when
+        `settings.FLOURISH_PRN_DEFER_OFFSCHEDULE` is True.
+    """
+
+    model = models.CharField(
+        verbose_name='Off-study model',
+        max_length=100)
+
+    subject_identifier = models.CharField(
+        verbose_name='Subject Identifier',
+        max_length=50,
+        db_index=True)
+
+    task = models.CharField(
+        verbose_name='Task',
+        max_length=25,
+        choices=OFFSTUDY_TASK)
+
+    status = models.CharField(
+        verbose_name='Status',
+        max_length=15,
+        choices=JOB_STATUS,
+        default=QUEUED)
+
+    attempts = models.IntegerField(
+        verbose_name='Attempts',
+        default=0)
+
+    next_attempt_datetime = models.DateTimeField(
+        verbose_name='Next attempt',
+        default=get_utcnow)
+
+    claimed_datetime = models.DateTimeField(
+        verbose_name='Claimed',
+        null=True,
+        blank=True)
+
+    last_error = models.TextField(
+        null=True,
+        blank=True)
+
+    def __str__(self):
+        return f'{self.subject_identifier} {self.task} ({self.status})'
+
+    class Meta:
+        app_label = 'flourish_prn'
+        verbose_name = 'Off Study Task'
+        verbose_name_plural = 'Off Study Tasks'
+        ordering = ('created', )
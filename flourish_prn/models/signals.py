@@ -1,49 +1,126 @@
-from django.apps import apps as django_apps
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from edc_visit_schedule import site_visit_schedules
 
+from flourish_prn.constants import REMOVE_FU_NOTES, REMOVE_TB_SCHEDULES
+from flourish_prn.helper_classes import action_graph
+from flourish_prn.helper_classes import consent_version_resolver
+from flourish_prn.helper_classes import latest_visit_index
+from flourish_prn.helper_classes import defer_offschedule, offstudy_task_queue
+from flourish_prn.helper_classes import prn_status_updater
+from flourish_prn.helper_classes import remove_followup_schedule_notes
+from flourish_prn.helper_classes import take_off_tb_adol_schedules
+from flourish_prn.metrics import SIGNALS_PHASE, instrumented
 from flourish_prn.models.child_off_study import ChildOffStudy
 from flourish_prn.models.tb_adol_off_study import TBAdolOffStudy
 
 
 @receiver(post_save, weak=False, sender=ChildOffStudy,
           dispatch_uid='child_offstudy_on_post_save')
+@instrumented(SIGNALS_PHASE)
 def child_offstudy_on_post_save(sender, instance, raw, created, **kwargs):
     """ Remove fu schedule when child goes offstudy and not already enrolled on
         the followup schedule.
     """
-    schedule_history_cls = django_apps.get_model(
-        'edc_visit_schedule.subjectschedulehistory')
-    participant_note_cls = django_apps.get_model(
-        'flourish_calendar.participantnote')
-    subject_identifier = instance.subject_identifier
     if not raw:
-        fu_notes = participant_note_cls.objects.filter(
-            subject_identifier=subject_identifier,
-            title='Follow Up Schedule')
-        fu_schedule = schedule_history_cls.objects.filter(
-            subject_identifier=subject_identifier,
-            schedule_name__contains='_fu')
-
-        if fu_notes.exists() and not fu_schedule.exists():
-            fu_notes.delete()
+        if defer_offschedule():
+            offstudy_task_queue.enqueue(instance, REMOVE_FU_NOTES)
+        else:
+            remove_followup_schedule_notes(instance.subject_identifier)
 
 
 @receiver(post_save, weak=False, sender=TBAdolOffStudy,
           dispatch_uid='tb_adol_offstudy_post_save')
+@instrumented(SIGNALS_PHASE)
 def tb_adol_offstudy_post_save(sender, instance, raw, created, **kwargs):
     if not raw:
-        tb_schedules = {
-            'tb_adol_schedule': 'flourish_child.onschedulechildtbadolschedule',
-            'tb_adol_followup_schedule': 'flourish_child.onscheduletbadolfollowupschedule'
-        }
-        for schedule_name, onschedule_model in tb_schedules.items():
-            _, schedule = site_visit_schedules.get_by_onschedule_model_schedule_name(
-                onschedule_model=onschedule_model,
-                name=schedule_name)
-            if schedule.is_onschedule(subject_identifier=instance.subject_identifier,
-                                      report_datetime=instance.report_datetime):
-                schedule.take_off_schedule(
-                    subject_identifier=instance.subject_identifier,
-                    schedule_name=schedule_name)
+        if defer_offschedule():
+            offstudy_task_queue.enqueue(instance, REMOVE_TB_SCHEDULES)
+        else:
+            take_off_tb_adol_schedules(
+                instance.subject_identifier, instance.report_datetime)
+
+
+@receiver(post_save, weak=False,
+          sender='flourish_caregiver.screeningpregwomen',
+          dispatch_uid='preg_screening_consent_version_on_change')
+@receiver(post_delete, weak=False,
+          sender='flourish_caregiver.screeningpregwomen',
+          dispatch_uid='preg_screening_consent_version_on_delete')
+@receiver(post_save, weak=False,
+          sender='flourish_caregiver.screeningpriorbhpparticipants',
+          dispatch_uid='prior_screening_consent_version_on_change')
+@receiver(post_delete, weak=False,
+          sender='flourish_caregiver.screeningpriorbhpparticipants',
+          dispatch_uid='prior_screening_consent_version_on_delete')
+def screening_consent_version_on_change(sender, instance, **kwargs):
+    """ Drop the cached consent version when a caregiver's screening
+        changes.
+    """
+    consent_version_resolver.invalidate([instance.subject_identifier])
+
+
+@receiver(post_save, weak=False,
+          sender='flourish_caregiver.flourishconsentversion',
+          dispatch_uid='consent_version_on_change')
+@receiver(post_delete, weak=False,
+          sender='flourish_caregiver.flourishconsentversion',
+          dispatch_uid='consent_version_on_delete')
+def consent_version_on_change(sender, instance, **kwargs):
+    """ Drop the cached consent version of the caregivers screened under
+        the changed consent version.
+    """
+    consent_version_resolver.invalidate_screening(
+        instance.screening_identifier)
+
+
+@instrumented(SIGNALS_PHASE)
+def prn_status_on_post_save(sender, instance, raw, **kwargs):
+    if not raw:
+        prn_status_updater.update(instance)
+
+
+def prn_status_on_post_delete(sender, instance, **kwargs):
+    prn_status_updater.update(instance, deleted=True)
+
+
+for prn_model in prn_status_updater.sources:
+    post_save.connect(
+        prn_status_on_post_save, sender=prn_model, weak=False,
+        dispatch_uid=f'prn_status_on_post_save_{prn_model}')
+    post_delete.connect(
+        prn_status_on_post_delete, sender=prn_model, weak=False,
+        dispatch_uid=f'prn_status_on_post_delete_{prn_model}')
+
+
+def latest_visit_on_post_save(sender, instance, raw, **kwargs):
+    if not raw:
+        latest_visit_index.update(instance)
+
+
+def latest_visit_on_post_delete(sender, instance, **kwargs):
+    latest_visit_index.update(instance, deleted=True)
+
+
+for visit_model in latest_visit_index.visit_models:
+    post_save.connect(
+        latest_visit_on_post_save, sender=visit_model, weak=False,
+        dispatch_uid=f'latest_visit_on_post_save_{visit_model}')
+    post_delete.connect(
+        latest_visit_on_post_delete, sender=visit_model, weak=False,
+        dispatch_uid=f'latest_visit_on_post_delete_{visit_model}')
+
+
+@receiver(post_save, weak=False, sender='edc_action_item.actionitem',
+          dispatch_uid='action_graph_actionitem_on_post_save')
+@receiver(post_delete, weak=False, sender='edc_action_item.actionitem',
+          dispatch_uid='action_graph_actionitem_on_post_delete')
+@receiver(post_save, weak=False, sender='flourish_prn.caregiverdeathreport',
+          dispatch_uid='action_graph_caregiverdeathreport_on_post_save')
+@receiver(post_delete, weak=False, sender='flourish_prn.caregiverdeathreport',
+          dispatch_uid='action_graph_caregiverdeathreport_on_post_delete')
+@receiver(post_save, weak=False, sender='flourish_prn.childdeathreport',
+          dispatch_uid='action_graph_childdeathreport_on_post_save')
+@receiver(post_delete, weak=False, sender='flourish_prn.childdeathreport',
+          dispatch_uid='action_graph_childdeathreport_on_post_delete')
+def action_graph_on_change(sender, instance, **kwargs):
+    action_graph.clear(instance.subject_identifier)
@@ -0,0 +1,28 @@
+from django.db import models
+from edc_base.model_mixins import BaseUuidModel
+
+
+class SubjectLatestVisit(BaseUuidModel):
+
+    """ The report datetime of a subject's latest visit per visit model,
+        kept up to date by the visit model signals.
+    """
+
+    visit_model = models.CharField(
+        verbose_name='Visit model',
+        max_length=100)
+
+    subject_identifier = models.CharField(
+        verbose_name='Subject Identifier',
+        max_length=50)
+
+    report_datetime = models.DateTimeField(
+        verbose_name='Latest visit report datetime')
+
+    def __str__(self):
+        return f'{self.subject_identifier} {self.visit_model}'
+
+    class Meta:
+        app_label = 'flourish_prn'
+        verbose_name = 'Subject Latest Visit'
+        unique_together = ('visit_model', 'subject_identifier')
@@ -0,0 +1,62 @@
+from django.db import models
+from edc_base.model_mixins import BaseUuidModel
+
+
+class SubjectPrnStatus(BaseUuidModel):
+
+    """ A per subject summary of the PRN forms, kept up to date by the
+        PRN model signals and rebuilt with `rebuild_prn_status`.
+    """
+
+    subject_identifier = models.CharField(
+        verbose_name='Subject Identifier',
+        max_length=50,
+        unique=True)
+
+    offstudy_date = models.DateField(
+        verbose_name='Off-study date',
+        null=True,
+        blank=True)
+
+    death_date = models.DateField(
+        verbose_name='Date of death',
+        null=True,
+        blank=True)
+
+    tb_offstudy_date = models.DateField(
+        verbose_name='TB adol off-study date',
+        null=True,
+        blank=True)
+
+    tb_referral_date = models.DateField(
+        verbose_name='TB adol referral date',
+        null=True,
+        blank=True)
+
+    missed_birth_visit = models.BooleanField(
+        verbose_name='Missed birth visit',
+        default=False)
+
+    def __str__(self):
+        return self.subject_identifier
+
+    @property
+    def is_offstudy(self):
+        return self.offstudy_date is not None
+
+    @property
+    def is_deceased(self):
+        return self.death_date is not None
+
+    @property
+    def is_tb_offstudy(self):
+        return self.tb_offstudy_date is not None
+
+    @property
+    def is_tb_referred(self):
+        return self.tb_referral_date is not None
+
+    class Meta:
+        app_label = 'flourish_prn'
+        verbose_name = 'Subject PRN Status'
+        verbose_name_plural = 'Subject PRN Status'
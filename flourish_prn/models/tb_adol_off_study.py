@@ -1,6 +1,5 @@
 from django.db import models
 from edc_action_item.model_mixins.action_model_mixin import ActionModelMixin
-from edc_base.model_managers import HistoricalRecords
 from edc_base.model_mixins import BaseUuidModel
 from edc_base.model_validators.date import datetime_not_future
 from edc_base.utils import get_utcnow
@@ -11,6 +10,8 @@ from edc_visit_schedule.model_mixins import OffScheduleModelMixin
 from flourish_prn.action_items import TB_ADOL_STUDY_ACTION
 from flourish_prn.choices import CHILD_OFF_STUDY_REASON
 from flourish_prn.models.offstudy_model_mixin import OffStudyModelMixin
+from flourish_prn.models.instrumented_history import (
+    InstrumentedHistoricalRecords)
 
 
 class TBAdolOffStudy(OffStudyModelMixin, OffScheduleModelMixin,
@@ -38,7 +39,9 @@ class TBAdolOffStudy(OffStudyModelMixin, OffScheduleModelMixin,
 
     objects = SubjectIdentifierManager()
 
-    history = HistoricalRecords()
+    history = InstrumentedHistoricalRecords(indexes=[
+        models.Index(fields=['subject_identifier', 'report_datetime'],
+                     name='prn_h_tboff_subj_rdt_idx')])
 
     def take_off_schedule(self):
         pass
@@ -47,3 +50,6 @@ class TBAdolOffStudy(OffStudyModelMixin, OffScheduleModelMixin,
         app_label = 'flourish_prn'
         verbose_name = "TB Adol Off-Study"
         verbose_name_plural = "TB Adol Off-Study"
+        indexes = [
+            models.Index(fields=['subject_identifier', 'report_datetime'],
+                         name='prn_tboff_subj_rdt_idx')]
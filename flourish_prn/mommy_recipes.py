@@ -1,6 +1,8 @@
 from faker import Faker
 from model_mommy.recipe import Recipe
 from .models import CaregiverOffStudy, TBAdolOffStudy, ChildOffStudy
+from .models import CaregiverDeathReport, ChildDeathReport
+from .models import MissedBirthVisit, TbReferalAdol
 
 fake = Faker()
 
@@ -11,3 +13,11 @@ tbadoloffstudy = Recipe(
     TBAdolOffStudy)
 
 childoffstudy = Recipe(ChildOffStudy)
+
+caregiverdeathreport = Recipe(CaregiverDeathReport)
+
+childdeathreport = Recipe(ChildDeathReport)
+
+missedbirthvisit = Recipe(MissedBirthVisit)
+
+tbreferaladol = Recipe(TbReferalAdol)
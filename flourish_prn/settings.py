@@ -46,6 +46,7 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'django.contrib.sites',
+    'django_q',
     'django_crypto_fields.apps.AppConfig',
     'edc_action_item.apps.AppConfig',
     'edc_consent.apps.AppConfig',
@@ -164,6 +165,25 @@ STATIC_URL = '/static/'
 
 DASHBOARD_URL_NAMES = {}
 
+# Export jobs run on a django_q cluster using the database as broker,
+# start it with `python manage.py qcluster`. A task not acknowledged
+# within `retry` seconds is delivered again, a job whose lease has
+# expired is then claimed again.
+Q_CLUSTER = {
+    'name': 'flourish_prn',
+    'orm': 'default',
+    'workers': 2,
+    'timeout': 3600,
+    'retry': 3700,
+    'max_attempts': 3,
+}
+
+FLOURISH_PRN_EXPORT_LEASE_SECONDS = 600
+
+# Bearer token a Prometheus scraper sends to read /metrics/, staff users
+# can read it without one.
+FLOURISH_PRN_METRICS_TOKEN = os.environ.get('FLOURISH_PRN_METRICS_TOKEN')
+
 if 'test' in sys.argv:
 
     class DisableMigrations:
@@ -175,6 +195,7 @@ if 'test' in sys.argv:
             return None
 
     MIGRATION_MODULES = DisableMigrations()
+    TEST_RUNNER = 'flourish_prn.tests.runner.PrnDiscoverRunner'
     PASSWORD_HASHERS = ('django.contrib.auth.hashers.MD5PasswordHasher',)
     DEFAULT_FILE_STORAGE = 'inmemorystorage.InMemoryStorage'
 
@@ -0,0 +1,95 @@
+from datetime import date
+
+from dateutil.relativedelta import relativedelta
+from django.apps import apps as django_apps
+from edc_base.utils import get_utcnow
+from edc_constants.constants import NOT_APPLICABLE, YES
+from edc_facility.import_holidays import import_holidays
+from model_mommy import mommy
+
+holiday_model = 'edc_facility.holiday'
+
+_holidays = []
+
+
+def load_holidays():
+    """ Imports the holidays file on first use only, later calls copy the
+        imported rows back with one `bulk_create`.
+    """
+    holiday_cls = django_apps.get_model(holiday_model)
+    if not _holidays:
+        import_holidays()
+        _holidays.extend(holiday_cls.objects.values())
+        return
+    holiday_cls.objects.bulk_create(
+        [holiday_cls(**holiday) for holiday in _holidays])
+
+
+class PrnFixtureMixin:
+    """ Builds the baseline world, holidays and a consented cohort B
+        caregiver and child, once per test class in `setUpTestData`.
+
+    TestCase rolls every test back to the baseline with a savepoint, so
+    tests must not rely on changes made by other tests. Only identifiers
+    are kept on the class.
+    """
+
+    subject_identifier = '12345672'
+    study_maternal_identifier = '981232'
+    study_child_identifier = '1234'
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        load_holidays()
+        cls.caregiver_subject_identifier, cls.child_subject_identifier = \
+            cls.make_cohort_b_subject()
+
+    @classmethod
+    def make_cohort_b_subject(cls):
+        """ Returns the caregiver and child subject identifiers of a
+            consented cohort B caregiver and child.
+        """
+        maternal_dataset_obj = mommy.make_recipe(
+            'flourish_caregiver.maternaldataset',
+            subject_identifier=cls.subject_identifier,
+            preg_efv=1,
+            delivdt=get_utcnow() - relativedelta(years=5, months=2),
+            mom_enrolldate=get_utcnow(),
+            mom_hivstatus='HIV-infected',
+            study_maternal_identifier=cls.study_maternal_identifier,
+            protocol='Mpepu')
+
+        mommy.make_recipe(
+            'flourish_child.childdataset',
+            dob=date(2017, 3, 29),
+            infant_hiv_exposed='Exposed',
+            infant_enrolldate=get_utcnow(),
+            study_maternal_identifier=cls.study_maternal_identifier,
+            study_child_identifier=cls.study_child_identifier)
+
+        mommy.make_recipe(
+            'flourish_caregiver.screeningpriorbhpparticipants',
+            screening_identifier=maternal_dataset_obj.screening_identifier,
+            study_maternal_identifier=cls.study_maternal_identifier)
+
+        subject_consent = mommy.make_recipe(
+            'flourish_caregiver.subjectconsent',
+            screening_identifier=maternal_dataset_obj.screening_identifier,
+            breastfeed_intent=NOT_APPLICABLE,
+            biological_caregiver=YES,
+            consent_datetime=get_utcnow(),
+            version='1')
+
+        child_consent = mommy.make_recipe(
+            'flourish_caregiver.caregiverchildconsent',
+            subject_consent=subject_consent,
+            study_child_identifier=cls.study_child_identifier,
+            child_dob=(get_utcnow() - relativedelta(years=5, months=4)).date())
+
+        mommy.make_recipe(
+            'flourish_caregiver.caregiverpreviouslyenrolled',
+            subject_identifier=subject_consent.subject_identifier)
+
+        return (subject_consent.subject_identifier,
+                child_consent.subject_identifier)
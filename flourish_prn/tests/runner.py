@@ -0,0 +1,15 @@
+from django.test.runner import DiscoverRunner
+
+
+class PrnDiscoverRunner(DiscoverRunner):
+    """ Leaves out tests tagged `slow` unless they are asked for with
+        `--tag slow`.
+    """
+
+    default_exclude_tags = {'slow'}
+
+    def __init__(self, *args, tags=None, exclude_tags=None, **kwargs):
+        exclude_tags = set(exclude_tags or [])
+        if not self.default_exclude_tags & set(tags or []):
+            exclude_tags |= self.default_exclude_tags
+        super().__init__(*args, tags=tags, exclude_tags=exclude_tags, **kwargs)
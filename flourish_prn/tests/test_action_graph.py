@@ -0,0 +1,43 @@
+from django.test import SimpleTestCase, tag
+
+from ..helper_classes import ActionGraph
+
+
+@tag('action_graph')
+class TestActionGraph(SimpleTestCase):
+
+    subject_identifier = 'B142-040990001-2'
+
+    def setUp(self):
+        self.action_graph = ActionGraph()
+        self.calls = 0
+
+    def check(self):
+        self.calls += 1
+        return True
+
+    def memoized(self):
+        return self.action_graph.memoized(
+            self.subject_identifier, 'check', self.check)
+
+    def test_no_memo_outside_scope(self):
+        self.memoized()
+        self.memoized()
+        self.assertEqual(self.calls, 2)
+        self.assertIsNone(self.action_graph.memo)
+
+    def test_nested_scopes_share_memo(self):
+        with self.action_graph.scope():
+            self.memoized()
+            with self.action_graph.scope():
+                self.memoized()
+            self.memoized()
+        self.assertEqual(self.calls, 1)
+        self.assertIsNone(self.action_graph.memo)
+
+    def test_clear_drops_subject_memo(self):
+        with self.action_graph.scope():
+            self.memoized()
+            self.action_graph.clear(self.subject_identifier)
+            self.memoized()
+        self.assertEqual(self.calls, 2)
@@ -0,0 +1,50 @@
+from io import StringIO
+
+from django.apps import apps as django_apps
+from django.core.management import call_command
+from django.test import TestCase, tag
+from model_mommy import mommy
+
+from ..action_items import CAREGIVEROFF_STUDY_ACTION
+from ..helper_classes import action_item_reconciler
+from .fixture_mixin import PrnFixtureMixin
+
+
+@tag('action_item')
+class TestActionItemReconciler(PrnFixtureMixin, TestCase):
+
+    def setUp(self):
+        self.action_item_cls = django_apps.get_model(
+            'edc_action_item.actionitem')
+
+    def offstudy_action_items(self):
+        return self.action_item_cls.objects.filter(
+            subject_identifier=self.caregiver_subject_identifier,
+            action_type__name=CAREGIVEROFF_STUDY_ACTION)
+
+    def test_command_reports_reconciled(self):
+        out = StringIO()
+        call_command('reconcile_action_items', stdout=out)
+        self.assertIn('PRN action items are reconciled.', out.getvalue())
+
+    def test_command_creates_missing_action_item(self):
+        mommy.make_recipe(
+            'flourish_prn.caregiverdeathreport',
+            subject_identifier=self.caregiver_subject_identifier)
+        self.offstudy_action_items().delete()
+        self.assertEqual(
+            action_item_reconciler.missing(),
+            {('flourish_prn.caregiverdeathreport',
+              'flourish_prn.caregiveroffstudy'):
+             {self.caregiver_subject_identifier}})
+
+        out = StringIO()
+        call_command('reconcile_action_items', '--create-missing', stdout=out)
+        self.assertIn('Created 1 action item(s).', out.getvalue())
+        action_item = self.offstudy_action_items().get()
+        self.assertTrue(action_item.action_identifier)
+        self.assertIsNotNone(action_item.site_id)
+        self.assertEqual(action_item_reconciler.missing(), {})
+
+    def test_duplicates_of_singleton_actions(self):
+        self.assertEqual(action_item_reconciler.duplicates(), {})
@@ -0,0 +1,41 @@
+from dateutil.relativedelta import relativedelta
+from django.apps import apps as django_apps
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow
+
+from ..helper_classes import BulkOffStudy
+from ..models import CaregiverOffStudy, SubjectLatestVisit
+from .fixture_mixin import PrnFixtureMixin
+
+
+@tag('os')
+class TestBulkOffStudy(PrnFixtureMixin, TestCase):
+
+    reason = 'caregiver_death'
+
+    def test_takes_subject_off_study_and_schedule(self):
+        bulk_offstudy = BulkOffStudy(
+            CaregiverOffStudy, [self.caregiver_subject_identifier],
+            reason=self.reason)
+        bulk_offstudy.run()
+        self.assertEqual(bulk_offstudy.skipped, {})
+        self.assertEqual(CaregiverOffStudy.objects.filter(
+            subject_identifier=self.caregiver_subject_identifier).count(), 1)
+        offschedule_cls = django_apps.get_model(
+            'flourish_caregiver.caregiveroffschedule')
+        self.assertEqual(offschedule_cls.objects.filter(
+            subject_identifier=self.caregiver_subject_identifier).count(), 1)
+
+    def test_skips_subject_with_later_visit(self):
+        SubjectLatestVisit.objects.create(
+            visit_model='flourish_caregiver.maternalvisit',
+            subject_identifier=self.caregiver_subject_identifier,
+            report_datetime=get_utcnow())
+        bulk_offstudy = BulkOffStudy(
+            CaregiverOffStudy, [self.caregiver_subject_identifier],
+            reason=self.reason,
+            report_datetime=get_utcnow() - relativedelta(days=2))
+        bulk_offstudy.run()
+        self.assertIn(self.caregiver_subject_identifier, bulk_offstudy.skipped)
+        self.assertFalse(CaregiverOffStudy.objects.filter(
+            subject_identifier=self.caregiver_subject_identifier).exists())
@@ -0,0 +1,48 @@
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow
+
+from ..exports import DeltaExport
+from ..models import ExportJob
+
+
+@tag('export')
+class TestDeltaExport(TestCase):
+
+    consumer = 'reporting'
+
+    def make_export_jobs(self, count, modified):
+        export_jobs = [ExportJob.objects.create(
+            model='flourish_prn.caregiveroffstudy') for _ in range(count)]
+        ExportJob.objects.filter(
+            pk__in=[export_job.pk for export_job in export_jobs]).update(
+                modified=modified)
+        return export_jobs
+
+    def export(self):
+        delta_export = DeltaExport(ExportJob.objects.all(), self.consumer)
+        pks = set(delta_export.changed().values_list('pk', flat=True))
+        delta_export.commit()
+        return pks
+
+    def test_exports_changes_once(self):
+        export_jobs = self.make_export_jobs(3, get_utcnow())
+        self.assertEqual(
+            self.export(), {export_job.pk for export_job in export_jobs})
+        self.assertEqual(self.export(), set())
+
+    def test_exports_late_rows_at_the_watermark(self):
+        modified = get_utcnow()
+        self.make_export_jobs(2, modified)
+        self.export()
+        late = self.make_export_jobs(2, modified)
+        self.assertEqual(
+            self.export(), {export_job.pk for export_job in late})
+        self.assertEqual(self.export(), set())
+
+    def test_watermarks_are_per_consumer(self):
+        export_jobs = self.make_export_jobs(1, get_utcnow())
+        self.export()
+        delta_export = DeltaExport(ExportJob.objects.all(), 'other')
+        self.assertEqual(
+            list(delta_export.changed().values_list('pk', flat=True)),
+            [export_jobs[0].pk])
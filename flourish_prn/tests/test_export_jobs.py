@@ -0,0 +1,43 @@
+import json
+
+from dateutil.relativedelta import relativedelta
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow
+
+from ..constants import QUEUED, RUNNING
+from ..exports import ExportJobRunner, queue_export
+from ..models import CaregiverOffStudy, ExportJob
+
+
+@tag('export')
+class TestExportJobs(TestCase):
+
+    def test_unfiltered_queryset_exports_all_rows(self):
+        export_job = queue_export(CaregiverOffStudy.objects.all())
+        self.assertIsNone(export_job.pks)
+        self.assertEqual(export_job.model, 'flourish_prn.caregiveroffstudy')
+
+    def test_filtered_queryset_stores_pks(self):
+        export_job = queue_export(CaregiverOffStudy.objects.filter(
+            subject_identifier='B142-040990001-2'))
+        self.assertEqual(json.loads(export_job.pks), [])
+        self.assertEqual(ExportJobRunner(export_job).queryset.count(), 0)
+
+    def test_claim_queued_job_once(self):
+        export_job = ExportJob.objects.create(
+            model='flourish_prn.caregiveroffstudy', status=QUEUED)
+        self.assertTrue(ExportJobRunner(export_job).claim())
+        self.assertFalse(ExportJobRunner(
+            ExportJob.objects.get(pk=export_job.pk)).claim())
+
+    def test_claim_running_job_with_expired_lease(self):
+        export_job = ExportJob.objects.create(
+            model='flourish_prn.caregiveroffstudy', status=RUNNING,
+            heartbeat_datetime=get_utcnow() - relativedelta(hours=1))
+        self.assertTrue(ExportJobRunner(export_job).claim())
+
+    def test_running_job_with_lease_not_claimed(self):
+        export_job = ExportJob.objects.create(
+            model='flourish_prn.caregiveroffstudy', status=RUNNING,
+            heartbeat_datetime=get_utcnow())
+        self.assertFalse(ExportJobRunner(export_job).claim())
@@ -0,0 +1,70 @@
+import uuid
+import zipfile
+from unittest import skipUnless
+
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow
+
+from ..exports import (
+    CsvExportWriter, ModelExporter, ParquetExportWriter, XlsExportWriter,
+    XlsxExportWriter)
+from ..models import CaregiverOffStudy
+
+
+@tag('export')
+class TestExportWriters(TestCase):
+
+    def setUp(self):
+        self.header = ['id', 'subject_identifier', 'report_datetime']
+        self.rows = [
+            [uuid.uuid4(), 'B142-040990001-1', get_utcnow()],
+            [uuid.uuid4(), 'B142-040990002-1', get_utcnow()]]
+
+    def test_csv_stream_yields_a_line_per_row(self):
+        lines = list(CsvExportWriter().stream(self.header, iter(self.rows)))
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[0], 'id,subject_identifier,report_datetime\r\n')
+        self.assertIn(str(self.rows[0][0]), lines[1])
+
+    def test_xlsx_writer_returns_workbook_file(self):
+        export_file = XlsxExportWriter().write(self.header, iter(self.rows))
+        self.assertTrue(zipfile.is_zipfile(export_file))
+
+    def test_xls_writer_splits_rows_across_sheets(self):
+        writer = XlsExportWriter()
+        writer.max_rows = 2
+        sheet_names = []
+        add_sheet = writer.add_sheet
+
+        def record_sheet(workbook, sheet_name, *args):
+            sheet_names.append(sheet_name)
+            return add_sheet(workbook, sheet_name, *args)
+
+        writer.add_sheet = record_sheet
+        writer.write(
+            self.header, iter(self.rows), sheet_name='Caregiver Off Study')
+        self.assertEqual(
+            sheet_names, ['Caregiver Off Study', 'Caregiver Off Study (2)'])
+
+
+@tag('export')
+@skipUnless(ParquetExportWriter.available(), 'pyarrow is not installed.')
+class TestParquetExportWriter(TestCase):
+
+    def test_schema_keeps_foreign_key_types(self):
+        writer = ParquetExportWriter()
+        schema = writer.schema(ModelExporter(CaregiverOffStudy.objects.none()))
+        self.assertEqual(
+            schema.field('site_id').type, writer.pyarrow.int64())
+        self.assertEqual(
+            schema.field('report_datetime').type,
+            writer.pyarrow.timestamp('us', tz='UTC'))
+        self.assertEqual(schema.field('dob').type, writer.pyarrow.date32())
+
+    def test_empty_export_is_readable(self):
+        writer = ParquetExportWriter()
+        export_file = writer.export(
+            ModelExporter(CaregiverOffStudy.objects.none()))
+        table = writer.pyarrow.parquet.read_table(export_file)
+        self.assertEqual(table.num_rows, 0)
+        self.assertIn('subject_identifier', table.column_names)
@@ -0,0 +1,44 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, tag
+
+from ..helper_classes import BulkOffStudy, resolve_consent_versions
+from ..management.commands.generate_synthetic_cohort import SyntheticCohort
+from ..models import CaregiverOffStudy
+
+
+@tag('synthetic')
+class TestGenerateSyntheticCohort(TestCase):
+
+    subjects = 3
+
+    def setUp(self):
+        call_command(
+            'generate_synthetic_cohort', str(self.subjects),
+            '--offstudy-ratio', '0', '--death-ratio', '0', '--seed', '1',
+            stdout=StringIO())
+        cohort = SyntheticCohort(self.subjects)
+        identifiers = [cohort.identifiers(index)
+                       for index in range(self.subjects)]
+        self.caregivers = [caregiver for caregiver, *_ in identifiers]
+        self.children = [child for _, child, *_ in identifiers]
+
+    def test_identifiers_are_production_shaped(self):
+        for caregiver, child in zip(self.caregivers, self.children):
+            self.assertEqual(len(caregiver.split('-')), 3)
+            self.assertEqual(len(child.split('-')), 4)
+
+    def test_resolves_consent_versions(self):
+        self.assertEqual(
+            resolve_consent_versions(self.caregivers + self.children),
+            {subject_identifier: '1'
+             for subject_identifier in self.caregivers + self.children})
+
+    def test_bulk_offstudy(self):
+        bulk_offstudy = BulkOffStudy(
+            CaregiverOffStudy, self.caregivers, reason='caregiver_death')
+        bulk_offstudy.run()
+        self.assertEqual(bulk_offstudy.skipped, {})
+        self.assertEqual(CaregiverOffStudy.objects.filter(
+            subject_identifier__in=self.caregivers).count(), self.subjects)
@@ -0,0 +1,46 @@
+from datetime import date, datetime
+
+from dateutil.relativedelta import MO, TU, WE, TH, FR, SA, SU
+from django.test import TestCase, tag
+
+from ..helper_classes import HolidayCalendar
+
+
+@tag('calendar')
+class TestHolidayCalendar(TestCase):
+
+    def setUp(self):
+        # 2021-04-02 Good Friday, 2021-04-05 Easter Monday.
+        self.calendar = HolidayCalendar(
+            holidays=[date(2021, 4, 2), date(2021, 4, 5)],
+            definitions={
+                '7-day clinic': dict(days=[MO, TU, WE, TH, FR, SA, SU]),
+                '5-day clinic': dict(days=[MO, TU, WE, TH, FR])})
+
+    def test_is_holiday(self):
+        self.assertTrue(self.calendar.is_holiday(date(2021, 4, 2)))
+        self.assertFalse(self.calendar.is_holiday(date(2021, 4, 1)))
+
+    def test_next_clinic_day(self):
+        self.assertEqual(
+            self.calendar.next_clinic_day(date(2021, 4, 2)),
+            date(2021, 4, 6))
+        self.assertEqual(
+            self.calendar.next_clinic_day(date(2021, 4, 2), forward=False),
+            date(2021, 4, 1))
+        self.assertEqual(
+            self.calendar.next_clinic_day(
+                date(2021, 4, 3), facility_name='7-day clinic'),
+            date(2021, 4, 3))
+        self.assertEqual(
+            self.calendar.next_clinic_day(datetime(2021, 4, 5, 9, 30)),
+            datetime(2021, 4, 6, 9, 30))
+
+    def test_business_days_between(self):
+        self.assertEqual(self.calendar.business_days_between(
+            date(2021, 3, 29), date(2021, 4, 12)), 8)
+        self.assertEqual(self.calendar.business_days_between(
+            date(2021, 3, 29), date(2021, 4, 12),
+            facility_name='7-day clinic'), 12)
+        self.assertEqual(self.calendar.business_days_between(
+            date(2021, 4, 12), date(2021, 3, 29)), 0)
@@ -0,0 +1,42 @@
+import uuid
+from decimal import Decimal
+
+from django.db import models
+from django.test import TestCase, tag
+
+from ..exports import ColumnPlan, ModelExporter
+from ..models import CaregiverOffStudy
+
+
+@tag('export')
+class TestModelExporter(TestCase):
+
+    def test_column_plan_uses_concrete_fields(self):
+        column_plan = ColumnPlan(CaregiverOffStudy)
+        self.assertIn('subject_identifier', column_plan.columns)
+        self.assertIn('site_id', column_plan.columns)
+        self.assertNotIn('_state', column_plan.columns)
+
+    def test_column_plan_converts_uuids(self):
+        column_plan = ColumnPlan(CaregiverOffStudy)
+        values = [None] * len(column_plan.columns)
+        pk = uuid.uuid4()
+        values[column_plan.index('id')] = pk
+        self.assertEqual(
+            column_plan.convert(values)[column_plan.index('id')], str(pk))
+
+    def test_column_plan_keeps_decimals(self):
+        column_plan = ColumnPlan(CaregiverOffStudy)
+        self.assertIsNone(column_plan.get_converter(
+            models.DecimalField(max_digits=20, decimal_places=10)))
+        values = [None] * len(column_plan.columns)
+        values[column_plan.index('subject_identifier')] = Decimal(
+            '1234567890.0123456789')
+        self.assertEqual(
+            column_plan.convert(values)[column_plan.index('subject_identifier')],
+            Decimal('1234567890.0123456789'))
+
+    def test_empty_queryset_exports_header_only(self):
+        exporter = ModelExporter(CaregiverOffStudy.objects.none())
+        self.assertEqual(exporter.field_names[-1], 'dob')
+        self.assertEqual(list(exporter.rows()), [])
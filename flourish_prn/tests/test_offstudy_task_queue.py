@@ -0,0 +1,37 @@
+from dateutil.relativedelta import relativedelta
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow
+
+from ..constants import QUEUED, REMOVE_FU_NOTES, RUNNING
+from ..helper_classes import offstudy_task_queue
+from ..models import OffStudyTask
+
+
+@tag('os')
+class TestOffStudyTaskQueue(TestCase):
+
+    def make_task(self, **options):
+        return OffStudyTask.objects.create(
+            model='flourish_prn.childoffstudy',
+            subject_identifier='B142-040990001-2-10',
+            task=REMOVE_FU_NOTES,
+            **options)
+
+    def test_claims_due_task_once(self):
+        offstudy_task = self.make_task()
+        self.assertTrue(offstudy_task_queue.claim(offstudy_task))
+        self.assertFalse(offstudy_task_queue.claim(offstudy_task))
+
+    def test_task_not_due_is_not_claimed(self):
+        offstudy_task = self.make_task(
+            next_attempt_datetime=get_utcnow() + relativedelta(minutes=5))
+        self.assertFalse(offstudy_task_queue.claim(offstudy_task))
+
+    def test_reclaims_running_task_with_expired_lease(self):
+        stale = self.make_task(
+            status=RUNNING,
+            claimed_datetime=get_utcnow() - relativedelta(hours=1))
+        self.make_task(status=RUNNING, claimed_datetime=get_utcnow())
+        self.make_task(status=QUEUED)
+        self.assertEqual(offstudy_task_queue.claimable().count(), 2)
+        self.assertTrue(offstudy_task_queue.claim(stale))
@@ -0,0 +1,147 @@
+import json
+import os
+from contextlib import contextmanager
+
+from django.db import connection
+from django.db.models.signals import post_save
+from django.forms.models import model_to_dict
+from django.test import RequestFactory, TestCase, tag
+from django.test.utils import CaptureQueriesContext
+from model_mommy import mommy
+
+from ..admin_site import flourish_prn_admin
+from ..forms import CaregiverOffStudyForm, ChildOffStudyForm
+from ..models import CaregiverOffStudy, ChildOffStudy
+from .fixture_mixin import PrnFixtureMixin
+
+QUERY_COUNTS_FILE = os.path.join(
+    os.path.dirname(__file__), 'benchmark_query_counts.json')
+
+
+def load_query_counts():
+    with open(QUERY_COUNTS_FILE) as f:
+        return json.load(f)
+
+
+def save_query_count(name, queries):
+    query_counts = load_query_counts()
+    query_counts[name] = queries
+    with open(QUERY_COUNTS_FILE, 'w') as f:
+        json.dump(query_counts, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+@tag('benchmark')
+class TestPrnBenchmarks(PrnFixtureMixin, TestCase):
+    """ Query counts of the PRN save paths.
+
+    Each path must run exactly the number of queries recorded for it in
+    `benchmark_query_counts.json`, a path without a recorded count fails.
+    Record the counts again with FLOURISH_PRN_RECORD_QUERY_COUNTS=1 after
+    a change that is meant to alter them, and review the diff. Run alone
+    with `--tag benchmark`.
+    """
+
+    export_sizes = [100, 1000]
+
+    @contextmanager
+    def query_count(self, name):
+        if os.environ.get('FLOURISH_PRN_RECORD_QUERY_COUNTS'):
+            with CaptureQueriesContext(connection) as context:
+                yield
+            save_query_count(name, len(context.captured_queries))
+            return
+        queries = load_query_counts().get(name)
+        if queries is None:
+            self.fail(
+                f'No query count recorded for {name}, record it with '
+                f'FLOURISH_PRN_RECORD_QUERY_COUNTS=1.')
+        with self.assertNumQueries(queries):
+            yield
+
+    def test_save_offstudy(self):
+        with self.query_count('save caregiveroffstudy'):
+            mommy.make_recipe(
+                'flourish_prn.caregiveroffstudy',
+                subject_identifier=self.caregiver_subject_identifier)
+        with self.query_count('save childoffstudy'):
+            mommy.make_recipe(
+                'flourish_prn.childoffstudy',
+                subject_identifier=self.child_subject_identifier)
+
+    def test_save_death_reports(self):
+        with self.query_count('save caregiverdeathreport'):
+            mommy.make_recipe(
+                'flourish_prn.caregiverdeathreport',
+                subject_identifier=self.caregiver_subject_identifier)
+        with self.query_count('save childdeathreport'):
+            mommy.make_recipe(
+                'flourish_prn.childdeathreport',
+                subject_identifier=self.child_subject_identifier)
+
+    def test_save_other_prn(self):
+        with self.query_count('save tbreferaladol'):
+            mommy.make_recipe(
+                'flourish_prn.tbreferaladol',
+                subject_identifier=self.child_subject_identifier)
+        with self.query_count('save missedbirthvisit'):
+            mommy.make_recipe(
+                'flourish_prn.missedbirthvisit',
+                subject_identifier=self.child_subject_identifier)
+
+    def test_clean_forms(self):
+        for form_cls, model, subject_identifier in [
+                (CaregiverOffStudyForm, 'caregiveroffstudy',
+                 self.caregiver_subject_identifier),
+                (ChildOffStudyForm, 'childoffstudy',
+                 self.child_subject_identifier)]:
+            obj = mommy.prepare_recipe(
+                f'flourish_prn.{model}',
+                subject_identifier=subject_identifier)
+            form = form_cls(data=model_to_dict(obj))
+            with self.query_count(f'clean {model} form'):
+                form.is_valid()
+
+    def test_take_off_schedule(self):
+        offstudy = mommy.make_recipe(
+            'flourish_prn.caregiveroffstudy',
+            subject_identifier=self.caregiver_subject_identifier)
+        with self.query_count('take_off_schedule caregiveroffstudy'):
+            offstudy.take_off_schedule()
+
+    def test_post_save_signals(self):
+        offstudy = mommy.make_recipe(
+            'flourish_prn.childoffstudy',
+            subject_identifier=self.child_subject_identifier)
+        with self.query_count('post_save childoffstudy'):
+            post_save.send(
+                sender=ChildOffStudy, instance=offstudy, created=False,
+                raw=False, using='default', update_fields=None)
+
+    def assertExportQueries(self, sizes):
+        """ Asserts that exporting runs the same number of queries
+            whatever the number of rows.
+        """
+        modeladmin = flourish_prn_admin._registry[CaregiverOffStudy]
+        request = RequestFactory().get('/')
+        exported = 0
+        counts = {}
+        for size in sizes:
+            CaregiverOffStudy.objects.bulk_create(mommy.prepare_recipe(
+                'flourish_prn.caregiveroffstudy', _quantity=size - exported))
+            exported = size
+            with self.query_count('export_as_csv'), \
+                    CaptureQueriesContext(connection) as context:
+                response = modeladmin.export_as_csv(
+                    request, CaregiverOffStudy.objects.all())
+            counts[size] = len(context.captured_queries)
+            self.assertTrue(response.content)
+        self.assertEqual(
+            len(set(counts.values())), 1, f'Export queries by size: {counts}')
+
+    def test_export_as_csv(self):
+        self.assertExportQueries(self.export_sizes)
+
+    @tag('slow')
+    def test_export_as_csv_10000_rows(self):
+        self.assertExportQueries([10000])
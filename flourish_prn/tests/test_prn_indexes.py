@@ -0,0 +1,57 @@
+from django.apps import apps as django_apps
+from django.test import TestCase, tag
+
+
+@tag('indexes')
+class TestPrnIndexes(TestCase):
+    """ Checks that the PRN subject lookups are planned on an index.
+
+    Action item and schedule history tables belong to other apps, their
+    lookups rely on the indexes those apps declare.
+    """
+
+    subject_identifier = 'B142-040990001-6'
+
+    hot_lookups = {
+        'flourish_prn.caregiverdeathreport': 'prn_cgdeath_subj_rdt_idx',
+        'flourish_prn.childdeathreport': 'prn_chdeath_subj_rdt_idx',
+        'flourish_prn.tbreferaladol': 'prn_tbref_subj_rdt_idx',
+        'flourish_prn.missedbirthvisit': 'prn_missedbv_subj_rdt_idx',
+        'flourish_prn.tbadoloffstudy': 'prn_tboff_subj_rdt_idx',
+        'flourish_prn.historicalcaregiveroffstudy': 'prn_h_cgoff_subj_rdt_idx',
+        'flourish_prn.historicalchildoffstudy': 'prn_h_choff_subj_rdt_idx',
+        'flourish_prn.historicalcaregiverdeathreport':
+            'prn_h_cgdeath_subj_rdt_idx',
+        'flourish_prn.historicalchilddeathreport':
+            'prn_h_chdeath_subj_rdt_idx',
+        'flourish_prn.historicaltbadoloffstudy': 'prn_h_tboff_subj_rdt_idx',
+    }
+
+    def assertUsesIndex(self, plan, index_name=None):
+        if index_name:
+            self.assertIn(index_name, plan)
+        else:
+            self.assertRegex(plan, r'USING (COVERING )?INDEX')
+
+    def test_latest_by_subject_uses_composite_index(self):
+        for model, index_name in self.hot_lookups.items():
+            with self.subTest(model=model):
+                model_cls = django_apps.get_model(model)
+                plan = model_cls.objects.filter(
+                    subject_identifier=self.subject_identifier).order_by(
+                        '-report_datetime').explain()
+                self.assertUsesIndex(plan, index_name)
+
+    def test_action_items_by_subject_use_an_index(self):
+        action_item_cls = django_apps.get_model('edc_action_item.actionitem')
+        plan = action_item_cls.objects.filter(
+            subject_identifier=self.subject_identifier).explain()
+        self.assertUsesIndex(plan)
+
+    def test_schedule_history_by_subject_uses_an_index(self):
+        history_cls = django_apps.get_model(
+            'edc_visit_schedule.subjectschedulehistory')
+        plan = history_cls.objects.filter(
+            subject_identifier=self.subject_identifier,
+            schedule_name='b_enrol1_schedule1').explain()
+        self.assertUsesIndex(plan)
@@ -0,0 +1,90 @@
+from django.contrib.auth.models import AnonymousUser, User
+from django.test import RequestFactory, TestCase, override_settings, tag
+from model_mommy import mommy
+
+from ..metrics import (
+    CONSENT_VERSION_PHASE, SAVE_PHASE, MetricsRegistry, save_metrics,
+    threshold)
+from ..views import save_metrics_view
+from .fixture_mixin import PrnFixtureMixin
+
+
+@tag('metrics')
+class TestSaveMetrics(PrnFixtureMixin, TestCase):
+
+    def setUp(self):
+        save_metrics.reset()
+
+    def test_render_prometheus(self):
+        registry = MetricsRegistry()
+        registry.record('save', 'flourish_prn.caregiveroffstudy', 0.5, 10)
+        registry.record('save', 'flourish_prn.caregiveroffstudy', 1.5, 20)
+        text = registry.render_prometheus()
+        labels = '{model="flourish_prn.caregiveroffstudy",phase="save"}'
+        self.assertIn(f'flourish_prn_save_phase_calls_total{labels} 2', text)
+        self.assertIn(
+            f'flourish_prn_save_phase_seconds_total{labels} 2.0', text)
+        self.assertIn(f'flourish_prn_save_phase_seconds_max{labels} 1.5', text)
+        self.assertIn(
+            f'flourish_prn_save_phase_queries_total{labels} 30', text)
+        self.assertIn(
+            '# TYPE flourish_prn_save_phase_seconds_max gauge', text)
+
+    def test_save_records_duration_and_queries(self):
+        mommy.make_recipe(
+            'flourish_prn.caregiveroffstudy',
+            subject_identifier=self.caregiver_subject_identifier)
+        metrics = save_metrics.snapshot()
+        for phase in [SAVE_PHASE, CONSENT_VERSION_PHASE]:
+            with self.subTest(phase=phase):
+                calls, seconds, max_seconds, queries = metrics[
+                    (phase, 'flourish_prn.caregiveroffstudy')]
+                self.assertEqual(calls, 1)
+                self.assertGreater(seconds, 0)
+                self.assertEqual(max_seconds, seconds)
+                self.assertGreater(queries, 0)
+        self.assertGreater(
+            metrics[(SAVE_PHASE, 'flourish_prn.caregiveroffstudy')][3],
+            metrics[(CONSENT_VERSION_PHASE,
+                     'flourish_prn.caregiveroffstudy')][3])
+
+    @override_settings(FLOURISH_PRN_SAVE_PHASE_THRESHOLDS={SAVE_PHASE: 5.0})
+    def test_threshold_setting(self):
+        self.assertEqual(threshold(SAVE_PHASE), 5.0)
+        self.assertEqual(threshold(CONSENT_VERSION_PHASE), 0.2)
+
+
+@tag('metrics')
+class TestSaveMetricsView(TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def get(self, user=None, **extra):
+        request = self.factory.get('/metrics/', **extra)
+        request.user = user or AnonymousUser()
+        return save_metrics_view(request)
+
+    def test_anonymous_forbidden(self):
+        self.assertEqual(self.get(REMOTE_ADDR='127.0.0.1').status_code, 403)
+
+    def test_non_staff_forbidden(self):
+        user = User.objects.create_user('clerk')
+        self.assertEqual(self.get(user=user).status_code, 403)
+
+    def test_staff_allowed(self):
+        user = User.objects.create_user('admin', is_staff=True)
+        response = self.get(user=user)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+
+    @override_settings(FLOURISH_PRN_METRICS_TOKEN='secret')
+    def test_token(self):
+        self.assertEqual(
+            self.get(HTTP_AUTHORIZATION='Bearer secret').status_code, 200)
+        self.assertEqual(
+            self.get(HTTP_AUTHORIZATION='Bearer wrong').status_code, 403)
+
+    def test_token_not_set(self):
+        self.assertEqual(
+            self.get(HTTP_AUTHORIZATION='Bearer ').status_code, 403)
@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase, tag
+
+from ..helper_classes import ScheduleIndex
+
+
+class SiteVisitSchedules:
+
+    def __init__(self):
+        self.registry = {}
+        self.lookups = 0
+
+    def register(self, name, schedule):
+        self.registry[name] = SimpleNamespace(
+            name=name, schedules={schedule.name: schedule})
+
+    def get_by_onschedule_model_schedule_name(self, onschedule_model, name):
+        self.lookups += 1
+        return None, None
+
+
+@tag('os')
+class TestScheduleIndex(SimpleTestCase):
+
+    onschedule_model = 'flourish_caregiver.onschedulecohortbenrollment'
+
+    def setUp(self):
+        self.site_visit_schedules = SiteVisitSchedules()
+        self.schedule = SimpleNamespace(
+            name='b_enrol1_schedule1', onschedule_model=self.onschedule_model)
+        self.site_visit_schedules.register('visit_schedule1', self.schedule)
+        self.schedule_index = ScheduleIndex(self.site_visit_schedules)
+
+    def test_builds_on_first_lookup_only(self):
+        _, schedule = self.schedule_index.get_by_onschedule_model_schedule_name(
+            self.onschedule_model, 'b_enrol1_schedule1')
+        self.assertIs(schedule, self.schedule)
+        self.site_visit_schedules.registry.clear()
+        _, schedule = self.schedule_index.get_by_onschedule_model_schedule_name(
+            self.onschedule_model, 'b_enrol1_schedule1')
+        self.assertIs(schedule, self.schedule)
+        self.assertEqual(self.site_visit_schedules.lookups, 0)
+
+    def test_invalidate_picks_up_replaced_schedule(self):
+        self.schedule_index.build()
+        replacement = SimpleNamespace(
+            name='b_enrol1_schedule1', onschedule_model=self.onschedule_model)
+        self.site_visit_schedules.register('visit_schedule1', replacement)
+        self.schedule_index.invalidate()
+        _, schedule = self.schedule_index.get_by_onschedule_model_schedule_name(
+            self.onschedule_model, 'b_enrol1_schedule1')
+        self.assertIs(schedule, replacement)
+
+    def test_missing_schedule_falls_back_to_registry(self):
+        self.schedule_index.get_by_onschedule_model_schedule_name(
+            self.onschedule_model, 'a_enrol1_schedule1')
+        self.assertEqual(self.site_visit_schedules.lookups, 1)
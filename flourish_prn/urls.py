@@ -4,11 +4,13 @@ from django.urls.conf import path
 from django.views.generic.base import RedirectView
 
 from .admin_site import flourish_prn_admin
+from .views import save_metrics_view
 
 app_name = 'flourish_prn'
 
 urlpatterns = [
     path('admin/', flourish_prn_admin.urls),
+    path('metrics/', save_metrics_view, name='save_metrics'),
     path('', RedirectView.as_view(url='admin/'), name='home_url'),
 ]
 
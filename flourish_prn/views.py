@@ -0,0 +1,30 @@
+import hmac
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+
+from .metrics import save_metrics
+
+
+def has_metrics_access(request):
+    """ Returns True for a staff user, or a scraper sending
+        `Authorization: Bearer <settings.FLOURISH_PRN_METRICS_TOKEN>`.
+    """
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_active and user.is_staff:
+        return True
+    token = getattr(settings, 'FLOURISH_PRN_METRICS_TOKEN', None)
+    authorization = request.META.get('HTTP_AUTHORIZATION', '')
+    return bool(token) and hmac.compare_digest(
+        authorization.encode(), f'Bearer {token}'.encode())
+
+
+def save_metrics_view(request):
+    """ Returns the PRN save phase metrics of this process in the
+        Prometheus text format.
+    """
+    if not has_metrics_access(request):
+        return HttpResponseForbidden()
+    return HttpResponse(
+        save_metrics.render_prometheus(),
+        content_type='text/plain; version=0.0.4; charset=utf-8')
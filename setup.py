@@ -22,6 +22,15 @@ setup(
     description='flourish prn.',
     long_description=README,
     zip_safe=False,
+    install_requires=[
+        'django-q',
+        'XlsxWriter',
+        'xlwt',
+    ],
+    extras_require={
+        'parquet': ['pyarrow'],
+        'synthetic': ['model_mommy'],
+    },
     keywords='django flourish',
     classifiers=[
         'Environment :: Web Environment',